@@ -0,0 +1,150 @@
+"""AI provider routing: hedged requests, failover and latency preference.
+
+    python -m benchmarks.bench_ai_router
+    python -m benchmarks.bench_ai_router --queries 80
+
+Every provider is a fake Ollama server (see benchmarks/fake_ollama.py), so
+latency and failures are under control:
+
+  tail     a fast local model that stalls --stall seconds on 5% of
+           questions, plus a slower backup: single provider, routed
+           without hedging, routed with hedging
+  outage   the preferred provider starts failing partway through and comes
+           back later: how many requests still hit it, and whether the
+           answers kept coming
+  prefer   a slow and a fast provider, slow one listed first: where the
+           answers end up coming from
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+from collections import Counter
+
+from benchmarks.fake_ollama import FakeOllama
+from modules.ai_assistant import AIAssistant
+
+QUESTION = "how far is the moon"
+
+
+def _assistant(servers, routing):
+    config = {'ai': {
+        'providers': [
+            {'provider': 'ollama', 'name': name, 'model': 'fake', 'api_url': server.url + '/api/generate'}
+            for name, server in servers
+        ],
+        'warm': {'enabled': False},
+        'memory': {'enabled': False},
+        'routing': routing,
+    }}
+    with contextlib.redirect_stdout(io.StringIO()):
+        return AIAssistant(config)
+
+
+def _ask(assistant, count, question=QUESTION):
+    latencies, errors = [], 0
+    for index in range(count):
+        start = time.perf_counter()
+        reply = assistant.process_query(f"{question} {index}")
+        latencies.append(time.perf_counter() - start)
+        if not reply.startswith("You asked"):
+            errors += 1
+    return latencies, errors
+
+
+def _percentile(values, share):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))]
+
+
+def _wins(assistant, before=None):
+    from modules.ai_router import LLM_WINS
+    counts = Counter({name: LLM_WINS.labels(name).value for name in (p.name for p in assistant.providers)})
+    if before:
+        counts.subtract(before)
+    return counts
+
+
+def tail(queries, stall):
+    print(f"\ntail: local stalls {stall:.1f}s on 5% of questions, backup ~0.15 s")
+    print("Setup                 p50       p95       max     answered by")
+    setups = [
+        ('local only', ['local'], {}),
+        ('routed, no hedging', ['local', 'backup'], {'hedge': False}),
+        ('routed, hedged', ['local', 'backup'], {}),
+    ]
+    for label, names, routing in setups:
+        local = FakeOllama(prompt_ms=0.5, token_ms=2.0, stall_s=stall, stall_rate=0.05, seed=1).start()
+        backup = FakeOllama(prompt_ms=0.5, token_ms=12.0).start()
+        servers = [(name, {'local': local, 'backup': backup}[name]) for name in names]
+        assistant = _assistant(servers, routing)
+        before = _wins(assistant)
+        latencies, errors = _ask(assistant, queries)
+        wins = _wins(assistant, before)
+        assistant.stop()
+        local.stop()
+        backup.stop()
+        assert errors == 0
+        share = ', '.join(f"{name} {count:.0f}" for name, count in wins.items())
+        print(f"{label:<20} {_percentile(latencies, 0.5) * 1e3:>6.0f} ms {_percentile(latencies, 0.95) * 1e3:>6.0f} ms"
+              f" {max(latencies) * 1e3:>6.0f} ms   {share}")
+
+
+def outage(queries):
+    third = max(4, queries // 3)
+    print(f"\noutage: preferred provider fails for questions {third + 1}-{2 * third}, cooldown 1 s")
+    main = FakeOllama(prompt_ms=0.5, token_ms=2.0).start()
+    backup = FakeOllama(prompt_ms=0.5, token_ms=8.0).start()
+    assistant = _assistant([('main', main), ('backup', backup)], {'failure_threshold': 3, 'cooldown_s': 1.0})
+
+    phases = []
+    for label, fail in (('before', None), ('outage', 500), ('after', None)):
+        main.fail_status = fail
+        if label == 'after':
+            time.sleep(1.1)  # let the breaker's cooldown run out
+        sent_before = len(main.requests) + main.rejected
+        before = _wins(assistant)
+        latencies, errors = _ask(assistant, third)
+        phases.append((label, len(main.requests) + main.rejected - sent_before, _wins(assistant, before),
+                       latencies, errors))
+    assistant.stop()
+    main.stop()
+    backup.stop()
+
+    print("Phase     questions   sent to main   answered by             errors   p95")
+    for label, sent, wins, latencies, errors in phases:
+        share = ', '.join(f"{name} {count:.0f}" for name, count in wins.items())
+        print(f"{label:<9} {third:>9}   {sent:>12}   {share:<22} {errors:>6}   {_percentile(latencies, 0.95) * 1e3:.0f} ms")
+    assert all(errors == 0 for *_, errors in phases)
+
+
+def prefer(queries):
+    print("\nprefer: 'slow' (~0.3 s) listed before 'fast' (~0.05 s)")
+    slow = FakeOllama(prompt_ms=0.5, token_ms=25.0).start()
+    fast = FakeOllama(prompt_ms=0.5, token_ms=4.0).start()
+    assistant = _assistant([('slow', slow), ('fast', fast)], {'hedge': False})
+    latencies, errors = _ask(assistant, queries)
+    wins = _wins(assistant)
+    assistant.stop()
+    slow.stop()
+    fast.stop()
+    assert errors == 0
+    share = ', '.join(f"{name} {count:.0f}" for name, count in wins.items())
+    print(f"answered by: {share}; mean {sum(latencies) / len(latencies) * 1e3:.0f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AI provider routing benchmark (fake Ollama servers)")
+    parser.add_argument('--queries', type=int, default=60)
+    parser.add_argument('--stall', type=float, default=2.0, help="local stall in the tail scenario, seconds")
+    args = parser.parse_args(argv)
+
+    tail(args.queries, args.stall)
+    outage(args.queries)
+    prefer(args.queries)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Benchmark capture decode paths and, with a camera attached, capture modes.
+
+    python -m benchmarks.bench_capture                   # decode paths only if no camera
+    python -m benchmarks.bench_capture --device 0 --seconds 3
+
+Decode paths are timed on synthetic frames: the old path (OpenCV converts
+to BGR, get_frame mirrors, the detector mirrors back and converts to RGB)
+against the direct path (one YUYV->RGB conversion, or a reduced-size JPEG
+decode). Live modes report the FPS each FOURCC/size/decode setting
+actually delivers and the host time per read.
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from gestures.camera_manager import WebcamSource, find_camera, list_cameras
+
+LIVE_MODES = [
+    # (fourcc, width, height, decode, decode_scale)
+    ('YUYV', 640, 480, 'opencv', 1),
+    ('YUYV', 640, 480, 'direct', 1),
+    ('MJPG', 640, 480, 'opencv', 1),
+    ('MJPG', 640, 480, 'direct', 1),
+    ('MJPG', 1280, 720, 'opencv', 1),
+    ('MJPG', 1280, 720, 'direct', 2),
+]
+
+
+def _time(function, count=200):
+    function()
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return (time.perf_counter() - start) / count
+
+
+def _synthetic_bgr(width, height):
+    """Smooth gradients plus mild noise, so JPEG sizes are camera-like"""
+    y, x = np.mgrid[0:height, 0:width]
+    frame = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=2)
+    noise = np.random.default_rng(0).integers(0, 16, frame.shape)
+    return (frame + noise).clip(0, 255).astype(np.uint8)
+
+
+def bench_decode_paths():
+    bgr = _synthetic_bgr(640, 480)
+    yuyv = cv2.cvtColor(bgr, cv2.COLOR_BGR2YUV_YUY2 if hasattr(cv2, 'COLOR_BGR2YUV_YUY2') else cv2.COLOR_BGR2YUV)
+    if yuyv.ndim == 3 and yuyv.shape[2] != 2:
+        # Older OpenCV without a packed 4:2:2 encoder: any 2-channel buffer times the same
+        yuyv = np.ascontiguousarray(yuyv[:, :, :2])
+    jpeg_small = cv2.imencode('.jpg', bgr, [cv2.IMWRITE_JPEG_QUALITY, 85])[1]
+    jpeg_large = cv2.imencode('.jpg', _synthetic_bgr(1280, 720), [cv2.IMWRITE_JPEG_QUALITY, 85])[1]
+
+    def old_path(convert):
+        frame = cv2.flip(convert(), 1)
+        return cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+
+    rows = [
+        ('YUYV 640x480  old', lambda: old_path(lambda: cv2.cvtColor(yuyv, cv2.COLOR_YUV2BGR_YUYV))),
+        ('YUYV 640x480  direct', lambda: cv2.cvtColor(yuyv, cv2.COLOR_YUV2RGB_YUYV)),
+        ('MJPG 640x480  old', lambda: old_path(lambda: cv2.imdecode(jpeg_small, cv2.IMREAD_COLOR))),
+        ('MJPG 640x480  direct', lambda: cv2.cvtColor(cv2.imdecode(jpeg_small, cv2.IMREAD_COLOR), cv2.COLOR_BGR2RGB)),
+        ('MJPG 1280x720 old', lambda: old_path(lambda: cv2.imdecode(jpeg_large, cv2.IMREAD_COLOR))),
+        ('MJPG 1280x720 direct/2', lambda: cv2.cvtColor(
+            cv2.imdecode(jpeg_large, cv2.IMREAD_REDUCED_COLOR_2), cv2.COLOR_BGR2RGB)),
+    ]
+    print("Decode path              us/frame   max FPS")
+    for name, function in rows:
+        seconds = _time(function)
+        print(f"{name:<24} {seconds * 1e6:>8.0f}  {1 / seconds:>8.0f}")
+
+
+def bench_live(device, seconds):
+    cameras = list_cameras()
+    target = find_camera(device, cameras)
+    if target is None or (isinstance(target, int) and target not in [camera['index'] for camera in cameras]):
+        print(f"No camera {device}: skipping live capture modes")
+        return
+    print(f"\nLive capture on camera {device} ({seconds:.0f} s per mode)")
+    print("Requested                 got                       FPS   read us")
+    for fourcc, width, height, decode, scale in LIVE_MODES:
+        config = {'formats': [fourcc], 'decode': decode, 'decode_scale': scale}
+        source = WebcamSource(device, width, height, 30, config)
+        with contextlib.redirect_stdout(io.StringIO()):
+            opened = source.open()
+        if not opened:
+            print(f"{fourcc} {width}x{height} {decode:<7} could not open")
+            continue
+        got = source.mode
+        for _ in range(5):  # let exposure and the driver settle
+            source.read()
+        frames = 0
+        read_time = 0.0
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            start = time.perf_counter()
+            frame = source.read()
+            read_time += time.perf_counter() - start
+            frames += frame is not None
+        source.release()
+        requested = f"{fourcc} {width}x{height} {decode}" + (f"/{scale}" if scale > 1 else "")
+        reported = f"{got[0]} {got[1]}x{got[2]} @ {got[3]:.0f}"
+        print(f"{requested:<25} {reported:<24} {frames / seconds:>5.1f}  {read_time / max(frames, 1) * 1e6:>8.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Capture decode/mode benchmark")
+    parser.add_argument('--device', default=0, help="camera index, path or name")
+    parser.add_argument('--seconds', type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    bench_decode_paths()
+    device = int(args.device) if str(args.device).isdigit() else args.device
+    bench_live(device, args.seconds)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
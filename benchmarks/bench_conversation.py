@@ -0,0 +1,109 @@
+"""Multi-turn chat latency against a fake Ollama server.
+
+    python -m benchmarks.bench_conversation
+    python -m benchmarks.bench_conversation --turns 80 --budget 1024
+
+Runs the same chat through AIAssistant (provider ollama) four ways:
+stateless (memory off, the old behaviour); a naive sliding window that drops
+the oldest exchange whenever the budget is exceeded; conversation memory
+sending the whole fitted history as the prompt; and memory continuing from
+Ollama's returned context. Reports per-turn latency and the prompt tokens
+the server had to evaluate (the rest came from its KV cache), and checks
+that later turns still see the first question.
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+from benchmarks.fake_ollama import FakeOllama
+from modules.ai_assistant import AIAssistant
+from modules.conversation import ConversationStore, estimate_tokens
+
+QUESTIONS = [
+    "My name is Sana and I am planning a trip to Skardu next month with two friends",
+    "What should I pack for the mountains at that time of year",
+    "How many days would you spend there",
+    "Is it better to fly or to drive along the Karakoram Highway",
+    "What about the food, anything we must try",
+    "Remind me where I said I was going",
+]
+
+
+
+class SlidingWindowStore(ConversationStore):
+    """Drops just enough old exchanges each turn: the prompt prefix changes every turn once full"""
+
+    def fit(self, conversation, system_prompt, query):
+        budget = self.max_tokens - estimate_tokens(system_prompt) - estimate_tokens(query)
+        changed = False
+        while conversation.turns and conversation.history_tokens() > budget:
+            del conversation.turns[:2]
+            changed = True
+        return changed
+
+
+MODES = [
+    ('stateless', {'enabled': False}, None),
+    ('sliding window', {'ollama_context': False}, SlidingWindowStore),
+    ('memory, full prompt', {'ollama_context': False}, None),
+    ('memory + context', {}, None),
+]
+
+
+def run(server, mode_config, store_class, turns, budget):
+    memory = dict(mode_config, max_context_tokens=budget)
+    config = {'ai': {
+        'provider': 'ollama',
+        'model': 'fake',
+        'api_url': server.url + '/api/generate',
+        'memory': memory,
+    }}
+    with contextlib.redirect_stdout(io.StringIO()):
+        assistant = AIAssistant(config)
+    if store_class:
+        assistant.memory = store_class(memory)
+        for provider in assistant.providers:
+            provider.memory = assistant.memory
+    server.cache = []
+    first = len(server.requests)
+    latencies = []
+    for turn in range(turns):
+        question = QUESTIONS[0] if turn == 0 else QUESTIONS[1 + (turn - 1) % (len(QUESTIONS) - 1)]
+        start = time.perf_counter()
+        reply = assistant.process_query(question)
+        latencies.append(time.perf_counter() - start)
+        assert reply.startswith("You asked"), reply
+    requests = server.requests[first:]
+    last = requests[-1]['body']
+    # What the model could see on the last turn: its prompt plus the context it continued
+    visible = ' '.join(server.vocabulary_words(last.get('context') or [])) + ' ' + last['prompt']
+    remembers = 'Skardu' in visible
+    evaluated = sum(request['evaluated'] for request in requests) / len(requests)
+    return sum(latencies) / len(latencies), max(latencies[1:] or latencies), evaluated, remembers
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conversation memory benchmark (fake Ollama)")
+    parser.add_argument('--turns', type=int, default=40)
+    parser.add_argument('--budget', type=int, default=512, help="max_context_tokens (small, so 40 turns compact a few times)")
+    parser.add_argument('--prompt-ms', type=float, default=3.0, help="fake prompt eval cost per token")
+    parser.add_argument('--token-ms', type=float, default=5.0, help="fake generation cost per token")
+    args = parser.parse_args(argv)
+
+    server = FakeOllama(prompt_ms=args.prompt_ms, token_ms=args.token_ms).start()
+    try:
+        print(f"{args.turns} turns, budget {args.budget} tokens, fake Ollama at {server.url}")
+        print("Mode                  mean/turn   worst   evaluated tokens/turn   remembers turn 1")
+        for name, mode_config, store_class in MODES:
+            mean, worst, evaluated, remembers = run(server, mode_config, store_class, args.turns, args.budget)
+            print(f"{name:<20} {mean * 1e3:>8.1f} ms {worst * 1e3:>6.0f} ms {evaluated:>14.1f}"
+                  f"          {'yes' if remembers else 'no'}")
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
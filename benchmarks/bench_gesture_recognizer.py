@@ -0,0 +1,96 @@
+"""Benchmark hand feature extraction and gesture recognition.
+
+    python -m benchmarks.bench_gesture_recognizer
+
+Builds synthetic hands with given finger curls, checks that poses, swipes
+and scrolls are recognized, and times the per-hand cost.
+"""
+import math
+import sys
+import time
+
+import numpy as np
+
+from gestures.gesture_recognizer import FINGER_JOINTS, GestureRecognizer, extract_features
+
+# Finger direction (degrees from straight up) and segment lengths in palm sizes
+_FINGER_ANGLES = (-55, -15, 0, 12, 25)
+_SEGMENT_LENGTHS = (0.45, 0.3, 0.25)
+_BASE_LENGTH = (0.35, 0.95, 1.0, 0.95, 0.85)
+
+
+def synthetic_hand(center_x, center_y, curls, size=0.12, aspect=4 / 3):
+    """(21, 3) landmarks for an upright hand; curls are 0 (straight) to 1 (folded) per finger"""
+    points = np.zeros((21, 3), dtype=np.float32)
+    wrist = np.array((center_x, center_y + size * 0.5, 0.0))
+    points[0] = wrist
+    for finger, joints in enumerate(FINGER_JOINTS):
+        angle = math.radians(_FINGER_ANGLES[finger])
+        direction = np.array((math.sin(angle), -math.cos(angle)))
+        position = wrist + np.array((*direction, 0.0)) * _BASE_LENGTH[finger] * size
+        points[joints[0]] = position
+        # Each joint bends by up to 100 degrees, folding away from the camera
+        bend = 0.0
+        for joint, length in zip(joints[1:], _SEGMENT_LENGTHS):
+            bend += math.radians(100) * curls[finger]
+            step = np.array((*(direction * math.cos(bend)), -math.sin(bend)))
+            position = position + step * length * size
+            points[joint] = position
+    points[:, 0] /= aspect
+    points[:, 2] /= aspect
+    return points
+
+
+POSES = {
+    'open_palm': (0.0, 0.0, 0.0, 0.0, 0.0),
+    'fist': (0.5, 1.0, 1.0, 1.0, 1.0),
+    'point': (0.5, 0.0, 1.0, 1.0, 1.0),
+    'two_fingers': (0.5, 0.0, 0.0, 1.0, 1.0),
+}
+
+
+def _run(recognizer, frames, fps=30.0):
+    events = []
+    for index, points in enumerate(frames):
+        events.extend(recognizer.update(0, points, index / fps))
+    return events
+
+
+def main(argv=None):
+    # Static poses
+    for pose, curls in POSES.items():
+        events = _run(GestureRecognizer(), [synthetic_hand(0.5, 0.5, curls)] * 5)
+        assert events == [('pose', {'hand': 0, 'pose': pose})], f"{pose}: {events}"
+    print("✅ Poses: " + ", ".join(POSES))
+
+    # Swipe: open palm moving right in the image is a swipe left on screen
+    frames = [synthetic_hand(0.3 + i * 0.03, 0.5, POSES['open_palm']) for i in range(12)]
+    swipes = [data['direction'] for event_type, data in _run(GestureRecognizer(), frames) if event_type == 'swipe']
+    assert swipes == ['left'], f"swipe: {swipes}"
+    print("✅ Swipe")
+
+    # Scroll: two fingers moving down
+    frames = [synthetic_hand(0.5, 0.3 + i * 0.01, POSES['two_fingers']) for i in range(30)]
+    steps = sum(data['steps'] for event_type, data in _run(GestureRecognizer(), frames) if event_type == 'scroll')
+    assert steps > 0, "scroll: no steps"
+    print(f"✅ Scroll ({steps} steps)")
+
+    # Timing
+    hand = synthetic_hand(0.5, 0.5, POSES['open_palm'])
+    count = 20000
+    start = time.perf_counter()
+    for _ in range(count):
+        extract_features(hand)
+    features_us = (time.perf_counter() - start) / count * 1e6
+
+    recognizer = GestureRecognizer()
+    start = time.perf_counter()
+    for index in range(count):
+        recognizer.update(0, hand, index / 30.0)
+    update_us = (time.perf_counter() - start) / count * 1e6
+    print(f"extract_features: {features_us:.1f} us/hand  recognizer.update: {update_us:.1f} us/hand")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Benchmark the gesture state machine on a landmark trace.
+
+    python -m benchmarks.bench_gesture_state                # synthetic one-hand, two-hand and noisy-pinch traces
+    python -m benchmarks.bench_gesture_state session.lmt    # recorded trace
+
+The synthetic run also asserts the emitted event sequence.
+"""
+import contextlib
+import io
+import sys
+
+import numpy as np
+
+from gestures.landmark_trace import LandmarkTrace, read_trace
+from gestures.replay import run_trace
+
+CYCLE_EVENTS = ['pinch_start', 'drag_start', 'drag_move', 'drag_end', 'pinch_start', 'click']
+TWO_HAND_EVENTS = ['resize_start', 'resize_move', 'resize_end']
+JITTER_EVENTS = ['pinch_start', 'click']
+PINCH_EVENTS = set(CYCLE_EVENTS + TWO_HAND_EVENTS)
+
+
+def _hand(index_x, index_y, pinch_gap):
+    """Rough open-hand pose with the index tip at (index_x, index_y)"""
+    points = np.zeros((21, 3), dtype=np.float32)
+    points[:, 0] = index_x
+    points[:, 1] = index_y + np.linspace(0.3, 0.0, 21)
+    points[8] = (index_x, index_y, 0.0)
+    points[4] = (index_x + pinch_gap, index_y, 0.0)
+    return points
+
+
+def synthesize_trace(cycles=100):
+    """Repeat a move / pinch-drag / release / pinch / release (click) / no-hand cycle"""
+    frames = []
+    for _ in range(cycles):
+        for i in range(30):
+            frames.append([_hand(0.3 + i * 0.002, 0.5, 0.2)])
+        for i in range(50):
+            frames.append([_hand(0.36 + i * 0.005, 0.5, 0.02)])
+        for i in range(10):
+            frames.append([_hand(0.61, 0.5, 0.2)])
+        for i in range(10):
+            frames.append([_hand(0.61, 0.5, 0.02)])
+        for i in range(10):
+            frames.append([_hand(0.61, 0.5, 0.2)])
+        for i in range(10):
+            frames.append([])
+    timestamps = np.arange(len(frames)) / 30.0
+    return LandmarkTrace(640, 480, timestamps, frames)
+
+
+def synthesize_two_hand_trace(cycles=100):
+    """Two hands pinch together, spread apart (resize), release, leave"""
+    frames = []
+    for _ in range(cycles):
+        for i in range(10):
+            frames.append([_hand(0.3, 0.5, 0.2), _hand(0.6, 0.5, 0.2)])
+        for i in range(30):
+            frames.append([_hand(0.3 - i * 0.003, 0.5, 0.02), _hand(0.6 + i * 0.003, 0.5, 0.02)])
+        for i in range(10):
+            frames.append([_hand(0.21, 0.5, 0.2), _hand(0.69, 0.5, 0.2)])
+        for i in range(10):
+            frames.append([])
+    timestamps = np.arange(len(frames)) / 30.0
+    return LandmarkTrace(640, 480, timestamps, frames)
+
+
+def synthesize_jitter_trace(cycles=100):
+    """A noisy pinch: the thumb-index gap wobbles around the engage threshold"""
+    palm = 0.135 / (4 / 3)  # _hand's palm size in x units at 4:3
+    open_gaps = [2.0] * 10
+    # Single-frame dips must not engage; once engaged, wobble below release holds
+    noisy_gaps = [0.3, 0.45, 0.3, 0.45, 0.2, 0.3] + [0.45, 0.25] * 10
+    frames = []
+    for _ in range(cycles):
+        for gap in open_gaps + noisy_gaps + open_gaps:
+            frames.append([_hand(0.5, 0.5, gap * palm)])
+    timestamps = np.arange(len(frames)) / 30.0
+    return LandmarkTrace(640, 480, timestamps, frames)
+
+
+def _event_sequence(events):
+    """Pinch/resize event types, with repeated moves collapsed"""
+    sequence = []
+    for event in events:
+        if event['type'] not in PINCH_EVENTS:
+            continue
+        if event['type'] in ('drag_move', 'resize_move') and sequence and sequence[-1] == event['type']:
+            continue
+        sequence.append(event['type'])
+    return sequence
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    synthetic = not argv
+    trace = synthesize_trace() if synthetic else read_trace(argv[0])
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        events, stats = run_trace(trace)
+
+    moves = sum(1 for event in events if event['type'] == 'cursor_move')
+    print(f"Frames: {stats['frames']}  time: {stats['duration_s'] * 1000:.1f} ms  "
+          f"throughput: {stats['fps']:.0f} frames/s")
+    print(f"Events: {len(events)} ({moves} cursor_move)")
+
+    if synthetic:
+        sequence = _event_sequence(events)
+        expected = CYCLE_EVENTS * (len(trace) // 120)
+        assert sequence == expected, f"unexpected event sequence: {sequence[:12]}"
+        print("✅ Event sequence matches")
+
+        two_hand = synthesize_two_hand_trace()
+        with contextlib.redirect_stdout(io.StringIO()):
+            events, stats = run_trace(two_hand)
+        print(f"Two hands: {stats['frames']} frames  time: {stats['duration_s'] * 1000:.1f} ms  "
+              f"throughput: {stats['fps']:.0f} frames/s")
+        sequence = _event_sequence(events)
+        expected = TWO_HAND_EVENTS * (len(two_hand) // 60)
+        assert sequence == expected, f"unexpected two-hand sequence: {sequence[:12]}"
+        print("✅ Two-hand event sequence matches")
+
+        jitter = synthesize_jitter_trace()
+        with contextlib.redirect_stdout(io.StringIO()):
+            events, _ = run_trace(jitter)
+        sequence = _event_sequence(events)
+        expected = JITTER_EVENTS * 100
+        assert sequence == expected, f"unexpected noisy-pinch sequence: {sequence[:12]}"
+        print("✅ Noisy pinch gives one click per pinch")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
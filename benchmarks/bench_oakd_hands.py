@@ -0,0 +1,131 @@
+"""Check the on-device OAK-D hand path against a fake depthai.
+
+    python -m benchmarks.bench_oakd_hands
+
+Replays the synthetic landmark trace from bench_gesture_state as the
+device's "hands" queue, runs it through CameraSystem + GestureController
+exactly like the live loop, and asserts the same pinch/drag/click events as
+feeding the trace straight into the state machine. Also reports the XLink
+bytes per frame against streaming 640x480 previews.
+
+A second run adds a pinching hand far behind the user plus a stereo depth
+map; the depth band must drop that hand and leave the events unchanged.
+"""
+import contextlib
+import io
+import sys
+import time
+
+import numpy as np
+
+from benchmarks import fake_depthai
+
+CONFIG = {
+    'camera': {
+        'use_oakd': True,
+        'width': 640,
+        'height': 480,
+        'oakd_hands': {
+            'enabled': True,
+            'palm_blob': 'palm_detection.blob',
+            'landmark_blob': 'hand_landmark.blob',
+            'preview': True,
+        },
+    },
+}
+DEPTH_CONFIG = {'enabled': True, 'width': 160, 'height': 90, 'min_mm': 300, 'max_mm': 1500}
+
+
+def _run(config, streams):
+    """Run all queued packets through the controller; returns (controller, events, frames, seconds)"""
+    from modules.gesture_controller import GestureController
+
+    fake_depthai.Device.streams = streams
+    events = []
+
+    def callback(event_type, data):
+        events.append({'type': event_type, 'data': data})
+
+    frames = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        controller = GestureController(1920, 1080, callback, config)
+        start = time.perf_counter()
+        while True:
+            frame = controller.camera.get_frame()
+            if not controller._process_frame(frame):
+                break
+            frames += 1
+        duration = time.perf_counter() - start
+        controller.stop()
+    return controller, events, frames, duration
+
+
+def _depth_map(width, height, crop_x, bands):
+    """uint16 depth map with (x0, x1, mm) vertical bands given in preview coordinates"""
+    depth = np.zeros((height, width), dtype=np.uint16)
+    for x0, x1, mm in bands:
+        col0 = int((0.5 + (x0 - 0.5) * crop_x) * width)
+        col1 = int((0.5 + (x1 - 0.5) * crop_x) * width)
+        depth[height // 4:, col0:col1] = mm
+    return depth
+
+
+def main(argv=None):
+    # Before anything imports gestures.camera, so it picks up the fake module
+    fake_depthai.install({})
+    from benchmarks.bench_gesture_state import CYCLE_EVENTS, _event_sequence, _hand, synthesize_trace
+    from gestures.oakd_hands import OakdHandDetector
+    from modules import gesture_controller
+
+    trace = synthesize_trace(cycles=20)
+    expected = CYCLE_EVENTS * (len(trace) // 120)
+    packets = [fake_depthai.encode_hands(hands) for hands in trace.frames]
+    preview = [fake_depthai.ImgFrame(np.zeros((120, 160, 3), dtype=np.uint8))] * len(packets)
+
+    controller, events, frames, duration = _run(CONFIG, {'hands': packets, 'preview': preview})
+    assert isinstance(controller.detector, OakdHandDetector), "on-device detector not selected"
+    device = fake_depthai.Device.last
+    assert sorted(device.stream_names) == ['hands', 'preview'], device.stream_names
+    for node in device.pipeline.nodes:
+        if node.kind == 'Script':
+            compile(node.settings['setScript'][0], 'oakd_hands_script', 'exec')
+    print("✅ Pipeline streams landmarks and a small preview only, no full-size RGB")
+
+    assert frames == len(trace), f"processed {frames} of {len(trace)} packets"
+    sequence = _event_sequence(events)
+    assert sequence == expected, f"unexpected event sequence: {sequence[:12]}"
+    print("✅ Event sequence matches the landmark trace")
+
+    hand_bytes = np.mean([len(packet.data) for packet in packets])
+    print(f"Frames: {frames}  host time: {duration / frames * 1e6:.1f} us/frame  "
+          f"XLink: {hand_bytes:.0f} B/frame landmarks + {160 * 120 * 3} B preview "
+          f"(vs {640 * 480 * 3} B RGB preview)")
+
+    # Depth: the user at 0.7 m, someone pinching at 2.5 m behind them
+    phantom = _hand(0.85, 0.5, 0.02)
+    packets = [fake_depthai.encode_hands(hands + [phantom]) for hands in trace.frames]
+    crop_x = (640 / 480) / (1920 / 1080)
+    depth = fake_depthai.ImgFrame(_depth_map(160, 90, crop_x, [(0.25, 0.7, 700), (0.8, 0.9, 2500)]))
+    config = {'camera': dict(CONFIG['camera'], oakd_depth=DEPTH_CONFIG)}
+    rejected_before = gesture_controller.DEPTH_REJECTED_HANDS.labels().value
+
+    controller, events, frames, duration = _run(
+        config, {'hands': packets, 'preview': preview, 'depth': [depth] * len(packets)}
+    )
+    assert 'depth' in fake_depthai.Device.last.stream_names, "no depth stream in the pipeline"
+    rejected = gesture_controller.DEPTH_REJECTED_HANDS.labels().value - rejected_before
+    assert rejected == len(trace), f"rejected {rejected} far hands in {len(trace)} frames"
+    sequence = _event_sequence(events)
+    assert sequence == expected, f"unexpected event sequence with depth: {sequence[:12]}"
+    assert any(state.metric is not None for state in controller.hand_tracker.states), "no 3D key points"
+    print(f"✅ Depth band dropped the far hand in every frame, 3D pinch gives the same events "
+          f"({duration / frames * 1e6:.1f} us/frame)")
+
+    roi = controller.depth_gate.roi(depth.getFrame())
+    assert roi and roi[0] < 0.25 and 0.7 < roi[2] < 0.8, f"unexpected depth ROI {roi}"
+    print(f"✅ Depth ROI for host inference: x {roi[0]:.2f}-{roi[2]:.2f}, y {roi[1]:.2f}-{roi[3]:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Cold-start cost of Ollama questions, with and without the model warmer.
+
+    python -m benchmarks.bench_ollama_warm
+    python -m benchmarks.bench_ollama_warm --load 5 --keep-alive 4
+
+Runs a fake Ollama server that takes --load seconds to load the model and
+unloads it --keep-alive seconds after the last request (a scaled-down
+version of a 5-20 s load and a minutes-long keep_alive). Questions go
+through CommandProcessor the way voice commands do:
+
+  startup  shortly after the mirror starts
+  idle     after a pause longer than keep_alive, someone still at the mirror
+  return   after the user was away long enough for the model to unload
+
+For each, the time to the first spoken response (the acknowledgement, if
+the model was not ready) and to the answer, how long the question
+waited for a model load, and how long process() held the calling (UI)
+thread. Answers arrive through a Qt event loop, as in the app.
+"""
+import argparse
+import contextlib
+import io
+import sys
+import time
+
+from PyQt6.QtCore import QCoreApplication
+
+from benchmarks.fake_ollama import FakeOllama
+from modules.ai_assistant import AIAssistant
+from modules.command_processor import CommandProcessor
+
+
+def run(app, server, warm, keep_alive, gap):
+    config = {'ai': {
+        'provider': 'ollama',
+        'model': 'fake',
+        'api_url': server.url + '/api/generate',
+        'keep_alive': f"{keep_alive}s",
+        'warm': {'enabled': warm},
+        'memory': {'enabled': False},
+    }}
+    server.loaded_until = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        assistant = AIAssistant(config)
+        processor = CommandProcessor(config, assistant)
+        responses = []
+        processor.response_signal.connect(lambda user, mirror: responses.append((time.perf_counter(), mirror)))
+        assistant.start()
+
+        results = []
+
+        def ask(name, question):
+            responses.clear()
+            first_request = len(server.requests)
+            start = time.perf_counter()
+            processor.process(question)
+            blocked = time.perf_counter() - start
+            while not responses or responses[-1][1] == "Thinking...":
+                app.processEvents()
+                time.sleep(0.001)
+            first = responses[0][0] - start
+            answer = responses[-1][0] - start
+            acked = len(responses) > 1
+            waited = sum(r['load_wait_s'] for r in server.requests[first_request:] if r['body'].get('prompt'))
+            results.append((name, first, answer, acked, waited, blocked, responses[-1][1]))
+
+        time.sleep(0.3)
+        ask('startup', "what is the capital of france")
+        time.sleep(keep_alive + gap)
+        ask('idle', "and of italy")
+        assistant.set_in_use(False)
+        time.sleep(keep_alive + gap)
+        assistant.set_in_use(True)
+        time.sleep(0.3)
+        ask('return', "what about spain")
+        assistant.stop()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ollama warm-up benchmark (fake Ollama)")
+    parser.add_argument('--load', type=float, default=2.0, help="fake model load time, seconds")
+    parser.add_argument('--keep-alive', type=float, default=2.0, help="keep_alive, seconds")
+    parser.add_argument('--gap', type=float, default=1.0, help="extra idle time beyond keep_alive, seconds")
+    args = parser.parse_args(argv)
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    server = FakeOllama(prompt_ms=1.0, token_ms=2.0, load_s=args.load).start()
+    try:
+        print(f"model load {args.load:.1f}s, keep_alive {args.keep_alive:.1f}s, fake Ollama at {server.url}")
+        print("Mode    question   first response   answer    acknowledged   load wait   UI blocked")
+        for mode, warm in (('cold', False), ('warm', True)):
+            for name, first, answer, acked, waited, blocked, reply in run(app, server, warm, args.keep_alive, args.gap):
+                assert reply.startswith("You asked"), reply
+                print(f"{mode:<7} {name:<9} {first * 1e3:>10.0f} ms {answer * 1e3:>9.0f} ms"
+                      f"   {'yes' if acked else 'no':<10} {waited * 1e3:>8.0f} ms {blocked * 1e3:>8.1f} ms")
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
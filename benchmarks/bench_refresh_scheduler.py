@@ -0,0 +1,65 @@
+"""Refresh scheduler check: every job runs once per interval.
+
+    python -m benchmarks.bench_refresh_scheduler
+    python -m benchmarks.bench_refresh_scheduler --seconds 10
+
+Registers jobs at a few intervals on a RefreshScheduler under Qt's
+offscreen platform, runs the event loop for --seconds, and compares how
+often each job ran with the number of interval boundaries that passed.
+Also reports the timer wakeups and the largest distance between a run and
+its boundary (runs may start up to the scheduler's slack early, to share a
+wakeup with another job). Exits with 1 if any job ran more or less often
+than expected.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+from ui.refresh_scheduler import RefreshScheduler
+
+INTERVALS_MS = (250, 500, 1000, 2000)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh scheduler check (offscreen Qt)")
+    parser.add_argument('--seconds', type=float, default=6.0)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    scheduler = RefreshScheduler()
+    runs = {interval: [] for interval in INTERVALS_MS}
+    for interval in INTERVALS_MS:
+        scheduler.register(lambda interval=interval: runs[interval].append(time.time()), interval)
+
+    wakeups = [0]
+    scheduler.timer.timeout.connect(lambda: wakeups.__setitem__(0, wakeups[0] + 1))
+
+    start = time.time()
+    QTimer.singleShot(int(args.seconds * 1000), app.quit)
+    app.exec()
+    end = time.time()
+
+    print(f"Qt platform: {app.platformName()}  {args.seconds:.1f}s, {wakeups[0]} timer wakeups")
+    print("Interval    runs   expected   max offset")
+    ok = True
+    for interval in INTERVALS_MS:
+        seconds = interval / 1000
+        expected = math.floor(end / seconds) - math.floor(start / seconds)
+        times = runs[interval]
+        offset = max((abs(t - round(t / seconds) * seconds) for t in times), default=0.0)
+        # A boundary right at the start or end may fall on either side
+        good = abs(len(times) - expected) <= 1
+        ok = ok and good
+        print(f"{interval:>6} ms {len(times):>7} {expected:>10} {offset * 1e3:>9.1f} ms  {'ok' if good else 'WRONG'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
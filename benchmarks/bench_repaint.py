@@ -0,0 +1,150 @@
+"""Repaint cost of the mirror UI under Qt's offscreen platform.
+
+    python -m benchmarks.bench_repaint
+    python -m benchmarks.bench_repaint --width 1920 --height 1080 --moves 300
+
+Builds the real UIManager with stub services and times, per cursor move
+and per drag move (a widget following the cursor), the update plus the
+paint it triggers, and a full-window repaint. Setups:
+
+    legacy   border-image stylesheet on the window, full-screen cursor updates
+    widgets  cached background pixmap, cursor dirty rectangles (default mode)
+    scene    ui.render_mode "scene": one QGraphicsScene with cached items
+"""
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import Qt, qInstallMessageHandler
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication
+
+SETUPS = ('legacy', 'widgets', 'scene')
+LEGACY_STYLESHEET = """
+    QMainWindow {
+        border-image: url(assets/background.png) 0 0 0 0 stretch stretch;
+    }
+"""
+
+
+class StubWeather:
+    def get_current_weather(self):
+        return {'temp': 21, 'city': 'Lahore', 'condition': 'Clear'}
+
+
+class StubNews:
+    def get_headlines(self):
+        return ["Benchmark headline"]
+
+
+class StubCalendar:
+    def get_events(self):
+        return [{'time': '09:00', 'title': 'Standup'}, {'time': '13:00', 'title': 'Lunch'}]
+
+
+def _build(width, height, setup):
+    from modules.ui_manager import UIManager
+
+    config = {'ui': {'render_mode': 'scene' if setup == 'scene' else 'widgets'}}
+    window = UIManager(width, height, StubWeather(), StubNews(), StubCalendar(), None, config=config)
+    # Drags change the layout; keep it out of the real widget_positions.json
+    window.layout_store.path = os.path.join(tempfile.mkdtemp(), 'widget_positions.json')
+    if setup == 'legacy':
+        background = window.central_widget
+        background.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
+        background.fill_color = QColor(0, 0, 0, 0)
+        background.set_image(None)
+        window.setStyleSheet(LEGACY_STYLESHEET)
+        # Every move repainted the whole full-screen overlay
+        window.cursor._repaint_cursor = window.cursor.update
+    window.setGeometry(0, 0, width, height)
+    window.show()
+    QApplication.processEvents()
+    return window
+
+
+def _positions(width, height, count):
+    """Cursor path: a circle around the screen centre, through the widgets"""
+    radius = min(width, height) * 0.35
+    for i in range(count):
+        angle = 2 * math.pi * i / 60
+        yield int(width / 2 + radius * math.cos(angle)), int(height / 2 + radius * math.sin(angle))
+
+
+def _time_moves(app, positions, move):
+    start = time.perf_counter()
+    count = 0
+    for x, y in positions:
+        move(x, y)
+        app.processEvents()
+        count += 1
+    return (time.perf_counter() - start) / count
+
+
+def bench(width, height, moves, setup):
+    app = QApplication.instance()
+    window = _build(width, height, setup)
+
+    move_seconds = _time_moves(app, _positions(width, height, moves), window.update_cursor_position)
+
+    # Drag the weather widget around a small circle, as a pinch-drag would
+    weather = window.widgets['weather']
+    grab_x, grab_y = weather.x() + 20, weather.y() + 20
+    window.update_cursor_position(grab_x, grab_y)
+    window.handle_pinch_start(grab_x, grab_y)
+
+    def drag(x, y):
+        window.update_cursor_position(x, y)
+        window.handle_drag_move(x, y, 0, 0)
+
+    drag_path = ((grab_x + int(200 * math.cos(i / 10)), grab_y + int(120 * math.sin(i / 10)))
+                 for i in range(moves))
+    drag_seconds = _time_moves(app, drag_path, drag)
+    window.handle_drag_end(grab_x, grab_y)
+
+    repaints = max(moves // 10, 5)
+    start = time.perf_counter()
+    for _ in range(repaints):
+        # The central widget covers the window; repainting it repaints everything
+        # (a graphics view paints the scene in its viewport, when that repaints)
+        window.central_widget.repaint()
+        if setup == 'scene':
+            window.central_widget.viewport().repaint()
+    full_seconds = (time.perf_counter() - start) / repaints
+
+    window.hide()
+    window.deleteLater()
+    app.processEvents()
+    return move_seconds, drag_seconds, full_seconds
+
+
+def _quiet_stylesheet_warnings(mode, context, message):
+    # The offscreen platform warns when embedded widgets are made top-level
+    if 'propagateSizeHints' not in message:
+        print(message, file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="UI repaint benchmark (offscreen Qt)")
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=1080)
+    parser.add_argument('--moves', type=int, default=300)
+    args = parser.parse_args(argv)
+
+    qInstallMessageHandler(_quiet_stylesheet_warnings)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    print(f"Qt platform: {app.platformName()}  window: {args.width}x{args.height}")
+    print("Setup     cursor move    drag move   full repaint")
+    for setup in SETUPS:
+        move_seconds, drag_seconds, full_seconds = bench(args.width, args.height, args.moves, setup)
+        print(f"{setup:<8} {move_seconds * 1e3:>9.2f} ms {drag_seconds * 1e3:>9.2f} ms {full_seconds * 1e3:>11.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Widget creation and restyle cost under Qt's offscreen platform.
+
+    python -m benchmarks.bench_theme
+    python -m benchmarks.bench_theme --count 100
+
+For every mirror widget class: the time to create, polish and lay out one
+instance, to re-polish its widget tree (what Qt does when a style-relevant
+state or property changes), and to deliver a hover enter/leave to each of
+its child widgets and repaint.
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtCore import QEvent, QPointF, qInstallMessageHandler
+from PyQt6.QtGui import QEnterEvent, QHoverEvent
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from benchmarks.bench_repaint import StubCalendar, StubNews, StubWeather, _quiet_stylesheet_warnings
+
+
+def _factories():
+    from ui.components.calendar_widget_qt import CalendarWidget
+    from ui.components.clock_widget_qt import ClockWidget
+    from ui.components.motivational_widget import MotivationalWidget
+    from ui.components.news_widget_qt import NewsWidget
+    from ui.components.notes_widget_qt import NotesWidget
+    from ui.components.perf_hud_widget import PerfHudWidget
+    from ui.components.response_widget import ResponseWidget
+    from ui.components.weather_widget_qt import WeatherWidget
+
+    return [
+        ('ClockWidget', ClockWidget),
+        ('WeatherWidget', lambda parent: WeatherWidget(StubWeather(), parent)),
+        ('CalendarWidget', lambda parent: CalendarWidget(StubCalendar(), parent)),
+        ('NewsWidget', lambda parent: NewsWidget(StubNews(), parent)),
+        ('NotesWidget', NotesWidget),
+        ('ResponseWidget', ResponseWidget),
+        ('MotivationalWidget', MotivationalWidget),
+        ('PerfHudWidget', PerfHudWidget),
+    ]
+
+
+def _tree(widget):
+    return [widget] + widget.findChildren(QWidget)
+
+
+def _repolish(widgets):
+    for widget in widgets:
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
+
+def _hover(widgets):
+    inside = QPointF(5, 5)
+    outside = QPointF(-1, -1)
+    for widget in widgets:
+        QApplication.sendEvent(widget, QEnterEvent(inside, inside, inside))
+        QApplication.sendEvent(widget, QHoverEvent(QEvent.Type.HoverEnter, inside, inside, outside))
+    for widget in widgets:
+        QApplication.sendEvent(widget, QEvent(QEvent.Type.Leave))
+        QApplication.sendEvent(widget, QHoverEvent(QEvent.Type.HoverLeave, outside, outside, inside))
+
+
+def bench(name, factory, count, container):
+    app = QApplication.instance()
+    created = []
+    start = time.perf_counter()
+    for _ in range(count):
+        widget = factory(container)
+        widget.show()
+        widget.ensurePolished()
+        for child in widget.findChildren(QWidget):
+            child.ensurePolished()
+        if widget.layout():
+            widget.layout().activate()
+        created.append(widget)
+    app.processEvents()
+    create_seconds = (time.perf_counter() - start) / count
+
+    trees = [_tree(widget) for widget in created]
+    start = time.perf_counter()
+    for tree in trees:
+        _repolish(tree)
+    app.processEvents()
+    restyle_seconds = (time.perf_counter() - start) / count
+
+    start = time.perf_counter()
+    for tree in trees:
+        _hover(tree)
+    app.processEvents()
+    hover_seconds = (time.perf_counter() - start) / count
+
+    for widget in created:
+        widget.hide()
+        widget.deleteLater()
+    app.processEvents()
+    return create_seconds, restyle_seconds, hover_seconds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Widget creation/restyle benchmark (offscreen Qt)")
+    parser.add_argument('--count', type=int, default=50, help="instances per widget class")
+    args = parser.parse_args(argv)
+
+    qInstallMessageHandler(_quiet_stylesheet_warnings)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    from ui.theme import install_theme
+    install_theme(app)
+
+    container = QWidget()
+    container.resize(1920, 1080)
+    container.show()
+
+    print(f"Qt platform: {app.platformName()}  {args.count} instances per class")
+    print("Widget              create    repolish   hover in/out")
+    totals = [0.0, 0.0, 0.0]
+    for name, factory in _factories():
+        results = bench(name, factory, args.count, container)
+        totals = [total + value for total, value in zip(totals, results)]
+        print(f"{name:<18} {results[0] * 1e3:>6.2f} ms {results[1] * 1e3:>7.2f} ms {results[2] * 1e3:>9.2f} ms")
+    print(f"{'All widgets':<18} {totals[0] * 1e3:>6.2f} ms {totals[1] * 1e3:>7.2f} ms {totals[2] * 1e3:>9.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
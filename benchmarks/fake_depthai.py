@@ -0,0 +1,166 @@
+"""Stand-in for the depthai module that replays recorded device queues.
+
+Only what CameraSystem and gestures/oakd_hands.py touch is provided: nodes
+accept any setter and link, the Device hands out queues filled from the
+recorded packets. Install it before gestures.camera is first imported:
+
+    streams = {'hands': [encode_hands(frame) for frame in trace.frames]}
+    install(streams)
+"""
+import marshal
+import sys
+import types
+from collections import defaultdict, deque
+
+import numpy as np
+
+
+def encode_hands(hands, scores=None):
+    """A "hands" packet as the device Script node sends it"""
+    hands = [np.asarray(points, dtype=np.float32).ravel().tolist() for points in hands]
+    scores = scores or [1.0] * len(hands)
+    return Buffer(marshal.dumps({'scores': scores, 'hands': hands}))
+
+
+class Buffer:
+    def __init__(self, data):
+        self.data = data
+
+    def getData(self):
+        return np.frombuffer(self.data, dtype=np.uint8)
+
+
+class ImgFrame:
+    class Type:
+        BGR888p = 'BGR888p'
+
+    def __init__(self, frame):
+        self.frame = frame
+
+    def getCvFrame(self):
+        return self.frame
+
+    def getFrame(self):
+        return self.frame
+
+
+class _Port:
+    def __init__(self, node, name):
+        self.node = node
+        self.name = name
+        self.links = []
+
+    def link(self, other):
+        self.links.append(other)
+        self.node.pipeline.links.append((self, other))
+
+    def __getattr__(self, name):
+        # initialConfig.setResize(...), input.setBlocking(...), ...
+        return lambda *args, **kwargs: None
+
+
+class _Node:
+    def __init__(self, pipeline, kind):
+        self.pipeline = pipeline
+        self.kind = getattr(kind, '__name__', kind)
+        self.settings = {}
+        self.inputs = _Ports(self)
+        self.outputs = _Ports(self)
+
+    def __getattr__(self, name):
+        if name.startswith('set'):
+            return lambda *args: self.settings.__setitem__(name, args)
+        port = _Port(self, name)
+        setattr(self, name, port)
+        return port
+
+
+class _Ports(defaultdict):
+    def __init__(self, node):
+        super().__init__()
+        self.node = node
+
+    def __missing__(self, name):
+        port = self[name] = _Port(self.node, name)
+        return port
+
+
+class Pipeline:
+    def __init__(self):
+        self.nodes = []
+        self.links = []
+
+    def create(self, kind):
+        node = _Node(self, kind)
+        self.nodes.append(node)
+        return node
+
+
+class Queue:
+    def __init__(self, packets):
+        self.packets = deque(packets)
+
+    def tryGet(self):
+        return self.packets.popleft() if self.packets else None
+
+    def get(self):
+        return self.packets.popleft()
+
+
+class StereoDepth:
+    PresetMode = types.SimpleNamespace(HIGH_DENSITY='HIGH_DENSITY', HIGH_ACCURACY='HIGH_ACCURACY')
+
+
+class CalibrationHandler:
+    """Pinhole intrinsics with a 69 degree horizontal field of view"""
+
+    def getCameraIntrinsics(self, socket, width, height):
+        focal = width / 2 / np.tan(np.radians(69) / 2)
+        return [[focal, 0.0, width / 2], [0.0, focal, height / 2], [0.0, 0.0, 1.0]]
+
+
+class Device:
+    streams = {}
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.stream_names = [
+            node.settings['setStreamName'][0] for node in pipeline.nodes
+            if node.kind == 'XLinkOut' and 'setStreamName' in node.settings
+        ]
+        self.closed = False
+        Device.last = self
+
+    def getOutputQueue(self, name, maxSize=4, blocking=False):
+        if name not in self.stream_names:
+            raise RuntimeError(f"Stream {name} is not in the pipeline")
+        return Queue(self.streams.get(name, []))
+
+    def readCalibration(self):
+        return CalibrationHandler()
+
+    def close(self):
+        self.closed = True
+
+
+def install(streams):
+    """Register a fake depthai whose Device replays the given {stream: packets}"""
+    module = types.ModuleType('depthai')
+    module.Pipeline = Pipeline
+    module.Device = Device
+    module.ImgFrame = ImgFrame
+    module.node = types.SimpleNamespace(
+        ColorCamera='ColorCamera', Script='Script', ImageManip='ImageManip',
+        NeuralNetwork='NeuralNetwork', XLinkOut='XLinkOut', MonoCamera='MonoCamera',
+        StereoDepth=StereoDepth,
+    )
+    module.ColorCameraProperties = types.SimpleNamespace(
+        ColorOrder=types.SimpleNamespace(RGB='RGB', BGR='BGR')
+    )
+    module.MonoCameraProperties = types.SimpleNamespace(
+        SensorResolution=types.SimpleNamespace(THE_400_P='THE_400_P')
+    )
+    module.CameraBoardSocket = types.SimpleNamespace(CAM_A='CAM_A', CAM_B='CAM_B', CAM_C='CAM_C')
+    Device.streams = streams
+    sys.modules['depthai'] = module
+    return module
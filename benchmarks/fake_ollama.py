@@ -0,0 +1,204 @@
+"""A local stand-in for an Ollama server, for benchmarks and checks.
+
+    server = FakeOllama(prompt_ms=0.5, token_ms=2.0).start()
+    ... point ai.api_url at server.url + '/api/generate' ...
+    server.stop()
+
+Models /api/generate with one KV-cache slot, like a single-user Ollama
+runner: the request's token sequence (its context ids, then the prompt's
+words) is compared with the sequence evaluated last time, and only the
+tokens after the common prefix cost prompt_ms each. Replies cost token_ms
+per generated word. The reply repeats the last user question, and the
+context returned is the whole sequence, so a caller that feeds it back
+continues where it left off. Every request is kept in .requests.
+
+Like Ollama, the model is loaded on the first request (load_s) and unloaded
+keep_alive after the last one (the request's keep_alive, default 5m),
+which also empties the KV cache. A request without a prompt only loads the
+model and restarts the timer. Replies are streamed one word per line
+unless the request says "stream": false.
+
+For failure tests, `fail_status` answers every request with that HTTP
+error, and `stall_s` delays the first token of a `stall_rate` share of
+requests.
+"""
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeOllama:
+    def __init__(self, prompt_ms=0.5, token_ms=2.0, reply_words=12, load_s=0.0,
+                 stall_s=0.0, stall_rate=1.0, seed=0, host='127.0.0.1', port=0):
+        self.prompt_ms = prompt_ms
+        self.stall_s = stall_s
+        self.stall_rate = stall_rate
+        self.random = random.Random(seed)
+        self.fail_status = None
+        self.rejected = 0  # requests answered with fail_status
+        self.load_s = load_s
+        self.loaded_until = None  # monotonic time the model unloads; None = not loaded
+        self.loads = 0
+        self.token_ms = token_ms
+        self.reply_words = reply_words
+        self.vocabulary = {}
+        self.cache = []  # token ids in the KV cache
+        self.requests = []
+        self.lock = threading.Lock()
+        self.load_lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def tokenize(self, text):
+        with self.lock:
+            return [self.vocabulary.setdefault(word, len(self.vocabulary)) for word in text.split()]
+
+    def vocabulary_words(self, tokens):
+        """Words for token ids (to see what a context holds)"""
+        with self.lock:
+            words = {token: word for word, token in self.vocabulary.items()}
+        return [words.get(token, '?') for token in tokens]
+
+    @property
+    def loaded(self):
+        with self.lock:
+            return self.loaded_until is not None and time.monotonic() < self.loaded_until
+
+    @staticmethod
+    def _keep_alive_seconds(value):
+        if isinstance(value, (int, float)):
+            return float('inf') if value < 0 else float(value)
+        match = re.fullmatch(r'(-?[\d.]+)(ms|s|m|h)?', str(value).strip())
+        if not match:
+            return 300.0
+        number = float(match.group(1))
+        if number < 0:
+            return float('inf')
+        return number * {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600, None: 1}[match.group(2)]
+
+    def _ensure_loaded(self, body):
+        """Load the model if it expired: (seconds loading, seconds waiting for any load)"""
+        start = time.perf_counter()
+        with self.load_lock:  # a request arriving mid-load waits for it, like Ollama
+            with self.lock:
+                load = self.loaded_until is None or time.monotonic() >= self.loaded_until
+                if load:
+                    self.cache = []
+                    self.loads += 1
+            if load:
+                time.sleep(self.load_s)
+            keep_alive = self._keep_alive_seconds(body.get('keep_alive', '5m'))
+            with self.lock:
+                self.loaded_until = time.monotonic() + keep_alive
+        return (self.load_s if load else 0.0), time.perf_counter() - start
+
+    def chunks(self, body):
+        """Streamed response chunks for an /api/generate body (sleeps as it goes)"""
+        start = time.perf_counter()
+        load_seconds, load_wait = self._ensure_loaded(body)
+        prompt = body.get('prompt', '')
+        if not prompt and not body.get('context'):
+            with self.lock:
+                self.requests.append({'body': body, 'evaluated': 0, 'load_s': load_seconds, 'load_wait_s': load_wait})
+            yield {'model': body.get('model'), 'response': '', 'done': True, 'done_reason': 'load',
+                   'load_duration': int(load_seconds * 1e9)}
+            return
+        sequence = list(body.get('context') or []) + self.tokenize(prompt)
+
+        with self.lock:
+            shared = 0
+            for cached, token in zip(self.cache, sequence):
+                if cached != token:
+                    break
+                shared += 1
+            evaluated = len(sequence) - shared
+
+            question = prompt.rsplit('User:', 1)[-1].split('\n')[0].strip()
+            words = f"You asked: {question}".split()[:self.reply_words]
+            reply_tokens = [self.vocabulary.setdefault(word, len(self.vocabulary)) for word in words]
+            sequence += reply_tokens
+            self.cache = sequence
+            self.requests.append({'body': body, 'evaluated': evaluated, 'load_s': load_seconds, 'load_wait_s': load_wait})
+            stall = self.stall_s if self.stall_s and self.random.random() < self.stall_rate else 0.0
+
+        time.sleep(evaluated * self.prompt_ms / 1000 + stall)
+        for index, word in enumerate(words):
+            time.sleep(self.token_ms / 1000)
+            yield {'model': body.get('model'), 'response': word if index == 0 else ' ' + word, 'done': False}
+        yield {
+            'model': body.get('model'),
+            'response': '',
+            'context': sequence,
+            'done': True,
+            'prompt_eval_count': evaluated,
+            'eval_count': len(reply_tokens),
+            'load_duration': int(load_seconds * 1e9),
+            'total_duration': int((time.perf_counter() - start) * 1e9),
+        }
+
+    def generate(self, body):
+        """Response dict for a non-streamed /api/generate body"""
+        parts = []
+        for chunk in self.chunks(body):
+            parts.append(chunk['response'])
+        return dict(chunk, response=''.join(parts))
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                if self.path != '/api/generate':
+                    self._reply(404, {'error': f'unknown path {self.path}'})
+                elif fake.fail_status:
+                    with fake.lock:
+                        fake.rejected += 1
+                    self._reply(fake.fail_status, {'error': 'injected failure'})
+                elif body.get('stream', True):
+                    self._stream(fake.chunks(body))
+                else:
+                    self._reply(200, fake.generate(body))
+
+            def _stream(self, chunks):
+                # HTTP/1.0: no length, the body ends when the connection closes
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/x-ndjson')
+                self.end_headers()
+                try:
+                    for chunk in chunks:
+                        self.wfile.write(json.dumps(chunk).encode() + b'\n')
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # the client gave up (e.g. a hedged request lost)
+
+            def _reply(self, status, data):
+                payload = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,127 @@
+"""Camera-to-screen cursor mapping and its calibration.
+
+Hand positions are normalized, mirrored camera coordinates (u = 1 - x,
+v = y, both 0..1). Without calibration the whole frame maps to the widget
+area. A calibration stores either an interaction zone (the camera
+rectangle that should cover the screen) or a homography for off-axis
+camera mounts; both end up as one precomputed 3x3 matrix.
+"""
+import cv2
+import numpy as np
+
+# Calibration targets as fractions of the widget area: TL, TR, BR, BL
+TARGETS = ((0.1, 0.1), (0.9, 0.1), (0.9, 0.9), (0.1, 0.9))
+# A homography's w at the frame corners, relative to w at the calibration
+# points, must stay above this: near 0 the mapping blows up
+MIN_CORNER_W = 0.2
+# map() falls back to the zone when |w| drops below this
+MIN_W = 1e-6
+FRAME_CORNERS = np.array([(0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)], dtype=np.float64)
+
+
+class CursorMapping:
+    """Maps (u, v) camera coordinates to screen pixels through one matrix"""
+
+    def __init__(self, calibration=None):
+        self.unit = np.eye(3)  # camera (u, v) -> unit square of the widget area
+        self.fallback_unit = np.eye(3)  # zone only, used where the homography's w is ~0
+        self.matrix = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+        self.fallback = self.matrix
+        self.bounds = (0, 0, 1, 1)
+        self.set_calibration(calibration)
+
+    def set_calibration(self, calibration):
+        """Use a calibration dict ({'zone': [u0, v0, u1, v1]} and/or {'homography': 3x3})"""
+        calibration = calibration or {}
+        if calibration.get('zone'):
+            u0, v0, u1, v1 = calibration['zone']
+            self.fallback_unit = np.array([
+                [1.0 / (u1 - u0), 0.0, -u0 / (u1 - u0)],
+                [0.0, 1.0 / (v1 - v0), -v0 / (v1 - v0)],
+                [0.0, 0.0, 1.0],
+            ])
+        else:
+            self.fallback_unit = np.eye(3)
+        if calibration.get('homography') and calibration.get('use_homography', True):
+            self.unit = np.array(calibration['homography'], dtype=np.float64)
+        else:
+            self.unit = self.fallback_unit
+        self._update()
+
+    def set_bounds(self, x, y, width, height):
+        self.bounds = (x, y, width, height)
+        self._update()
+
+    def _update(self):
+        x, y, width, height = self.bounds
+        to_screen = np.array([[width, 0.0, x], [0.0, height, y], [0.0, 0.0, 1.0]])
+        # Plain floats: map() runs per hand per frame
+        self.matrix = tuple(float(value) for value in (to_screen @ self.unit).ravel())
+        self.fallback = tuple(float(value) for value in (to_screen @ self.fallback_unit).ravel())
+
+    def map(self, u, v):
+        """Screen position for camera coordinates (not clamped)"""
+        m = self.matrix
+        w = m[6] * u + m[7] * v + m[8]
+        if abs(w) < MIN_W:
+            # On the homography's vanishing line: use the zone instead
+            m = self.fallback
+            w = m[6] * u + m[7] * v + m[8]
+        return (m[0] * u + m[1] * v + m[2]) / w, (m[3] * u + m[4] * v + m[5]) / w
+
+
+class Calibration:
+    """Collects one camera point per target and turns them into a calibration dict"""
+
+    def __init__(self):
+        self.points = []
+
+    @property
+    def target_index(self):
+        return len(self.points)
+
+    @property
+    def done(self):
+        return len(self.points) == len(TARGETS)
+
+    def add_point(self, u, v):
+        self.points.append((u, v))
+
+    def result(self):
+        """Zone (axis-aligned fit) and homography (exact fit), or None if the points are unusable"""
+        src = np.array(self.points, dtype=np.float32)
+        dst = np.array(TARGETS, dtype=np.float32)
+
+        # Zone: average left/right and top/bottom edges, extended from the
+        # targets' 10-90% span to the full screen
+        left = (src[0, 0] + src[3, 0]) / 2
+        right = (src[1, 0] + src[2, 0]) / 2
+        top = (src[0, 1] + src[1, 1]) / 2
+        bottom = (src[2, 1] + src[3, 1]) / 2
+        if right - left < 0.05 or bottom - top < 0.05 or not _is_convex(src):
+            print("Calibration failed: targets were not pointed at in order or too close together")
+            return None
+        margin_u = (right - left) * 0.1 / 0.8
+        margin_v = (bottom - top) * 0.1 / 0.8
+        zone = [left - margin_u, top - margin_v, right + margin_u, bottom + margin_v]
+        result = {'zone': [round(float(value), 4) for value in zone]}
+
+        homography = cv2.getPerspectiveTransform(src, dst).astype(np.float64)
+        # w must keep one sign and stay clear of 0 over the whole frame,
+        # or the cursor jumps across the screen near the vanishing line
+        reference = homography[2] @ (src.mean(axis=0).tolist() + [1.0])
+        corner_w = (FRAME_CORNERS @ homography[2]) / reference
+        if corner_w.min() < MIN_CORNER_W:
+            print("⚠️ Calibration: homography unstable over the camera frame, using the zone only")
+        else:
+            result['homography'] = [[round(float(value), 6) for value in row] for row in homography]
+        return result
+
+
+def _is_convex(points):
+    """True if the points form a convex quad in TL, TR, BR, BL order"""
+    edges = np.roll(points, -1, axis=0) - points
+    following = np.roll(edges, -1, axis=0)
+    cross = edges[:, 0] * following[:, 1] - edges[:, 1] * following[:, 0]
+    # v points down, so clockwise on screen is a positive cross product
+    return bool((cross > 0).all())
@@ -1,6 +1,9 @@
 import cv2
+import json
+import os
 import time
 import numpy as np
+from gestures.camera_manager import CameraPool
 
 try:
     import depthai as dai
@@ -8,30 +11,75 @@ try:
 except ImportError:
     DEPTHAI_AVAILABLE = False
 
+# ColorCamera's default THE_1080_P sensor frame; previews are centre crops of
+# it and aligned depth covers all of it
+OAKD_SENSOR_SIZE = (1920, 1080)
+DEPTH_STREAM = 'depth'
+
 class CameraSystem:
-    def __init__(self, use_oakd=False, width=640, height=480):
-        self.use_oakd = use_oakd and DEPTHAI_AVAILABLE
+    def __init__(self, use_oakd=False, width=640, height=480,
+                 replay_path=None, replay_realtime=True, replay_loop=False,
+                 record_path=None, oakd_hands=None, max_hands=2, oakd_depth=None,
+                 device=0, capture=None):
+        self.use_oakd = use_oakd and DEPTHAI_AVAILABLE and not replay_path
         self.width = width
         self.height = height
         self.cap = None
+        self.pool = None
         self.pipeline = None
         self.device = None
         self.q_rgb = None
 
-        if self.use_oakd:
+        # Hand detection on the OAK-D (see gestures/oakd_hands.py): landmarks
+        # come from q_hands, q_rgb is only the optional low-res preview
+        self.oakd_hands = oakd_hands or {}
+        self.on_device_hands = self.use_oakd and self.oakd_hands.get('enabled', False)
+        self.max_hands = max_hands
+        self.q_hands = None
+
+        # Webcam selection, mode negotiation and reconnects (gestures/camera_manager.py)
+        self.capture = capture or {}
+        self.selectors = self.capture.get('devices') or [device]
+        self.fps = self.capture.get('fps', 30)
+
+        # Stereo depth aligned to RGB (see gestures/depth.py)
+        self.oakd_depth = oakd_depth or {}
+        self.q_depth = None
+        self.depth_frame = None
+        self.depth_intrinsics = None
+        self.depth_crop = (1.0, 1.0)
+
+        # Replay / recorder state
+        self.replay_path = replay_path
+        self.replay_realtime = replay_realtime
+        self.replay_loop = replay_loop
+        self.finished = False
+        self.recorder = None
+
+        if self.replay_path:
+            self.init_replay()
+        elif self.on_device_hands:
+            self.init_oakd_hands()
+        elif self.use_oakd:
             self.init_oakd()
         else:
             self.init_webcam()
 
+        if record_path:
+            self.recorder = FrameRecorder(
+                record_path, self.fps, rgb=self.rgb, max_seconds=self.capture.get('record_max_s')
+            )
+
     def init_webcam(self):
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
-        if not self.cap.isOpened():
-            print("❌ ERROR: Could not open webcam (index 0)!")
-        else:
+        self.pool = CameraPool(self.selectors, self.width, self.height, self.fps, self.capture)
+        if self.pool.connected:
             print("✅ Webcam initialized successfully")
 
+    @property
+    def rgb(self):
+        """True when frames come out already in RGB order (capture.decode 'direct')"""
+        return bool(self.pool and self.pool.rgb)
+
     def init_oakd(self):
         self.pipeline = dai.Pipeline()
         cam_rgb = self.pipeline.create(dai.node.ColorCamera)
@@ -42,26 +90,291 @@ class CameraSystem:
         xout_rgb = self.pipeline.create(dai.node.XLinkOut)
         xout_rgb.setStreamName("rgb")
         cam_rgb.preview.link(xout_rgb.input)
+        self._add_depth()
         
         self.device = dai.Device(self.pipeline)
         self.q_rgb = self.device.getOutputQueue(name="rgb", maxSize=4, blocking=False)
+        self._open_depth()
 
-    def get_frame(self):
-        if self.use_oakd:
-            in_rgb = self.q_rgb.tryGet()
-            if in_rgb is not None:
-                return in_rgb.getCvFrame()
+    def init_oakd_hands(self):
+        """OAK-D pipeline running palm detection and hand landmarks on the device"""
+        from gestures.oakd_hands import HANDS_STREAM, PREVIEW_STREAM, build_hand_pipeline
+
+        self.pipeline, has_preview = build_hand_pipeline(
+            dai, self.width, self.height, self.oakd_hands, self.max_hands
+        )
+        self._add_depth()
+        self.device = dai.Device(self.pipeline)
+        self.q_hands = self.device.getOutputQueue(name=HANDS_STREAM, maxSize=4, blocking=False)
+        if has_preview:
+            self.q_rgb = self.device.getOutputQueue(name=PREVIEW_STREAM, maxSize=1, blocking=False)
+        self._open_depth()
+        print("✅ OAK-D on-device hand tracking initialized")
+
+    def _add_depth(self):
+        """Add stereo depth, aligned to the RGB camera, to the OAK-D pipeline"""
+        if not self.oakd_depth.get('enabled', False):
+            return
+        mono_left = self.pipeline.create(dai.node.MonoCamera)
+        mono_right = self.pipeline.create(dai.node.MonoCamera)
+        for mono, socket in ((mono_left, dai.CameraBoardSocket.CAM_B), (mono_right, dai.CameraBoardSocket.CAM_C)):
+            mono.setResolution(dai.MonoCameraProperties.SensorResolution.THE_400_P)
+            mono.setBoardSocket(socket)
+            mono.setFps(self.oakd_depth.get('fps', 30))
+
+        stereo = self.pipeline.create(dai.node.StereoDepth)
+        stereo.setDefaultProfilePreset(dai.node.StereoDepth.PresetMode.HIGH_DENSITY)
+        stereo.setLeftRightCheck(True)
+        stereo.setDepthAlign(dai.CameraBoardSocket.CAM_A)
+        # Small depth map: the host only samples a few points and a bounding box
+        stereo.setOutputSize(self.oakd_depth.get('width', 320), self.oakd_depth.get('height', 180))
+        mono_left.out.link(stereo.left)
+        mono_right.out.link(stereo.right)
+
+        xout_depth = self.pipeline.create(dai.node.XLinkOut)
+        xout_depth.setStreamName(DEPTH_STREAM)
+        stereo.depth.link(xout_depth.input)
+
+    def _open_depth(self):
+        """Depth queue plus the intrinsics and crop needed to map landmarks into it"""
+        if not self.oakd_depth.get('enabled', False):
+            return
+        # Latest depth map only
+        self.q_depth = self.device.getOutputQueue(name=DEPTH_STREAM, maxSize=1, blocking=False)
+
+        sensor_width, sensor_height = OAKD_SENSOR_SIZE
+        calibration = self.device.readCalibration()
+        matrix = calibration.getCameraIntrinsics(dai.CameraBoardSocket.CAM_A, sensor_width, sensor_height)
+        self.depth_intrinsics = (
+            matrix[0][0] / sensor_width, matrix[1][1] / sensor_height,
+            matrix[0][2] / sensor_width, matrix[1][2] / sensor_height,
+        )
+        # The preview keeps its aspect ratio by cropping the sensor frame
+        sensor_aspect = sensor_width / sensor_height
+        preview_aspect = self.width / self.height
+        if preview_aspect < sensor_aspect:
+            self.depth_crop = (preview_aspect / sensor_aspect, 1.0)
+        else:
+            self.depth_crop = (1.0, sensor_aspect / preview_aspect)
+        print("✅ OAK-D stereo depth enabled")
+
+    def get_depth(self):
+        """Newest depth map (uint16 mm, 0 = unknown), or None without depth"""
+        if self.q_depth is None:
             return None
+        in_depth = self.q_depth.tryGet()
+        if in_depth is not None:
+            self.depth_frame = in_depth.getFrame()
+        return self.depth_frame
+
+    @property
+    def frame_shape(self):
+        """Shape of the full-size camera frame"""
+        return (self.height, self.width, 3)
+
+    def init_replay(self):
+        """Open a recorded session (.npz frame dump or video file)"""
+        self.replay_index = 0
+        self.replay_start = None
+        if self.replay_path.endswith('.npz'):
+            data = np.load(self.replay_path)
+            self.replay_frames = data['frames']
+            if 'timestamps' in data:
+                self.replay_timestamps = data['timestamps']
+            else:
+                self.replay_timestamps = np.arange(len(self.replay_frames)) / 30.0
         else:
-            ret, frame = self.cap.read()
-            if ret:
-                return cv2.flip(frame, 1) 
+            self.replay_frames = None
+            self.cap = cv2.VideoCapture(self.replay_path)
+            fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+            self.replay_frame_interval = 1.0 / fps
+        if self.replay_frames is None and not self.cap.isOpened():
+            print(f"❌ ERROR: Could not open replay file {self.replay_path}!")
+            self.finished = True
+        else:
+            print(f"✅ Replaying {self.replay_path}")
+
+    def _read_replay_frame(self):
+        """Return the next recorded frame, pacing it in real-time if requested"""
+        if self.finished:
             return None
 
+        if self.replay_frames is not None:
+            if self.replay_index >= len(self.replay_frames):
+                if not self.replay_loop:
+                    self.finished = True
+                    return None
+                self.replay_index = 0
+                self.replay_start = None
+            frame = self.replay_frames[self.replay_index]
+            offset = float(self.replay_timestamps[self.replay_index] - self.replay_timestamps[0])
+        else:
+            ret, frame = self.cap.read()
+            if not ret:
+                if not self.replay_loop:
+                    self.finished = True
+                    return None
+                self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                self.replay_index = 0
+                self.replay_start = None
+                ret, frame = self.cap.read()
+                if not ret:
+                    self.finished = True
+                    return None
+            offset = self.replay_index * self.replay_frame_interval
+
+        self.replay_index += 1
+
+        if self.replay_realtime:
+            now = time.monotonic()
+            if self.replay_start is None:
+                self.replay_start = now - offset
+            delay = self.replay_start + offset - now
+            if delay > 0:
+                time.sleep(delay)
+        return frame
+
+    def set_low_power(self, enabled, width=320, height=240, fps=5):
+        """Drop the webcam to a small, slow mode while nobody is around"""
+        if not self.pool:
+            return
+        if enabled:
+            self.pool.set_mode(width, height, fps)
+        else:
+            self.pool.set_mode(self.width, self.height, self.fps)
+
+    @property
+    def connected(self):
+        """False while every webcam is waiting to reconnect"""
+        return self.pool.connected if self.pool else True
+
+    def report_hands(self, count):
+        """Tell a multi-camera pool how many hands the last frame had"""
+        if self.pool:
+            self.pool.report_hands(count)
+
+    def get_frame(self):
+        """Next frame as the camera sees it (not mirrored), BGR unless rgb"""
+        if self.replay_path:
+            # Recordings are stored mirrored, like the mirror shows them
+            frame = self._read_replay_frame()
+            frame = cv2.flip(frame, 1) if frame is not None else None
+        elif self.use_oakd:
+            in_rgb = self.q_rgb.tryGet() if self.q_rgb is not None else None
+            frame = in_rgb.getCvFrame() if in_rgb is not None else None
+        else:
+            frame = self.pool.read()
+
+        if frame is not None and self.recorder:
+            self.recorder.write(frame)
+        return frame
+
     def release(self):
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
         if self.use_oakd:
             if self.device:
                 self.device.close()
         else:
+            if self.pool:
+                self.pool.release()
             if self.cap:
                 self.cap.release()
+
+
+class FrameRecorder:
+    """Record frames to a .npz dump (lossless, with timestamps) or a video file.
+
+    Frames are stored mirrored and in BGR order whatever the capture path.
+    For .npz the frames are streamed to a raw spool file next to the output
+    (path + '.part', with '.part.json' and '.ts.part' beside it) and packed
+    into the .npz at close(), so memory use stays flat however long the
+    recording runs. If the process dies first, finish(path) (or
+    `python -m gestures.replay recover`) packs what was spooled. With
+    max_seconds set, recording stops there with a warning.
+    """
+
+    def __init__(self, path, fps=30, rgb=False, max_seconds=None):
+        self.path = path
+        self.fps = fps
+        self.rgb = rgb
+        self.max_seconds = max_seconds
+        self.writer = None
+        self.spool = None
+        self.timestamps = None
+        self.shape = None
+        self.start_time = None
+        self.stopped = False
+
+    def write(self, frame):
+        if self.stopped:
+            return
+        now = time.monotonic()
+        if self.start_time is None:
+            self.start_time = now
+        elapsed = now - self.start_time
+        if self.max_seconds and elapsed > self.max_seconds:
+            print(f"⚠️ Recording stopped after {self.max_seconds:.0f}s (camera.record_max_s)")
+            self.stopped = True
+            return
+
+        frame = cv2.flip(frame, 1)
+        if self.rgb:
+            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        if self.path.endswith('.npz'):
+            self._spool(frame, elapsed)
+            return
+
+        if self.writer is None:
+            fourcc = cv2.VideoWriter_fourcc(*('mp4v' if self.path.endswith('.mp4') else 'MJPG'))
+            height, width = frame.shape[:2]
+            self.writer = cv2.VideoWriter(self.path, fourcc, self.fps, (width, height))
+        self.writer.write(frame)
+
+    def _spool(self, frame, elapsed):
+        if self.spool is None:
+            self.shape = frame.shape
+            with open(self.path + '.part.json', 'w') as f:
+                json.dump({'shape': list(frame.shape), 'dtype': str(frame.dtype), 'fps': self.fps}, f)
+            self.spool = open(self.path + '.part', 'wb')
+            self.timestamps = open(self.path + '.ts.part', 'wb')
+        elif frame.shape != self.shape:
+            # The camera came back in another mode: keep the recorded size
+            frame = cv2.resize(frame, (self.shape[1], self.shape[0]))
+        self.spool.write(np.ascontiguousarray(frame).tobytes())
+        self.timestamps.write(np.float64(elapsed).tobytes())
+
+    @staticmethod
+    def finish(path):
+        """Pack the spooled frames of path into the .npz; returns the frame count"""
+        with open(path + '.part.json', 'r') as f:
+            header = json.load(f)
+        shape = tuple(header['shape'])
+        dtype = np.dtype(header['dtype'])
+        timestamps = np.fromfile(path + '.ts.part', dtype=np.float64)
+        frame_bytes = int(np.prod(shape)) * dtype.itemsize
+        count = min(len(timestamps), os.path.getsize(path + '.part') // frame_bytes)
+        if count:
+            # Memory-mapped, so the frames are compressed without loading them all
+            frames = np.memmap(path + '.part', dtype=dtype, mode='r', shape=(count,) + shape)
+            np.savez_compressed(path, frames=frames, timestamps=timestamps[:count])
+            del frames
+        for suffix in ('.part', '.part.json', '.ts.part'):
+            os.remove(path + suffix)
+        return count
+
+    def close(self):
+        if self.start_time is None:
+            return
+        if self.writer is not None:
+            self.writer.release()
+            self.writer = None
+        elif self.spool is not None:
+            self.spool.close()
+            self.timestamps.close()
+            self.spool = None
+            self.timestamps = None
+            if not self.finish(self.path):
+                return
+        print(f"💾 Recorded session saved to {self.path}")
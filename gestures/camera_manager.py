@@ -0,0 +1,336 @@
+"""Webcam discovery, capture mode negotiation, reconnects and camera pools.
+
+List the cameras the mirror can see:
+    python -m gestures.camera_manager
+
+Cameras are selected by index (0), device path ('/dev/video2') or a
+substring of the device name ('C920'). Names are re-resolved on every
+reconnect, so a camera that comes back under a different index after a
+USB reset is found again.
+
+Capture settings (camera.* in config.json):
+    backend      'auto' (V4L2 on Linux, OpenCV's default elsewhere), 'v4l2'
+                 or 'any'; OpenCV's V4L2 backend streams from mmap buffers
+    buffer_size  driver buffers queued ahead of read(); 1 (default) means
+                 every read gets the newest frame instead of a stale one
+    decode       'opencv' (OpenCV converts every frame to BGR) or 'direct':
+                 raw YUYV goes to RGB in one conversion, MJPG is decoded by
+                 imdecode, optionally at 1/decode_scale size, then to RGB;
+                 frames are then RGB and inference skips its conversion
+
+A CameraPool holds one or more sources:
+    failover     read the first camera that delivers frames, in config
+                 order; switch back as soon as an earlier one recovers
+    follow_hand  stay on a camera while it sees hands, move to the next
+                 one after switch_after frames without any
+"""
+import glob
+import os
+import sys
+import time
+
+import cv2
+
+MODES = ('failover', 'follow_hand')
+DIRECT_FORMATS = ('YUYV', 'YUY2', 'MJPG')
+_REDUCED = {1: cv2.IMREAD_COLOR, 2: cv2.IMREAD_REDUCED_COLOR_2, 4: cv2.IMREAD_REDUCED_COLOR_4,
+            8: cv2.IMREAD_REDUCED_COLOR_8}
+
+
+def fourcc_code(name):
+    return cv2.VideoWriter_fourcc(*name)
+
+
+def fourcc_name(code):
+    code = int(code)
+    return ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00')
+
+
+def list_cameras(max_index=5):
+    """[{'index', 'path', 'name'}] for the capture devices present"""
+    cameras = []
+    if sys.platform.startswith('linux') and os.path.isdir('/sys/class/video4linux'):
+        for node in sorted(glob.glob('/sys/class/video4linux/video*'), key=_node_number):
+            # UVC cameras also expose a metadata node; the capture node has index 0
+            if _read_sysfs(os.path.join(node, 'index'), '0') != '0':
+                continue
+            number = _node_number(node)
+            cameras.append({
+                'index': number,
+                'path': f'/dev/video{number}',
+                'name': _read_sysfs(os.path.join(node, 'name'), f'Camera {number}'),
+            })
+        return cameras
+
+    # Elsewhere OpenCV cannot name devices: probe indices
+    for index in range(max_index):
+        cap = cv2.VideoCapture(index)
+        if cap.isOpened():
+            cameras.append({'index': index, 'path': None, 'name': f'Camera {index}'})
+        cap.release()
+    return cameras
+
+
+def _node_number(path):
+    digits = ''.join(ch for ch in os.path.basename(path) if ch.isdigit())
+    return int(digits) if digits else -1
+
+
+def _read_sysfs(path, default):
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return default
+
+
+def capture_backend(name='auto'):
+    """OpenCV VideoCapture API preference for a backend name"""
+    if name == 'v4l2' or (name == 'auto' and sys.platform.startswith('linux')):
+        return cv2.CAP_V4L2
+    return cv2.CAP_ANY
+
+
+def find_camera(selector, cameras=None):
+    """Index or device path for a selector (index, path or name substring), or None"""
+    if isinstance(selector, int):
+        return selector
+    selector = str(selector)
+    if selector.isdigit():
+        return int(selector)
+    if selector.startswith('/dev/') or os.path.sep in selector:
+        return selector if os.path.exists(selector) else None
+    needle = selector.lower()
+    for camera in cameras if cameras is not None else list_cameras():
+        if needle in camera['name'].lower():
+            return camera['path'] or camera['index']
+    return None
+
+
+def negotiate_mode(cap, width, height, fps, formats=('MJPG', 'YUYV')):
+    """Ask for each FOURCC in turn; keep the first that gives the size at full FPS.
+
+    MJPG usually reaches 30 FPS at any resolution over USB 2 where YUYV
+    drops to 5-10; YUYV avoids the JPEG decode when it does keep up.
+    Returns the mode the driver reports: (fourcc, width, height, fps).
+    """
+    best = None
+    for name in formats:
+        cap.set(cv2.CAP_PROP_FOURCC, fourcc_code(name))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        cap.set(cv2.CAP_PROP_FPS, fps)
+        mode = (
+            fourcc_name(cap.get(cv2.CAP_PROP_FOURCC)),
+            int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            cap.get(cv2.CAP_PROP_FPS),
+        )
+        if mode[1:3] == (width, height) and mode[3] >= fps * 0.9:
+            return mode
+        if best is None or (mode[1:3] == (width, height), mode[3]) > (best[1:3] == (width, height), best[3]):
+            best = mode
+    if best and best[0] != fourcc_name(cap.get(cv2.CAP_PROP_FOURCC)):
+        # Re-apply the best mode seen (the loop left the last one set)
+        cap.set(cv2.CAP_PROP_FOURCC, fourcc_code(best[0]))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, best[1])
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, best[2])
+        cap.set(cv2.CAP_PROP_FPS, fps)
+    return best
+
+
+class WebcamSource:
+    """One webcam that reopens itself with exponential backoff after failures"""
+
+    def __init__(self, selector=0, width=640, height=480, fps=30, config=None):
+        config = config or {}
+        self.selector = selector
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.formats = tuple(config.get('formats', ('MJPG', 'YUYV')))
+        self.max_failures = config.get('max_read_failures', 5)
+        self.min_backoff = config.get('reconnect_min_s', 0.5)
+        self.max_backoff = config.get('reconnect_max_s', 10.0)
+        self.backend = capture_backend(config.get('backend', 'auto'))
+        self.buffer_size = config.get('buffer_size', 1)
+        self.rgb = config.get('decode', 'opencv') == 'direct'
+        self.imread_flag = _REDUCED.get(config.get('decode_scale', 1), cv2.IMREAD_COLOR)
+
+        self.cap = None
+        self.mode = None
+        self.failures = 0
+        self.backoff = self.min_backoff
+        self.retry_at = 0.0
+        self.reconnects = 0
+        self.ever_opened = False
+
+    @property
+    def connected(self):
+        return self.cap is not None
+
+    def open(self):
+        target = find_camera(self.selector)
+        if target is None:
+            return False
+        cap = cv2.VideoCapture(target, self.backend)
+        if not cap.isOpened():
+            cap.release()
+            return False
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, self.buffer_size)
+        self.mode = negotiate_mode(cap, self.width, self.height, self.fps, self.formats)
+        if self.rgb and self.mode[0] in DIRECT_FORMATS:
+            # Other formats stay converted by OpenCV (then swapped to RGB)
+            cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+        self.cap = cap
+        self.failures = 0
+        self.backoff = self.min_backoff
+        fourcc, width, height, fps = self.mode
+        if self.ever_opened:
+            self.reconnects += 1
+            print(f"🔌 Camera {self.selector} reconnected ({fourcc} {width}x{height} @ {fps:.0f} FPS)")
+        else:
+            print(f"✅ Camera {self.selector} opened ({fourcc} {width}x{height} @ {fps:.0f} FPS)")
+        self.ever_opened = True
+        return True
+
+    def read(self):
+        """Next frame, or None (also while waiting to reconnect; never blocks on backoff)"""
+        if self.cap is None:
+            if time.monotonic() < self.retry_at:
+                return None
+            if not self.open():
+                self._schedule_retry()
+                return None
+
+        ret, frame = self.cap.read()
+        if ret and self.rgb:
+            frame = self._to_rgb(frame)
+            ret = frame is not None
+        if ret:
+            self.failures = 0
+            return frame
+
+        self.failures += 1
+        if self.failures >= self.max_failures:
+            print(f"⚠️ Camera {self.selector} stopped delivering frames, reconnecting")
+            self.cap.release()
+            self.cap = None
+            self._schedule_retry()
+        return None
+
+    def _to_rgb(self, raw):
+        """RGB frame from an unconverted capture buffer (decode 'direct')"""
+        if raw.ndim == 3 and raw.shape[2] == 3:
+            # The backend converted anyway
+            return cv2.cvtColor(raw, cv2.COLOR_BGR2RGB)
+        fourcc, width, height, _ = self.mode
+        if fourcc in ('YUYV', 'YUY2'):
+            return cv2.cvtColor(raw.reshape(height, width, 2), cv2.COLOR_YUV2RGB_YUYV)
+        if fourcc == 'MJPG':
+            bgr = cv2.imdecode(raw.reshape(-1), self.imread_flag)
+            return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB) if bgr is not None else None
+        return None
+
+    def _schedule_retry(self):
+        self.retry_at = time.monotonic() + self.backoff
+        self.backoff = min(self.backoff * 2, self.max_backoff)
+
+    def set_mode(self, width, height, fps):
+        """Change resolution/FPS (kept across reconnects)"""
+        self.width, self.height, self.fps = width, height, fps
+        if self.cap is not None:
+            self.mode = negotiate_mode(self.cap, width, height, fps, self.formats)
+            if self.rgb:
+                self.cap.set(cv2.CAP_PROP_CONVERT_RGB, 0 if self.mode[0] in DIRECT_FORMATS else 1)
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+
+class CameraPool:
+    """Several webcams behind one read(); see the module docstring for modes"""
+
+    def __init__(self, selectors, width=640, height=480, fps=30, config=None):
+        config = config or {}
+        self.mode = config.get('multi_mode', 'failover')
+        if self.mode not in MODES:
+            print(f"⚠️ Unknown camera multi_mode {self.mode!r}, using failover")
+            self.mode = 'failover'
+        self.switch_after = config.get('switch_after', 15)
+        self.sources = [WebcamSource(selector, width, height, fps, config) for selector in selectors]
+        self.active = 0
+        self.idle_frames = 0
+        for source in self.sources:
+            if not source.open():
+                print(f"❌ ERROR: Could not open camera {source.selector}!")
+                source._schedule_retry()
+
+    @property
+    def connected(self):
+        return any(source.connected for source in self.sources)
+
+    @property
+    def rgb(self):
+        return self.sources[0].rgb
+
+    @property
+    def active_source(self):
+        return self.sources[self.active]
+
+    def read(self):
+        if self.mode == 'failover':
+            for index, source in enumerate(self.sources):
+                frame = source.read()
+                if frame is not None:
+                    self._switch(index)
+                    return frame
+                if source.connected:
+                    return None  # a missed frame on a live camera is not a failover
+            return None
+
+        frame = self.active_source.read()
+        if frame is None and not self.active_source.connected and len(self.sources) > 1:
+            self._switch((self.active + 1) % len(self.sources))
+        return frame
+
+    def report_hands(self, count):
+        """follow_hand: how many hands the active camera's frame had"""
+        if self.mode != 'follow_hand' or len(self.sources) < 2:
+            return
+        if count:
+            self.idle_frames = 0
+            return
+        self.idle_frames += 1
+        if self.idle_frames >= self.switch_after:
+            self._switch((self.active + 1) % len(self.sources))
+
+    def _switch(self, index):
+        self.idle_frames = 0
+        if index != self.active:
+            self.active = index
+            print(f"🎥 Switched to camera {self.sources[index].selector}")
+
+    def set_mode(self, width, height, fps):
+        for source in self.sources:
+            source.set_mode(width, height, fps)
+
+    def release(self):
+        for source in self.sources:
+            source.release()
+
+
+def main(argv=None):
+    cameras = list_cameras()
+    if not cameras:
+        print("No cameras found")
+        return 1
+    for camera in cameras:
+        print(f"{camera['index']:>3}  {camera['path'] or '-':<14} {camera['name']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Depth-aware hand filtering with the OAK-D stereo depth stream.
+
+The depth map (uint16 millimetres, aligned to the RGB camera, 0 = no
+measurement) is used three ways:
+
+    filter()      drops hands whose palm is outside [min_mm, max_mm], so
+                  people walking behind the user do not produce hands
+    key points    wrist, thumb tip, index tip and middle knuckle in
+                  millimetres, for a true 3D pinch distance
+    roi()         frame rectangle around everything inside the band, so
+                  host inference can run on a crop (or not at all)
+
+The RGB preview is a centre crop of the sensor frame the depth is aligned
+to; crop is the (x, y) fraction of the sensor frame the preview covers.
+"""
+import numpy as np
+
+# Landmarks sampled from depth: wrist, thumb tip, index tip, middle knuckle
+KEY_POINTS = np.array([0, 4, 8, 9])
+KEY_WRIST, KEY_THUMB, KEY_INDEX, KEY_KNUCKLE = range(4)
+
+
+class DepthGate:
+    """Distance band, ROI and metric key points for one depth stream"""
+
+    def __init__(self, config=None, intrinsics=None, crop=(1.0, 1.0)):
+        config = config or {}
+        self.min_mm = config.get('min_mm', 300)
+        self.max_mm = config.get('max_mm', 1500)
+        self.use_roi = config.get('roi', True)
+        self.roi_margin = config.get('roi_margin', 0.1)
+        self.min_pixels = config.get('min_pixels', 40)
+        self.window = config.get('window', 1)  # median over (2 * window + 1)^2 depth pixels
+        self.intrinsics = intrinsics  # fx, fy, cx, cy normalized to the sensor frame
+        self.crop = crop
+        self.last_roi = None
+
+    def _to_sensor(self, u, v):
+        """Preview-normalized coordinates to sensor-normalized"""
+        return 0.5 + (u - 0.5) * self.crop[0], 0.5 + (v - 0.5) * self.crop[1]
+
+    def key_points(self, points, depth):
+        """(4, 3) millimetre positions of KEY_POINTS; z is 0 where depth is missing"""
+        u, v = self._to_sensor(points[KEY_POINTS, 0], points[KEY_POINTS, 1])
+        height, width = depth.shape
+        cols = np.clip((u * width).astype(int), self.window, width - 1 - self.window)
+        rows = np.clip((v * height).astype(int), self.window, height - 1 - self.window)
+
+        z = np.zeros(len(KEY_POINTS), dtype=np.float32)
+        w = self.window
+        for i, (row, col) in enumerate(zip(rows.tolist(), cols.tolist())):
+            patch = depth[row - w:row + w + 1, col - w:col + w + 1]
+            valid = patch[patch > 0]
+            if valid.size:
+                z[i] = np.median(valid)
+
+        metric = np.zeros((len(KEY_POINTS), 3), dtype=np.float32)
+        metric[:, 2] = z
+        if self.intrinsics:
+            fx, fy, cx, cy = self.intrinsics
+            metric[:, 0] = (u - cx) * z / fx
+            metric[:, 1] = (v - cy) * z / fy
+        return metric
+
+    def filter(self, hands, depth):
+        """Hands inside the distance band and their key points.
+
+        Returns (hands, metric): metric[i] is a (4, 3) array, or None when
+        the depth is incomplete (the hand is kept and falls back to 2D).
+        """
+        kept = []
+        metric = []
+        for points in hands:
+            key = self.key_points(points, depth)
+            palm = key[[KEY_WRIST, KEY_KNUCKLE], 2]
+            palm = palm[palm > 0]
+            if palm.size and not self.min_mm <= float(palm.mean()) <= self.max_mm:
+                continue
+            kept.append(points)
+            metric.append(key if self.intrinsics and key[:, 2].all() else None)
+        return kept, metric
+
+    def roi(self, depth):
+        """(x0, y0, x1, y1) preview-normalized box around the band, or None if it is empty.
+
+        The box only moves when the band leaves it, so MediaPipe sees the
+        same crop from frame to frame and keeps tracking instead of
+        re-running palm detection.
+        """
+        mask = (depth >= self.min_mm) & (depth <= self.max_mm)
+        if np.count_nonzero(mask) < self.min_pixels:
+            self.last_roi = None
+            return None
+
+        height, width = depth.shape
+        cols = np.flatnonzero(mask.any(axis=0))
+        rows = np.flatnonzero(mask.any(axis=1))
+        box = (cols[0] / width, rows[0] / height, (cols[-1] + 1) / width, (rows[-1] + 1) / height)
+        # Sensor-normalized to preview-normalized
+        box = (
+            (box[0] - 0.5) / self.crop[0] + 0.5, (box[1] - 0.5) / self.crop[1] + 0.5,
+            (box[2] - 0.5) / self.crop[0] + 0.5, (box[3] - 0.5) / self.crop[1] + 0.5,
+        )
+
+        last = self.last_roi
+        if last and last[0] <= box[0] and last[1] <= box[1] and last[2] >= box[2] and last[3] >= box[3]:
+            return last
+        m = self.roi_margin
+        roi = (max(box[0] - m, 0.0), max(box[1] - m, 0.0), min(box[2] + m, 1.0), min(box[3] + m, 1.0))
+        if roi[2] <= roi[0] or roi[3] <= roi[1]:
+            # Band is entirely outside the preview crop
+            self.last_roi = None
+            return None
+        self.last_roi = roi
+        return roi
@@ -0,0 +1,227 @@
+"""Hand pose features and gesture classification.
+
+Each hand is handled as one (21, 3) landmark array per frame. Features are
+computed in vectorized form and normalized by palm size, so they do not
+depend on camera resolution or distance from the mirror:
+
+    curl           (5,)  per finger, 0 = straight, towards 1 = folded
+    tip_distances  (10,) pairwise fingertip distances in palm sizes
+    palm_normal    (3,)  unit normal of the palm plane
+    palm_center    (2,)  palm centre in aspect-corrected image units
+
+Static poses come from a nearest-centroid classifier on the curl vector;
+swipes and scrolls from the palm centre trajectory while a pose is held.
+"""
+from collections import deque
+
+import numpy as np
+
+WRIST = 0
+MIDDLE_MCP = 9
+FINGER_NAMES = ('thumb', 'index', 'middle', 'ring', 'pinky')
+# Joint chain per finger, base to tip (thumb starts at its CMC joint)
+FINGER_JOINTS = np.array([
+    [1, 2, 3, 4],
+    [5, 6, 7, 8],
+    [9, 10, 11, 12],
+    [13, 14, 15, 16],
+    [17, 18, 19, 20],
+])
+FINGERTIPS = FINGER_JOINTS[:, 3]
+PALM_POINTS = np.array([0, 5, 9, 13, 17])
+_TIP_PAIRS = np.triu_indices(len(FINGERTIPS), k=1)
+
+# Every vector the features need, taken with one gather: 15 finger
+# segments, 5 base-to-tip chords, 10 fingertip pairs, the palm size and
+# the two palm edges spanning the palm plane
+_SEGMENTS = (FINGER_JOINTS[:, 1:].ravel(), FINGER_JOINTS[:, :-1].ravel())
+_CHORDS = (FINGERTIPS, FINGER_JOINTS[:, 0])
+_TIPS = (FINGERTIPS[_TIP_PAIRS[0]], FINGERTIPS[_TIP_PAIRS[1]])
+_PALM = ([MIDDLE_MCP, 5, 17], [WRIST, WRIST, WRIST])
+_FROM = np.concatenate([_SEGMENTS[0], _CHORDS[0], _TIPS[0], _PALM[0]])
+_TO = np.concatenate([_SEGMENTS[1], _CHORDS[1], _TIPS[1], _PALM[1]])
+
+# Curl centroids per pose (thumb, index, middle, ring, pinky)
+DEFAULT_POSES = {
+    'open_palm': (0.05, 0.05, 0.05, 0.05, 0.05),
+    'fist': (0.35, 0.7, 0.7, 0.7, 0.7),
+    'point': (0.35, 0.05, 0.7, 0.7, 0.7),
+    'two_fingers': (0.35, 0.05, 0.05, 0.7, 0.7),
+}
+
+
+class HandFeatures:
+    """Normalized features for one hand in one frame"""
+    __slots__ = ('palm_size', 'curl', 'tip_distances', 'palm_normal', 'palm_center')
+
+    def __init__(self, palm_size, curl, tip_distances, palm_normal, palm_center):
+        self.palm_size = palm_size
+        self.curl = curl
+        self.tip_distances = tip_distances
+        self.palm_normal = palm_normal
+        self.palm_center = palm_center
+
+
+def extract_features(points, aspect=4 / 3):
+    """Features for a (21, 3) landmark array.
+
+    aspect is frame width / height; MediaPipe normalizes x and y by
+    different lengths, so x (and z, which shares x's scale) is stretched
+    back before measuring anything.
+    """
+    p = points * np.array((aspect, 1.0, aspect), dtype=np.float32)
+
+    vectors = p[_FROM] - p[_TO]
+    lengths = np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
+    palm_size = max(float(lengths[30]), 1e-6)
+
+    path = lengths[:15].reshape(5, 3).sum(axis=1)
+    curl = 1.0 - lengths[15:20] / np.maximum(path, 1e-6)
+    tip_distances = lengths[20:30] / palm_size
+
+    # Cross product of the palm edges (3 components: cheaper than np.cross)
+    (ax, ay, az), (bx, by, bz) = vectors[31:].tolist()
+    palm_normal = np.array((ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx), dtype=np.float32)
+    palm_normal /= max(float(np.sqrt(palm_normal.dot(palm_normal))), 1e-6)
+
+    palm_center = p[PALM_POINTS, :2].sum(axis=0) / len(PALM_POINTS)
+    return HandFeatures(palm_size, curl, tip_distances, palm_normal, palm_center)
+
+
+class PoseClassifier:
+    """Nearest-centroid classifier over finger curl.
+
+    Returns the closest pose label, or None when the hand is further than
+    max_distance from every centroid. The thumb is weighted down because
+    its curl is the least reliable.
+    """
+
+    def __init__(self, poses=None, weights=(0.5, 1.0, 1.0, 1.0, 1.0), max_distance=0.3):
+        poses = poses or DEFAULT_POSES
+        self.labels = list(poses)
+        self.centroids = np.array([poses[label] for label in self.labels], dtype=np.float32)
+        self.weights = np.array(weights, dtype=np.float32)
+        self.max_distance = max_distance
+
+    def classify(self, curl):
+        diff = (self.centroids - curl) * self.weights
+        distances = np.einsum('ij,ij->i', diff, diff)  # squared
+        best = int(distances.argmin())
+        if distances[best] > self.max_distance ** 2:
+            return None
+        return self.labels[best]
+
+
+class _HandHistory:
+    """Recognizer state for one hand slot"""
+    __slots__ = ('candidate', 'candidate_frames', 'pose', 'track', 'scroll_anchor', 'cooldown_until')
+
+    def __init__(self):
+        self.candidate = None
+        self.candidate_frames = 0
+        self.pose = None
+        self.track = deque()  # (timestamp, x, y) of the palm centre
+        self.scroll_anchor = None
+        self.cooldown_until = 0.0
+
+
+class GestureRecognizer:
+    """Turns per-frame landmark arrays into pose, swipe and scroll events.
+
+    update() returns a list of (event_type, data) for the caller to emit:
+
+        pose    {'hand', 'pose'}       a pose held for stable_frames frames
+        swipe   {'hand', 'direction'}  open palm moved swipe_distance palm
+                                       sizes within swipe_window seconds
+        scroll  {'hand', 'steps'}      two-finger pose moved vertically by
+                                       scroll_step palm sizes (down > 0)
+
+    Directions are in screen terms (the camera image is mirrored).
+    """
+
+    def __init__(self, config=None, classifier=None):
+        config = config or {}
+        self.classifier = classifier or PoseClassifier()
+        self.stable_frames = config.get('pose_stable_frames', 3)
+        self.swipe_distance = config.get('swipe_distance', 2.0)
+        self.swipe_window = config.get('swipe_window', 0.5)
+        self.swipe_cooldown = config.get('swipe_cooldown', 0.6)
+        self.scroll_step = config.get('scroll_step', 0.3)
+        self.hands = {}
+
+    def reset(self, hand):
+        """Forget a hand that left the frame"""
+        self.hands.pop(hand, None)
+
+    def update(self, hand, points, timestamp, aspect=4 / 3, busy=False):
+        """Feed one hand's landmarks; busy (e.g. mid-pinch) suppresses events"""
+        history = self.hands.get(hand)
+        if history is None:
+            history = self.hands[hand] = _HandHistory()
+
+        features = extract_features(points, aspect)
+        events = []
+        pose = self._update_pose(history, self.classifier.classify(features.curl))
+        if busy:
+            history.track.clear()
+            history.scroll_anchor = None
+            return events
+        if pose is not None:
+            events.append(('pose', {'hand': hand, 'pose': pose}))
+
+        x, y = features.palm_center
+        if history.pose == 'open_palm':
+            direction = self._update_swipe(history, timestamp, x, y, features.palm_size)
+            if direction:
+                events.append(('swipe', {'hand': hand, 'direction': direction}))
+        else:
+            history.track.clear()
+
+        if history.pose == 'two_fingers':
+            steps = self._update_scroll(history, y, features.palm_size)
+            if steps:
+                events.append(('scroll', {'hand': hand, 'steps': steps}))
+        else:
+            history.scroll_anchor = None
+        return events
+
+    def _update_pose(self, history, label):
+        """Debounce the classifier output; returns a newly settled pose"""
+        if label == history.candidate:
+            history.candidate_frames += 1
+        else:
+            history.candidate = label
+            history.candidate_frames = 1
+        if history.candidate_frames == self.stable_frames and label != history.pose:
+            history.pose = label
+            return label
+        return None
+
+    def _update_swipe(self, history, timestamp, x, y, palm_size):
+        track = history.track
+        track.append((timestamp, x, y))
+        while track and timestamp - track[0][0] > self.swipe_window:
+            track.popleft()
+        if timestamp < history.cooldown_until or len(track) < 2:
+            return None
+
+        # Distances in palm sizes, so standing further away needs less travel
+        dx = (x - track[0][1]) / palm_size
+        dy = (y - track[0][2]) / palm_size
+        if max(abs(dx), abs(dy)) < self.swipe_distance:
+            return None
+        track.clear()
+        history.cooldown_until = timestamp + self.swipe_cooldown
+        if abs(dx) >= abs(dy):
+            return 'left' if dx > 0 else 'right'  # mirrored image
+        return 'down' if dy > 0 else 'up'
+
+    def _update_scroll(self, history, y, palm_size):
+        if history.scroll_anchor is None:
+            history.scroll_anchor = y
+            return 0
+        step = self.scroll_step * palm_size
+        steps = int((y - history.scroll_anchor) / step)
+        if steps:
+            history.scroll_anchor += steps * step
+        return steps
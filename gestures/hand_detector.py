@@ -0,0 +1,74 @@
+"""Hand landmark detectors.
+
+A detector turns camera output into this frame's hands, each a (21, 3)
+float32 array of normalized (x, y, z) landmarks in camera orientation
+(MediaPipe's convention; frames are not mirrored). GestureController only relies on:
+
+    needs_frame        False when landmarks arrive without a host frame
+    rgb_input          True when frames are already RGB (set by the caller)
+    frame_shape        shape the landmarks are normalized to (None: the frame's)
+    inference_seconds  host time spent on the last detect()
+    detect(frame, trace=None, roi=None)
+                       list of hands, or None when there is no new result yet;
+                       roi (x0, y0, x1, y1, normalized) limits the search to
+                       part of the frame where that saves work
+    close()
+
+MediaPipeHandDetector runs MediaPipe Hands on the host; the OAK-D variant
+that runs both networks on the device lives in gestures/oakd_hands.py.
+"""
+import time
+
+import cv2
+import numpy as np
+
+from gestures.landmark_trace import landmarks_to_array
+
+try:
+    import mediapipe as mp
+    MEDIAPIPE_AVAILABLE = True
+except ImportError:
+    MEDIAPIPE_AVAILABLE = False
+
+
+class MediaPipeHandDetector:
+    """MediaPipe Hands on BGR camera frames"""
+
+    needs_frame = True
+    frame_shape = None
+    rgb_input = False
+
+    def __init__(self, max_hands=2, min_detection_confidence=0.7, min_tracking_confidence=0.5):
+        if not MEDIAPIPE_AVAILABLE:
+            raise RuntimeError("MediaPipe is required for camera gesture tracking")
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=max_hands,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+        self.inference_seconds = 0.0
+
+    def detect(self, frame, trace=None, roi=None):
+        if roi:
+            height, width = frame.shape[:2]
+            x0, y0 = int(roi[0] * width), int(roi[1] * height)
+            x1, y1 = max(int(roi[2] * width), x0 + 1), max(int(roi[3] * height), y0 + 1)
+            frame = frame[y0:y1, x0:x1]
+        frame_rgb = frame if self.rgb_input else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if trace:
+            trace.mark('color_convert')
+
+        start = time.perf_counter()
+        results = self.hands.process(frame_rgb)
+        self.inference_seconds = time.perf_counter() - start
+        hands = [landmarks_to_array(hand_landmarks) for hand_landmarks in results.multi_hand_landmarks or []]
+        if roi and hands:
+            # Crop-normalized back to frame-normalized (z scales with width)
+            scale = np.array(((x1 - x0) / width, (y1 - y0) / height, (x1 - x0) / width), dtype=np.float32)
+            offset = np.array((x0 / width, y0 / height, 0.0), dtype=np.float32)
+            hands = [points * scale + offset for points in hands]
+        return hands
+
+    def close(self):
+        self.hands.close()
@@ -0,0 +1,110 @@
+import numpy as np
+
+# Palm anchor used to follow a hand between frames: wrist + middle knuckle
+WRIST = 0
+MIDDLE_MCP = 9
+
+
+class HandState:
+    """Gesture state for one tracked hand (one cursor)"""
+
+    __slots__ = ('slot', 'active', 'camera_u', 'camera_v', 'cursor_x', 'cursor_y', 'pinching',
+                 'pinch_frames', 'in_bounds', 'pinch_state', 'drag_start_x', 'drag_start_y', 'metric')
+
+    def __init__(self, slot):
+        self.slot = slot
+        self.active = False
+        self.reset()
+
+    def reset(self):
+        self.camera_u = 0.0  # mirrored, normalized index tip position
+        self.camera_v = 0.0
+        self.cursor_x = None  # None until the first frame places the cursor
+        self.cursor_y = None
+        self.pinching = False
+        self.pinch_frames = 0  # consecutive frames disagreeing with pinching
+        self.in_bounds = False
+        self.pinch_state = 'idle'  # idle, pinching, dragging, resizing, calibrating
+        self.drag_start_x = 0
+        self.drag_start_y = 0
+        self.metric = None  # (4, 3) mm key points from depth (gestures/depth.py), if any
+
+
+class HandTracker:
+    """Keeps hand identity stable across frames.
+
+    MediaPipe returns hands in no particular order, so each detection is
+    matched to the nearest palm anchor from the previous frame (greedy on
+    the distance matrix, gated by max_distance in normalized image units).
+    Hands that are not matched are lost (on_lost is called with their state
+    before the slot can be reused); new hands take a free slot. Slots are
+    reused, so a slot number doubles as a small, stable hand id.
+    """
+
+    def __init__(self, max_hands=2, max_distance=0.2, on_lost=None):
+        self.max_hands = max_hands
+        self.max_distance = max_distance
+        self.on_lost = on_lost
+        self.states = [HandState(slot) for slot in range(max_hands)]
+        self.anchors = np.zeros((max_hands, 2), dtype=np.float32)
+        self.active = [False] * max_hands
+
+    def update(self, hands, metric=None):
+        """Match this frame's hands ((21, 3) landmark arrays) to slots.
+
+        metric optionally gives each hand's depth key points (or None),
+        stored on its state. Returns a list of (HandState, points) in slot
+        order.
+        """
+        detections = list(hands or [])[:self.max_hands]
+        count = len(detections)
+        assigned = [None] * count
+        anchors = [(points[WRIST, :2] + points[MIDDLE_MCP, :2]) * 0.5 for points in detections]
+
+        slots = [slot for slot in range(self.max_hands) if self.active[slot]]
+        if count == 1 and len(slots) == 1:
+            # Common single-hand case without the matrix
+            slot = slots[0]
+            if np.hypot(*(anchors[0] - self.anchors[slot])) <= self.max_distance:
+                assigned[0] = slot
+        elif count and slots:
+            distances = np.linalg.norm(
+                np.asarray(anchors, dtype=np.float32)[:, None, :] - self.anchors[None, slots, :], axis=2
+            )
+            used = set()
+            for flat in np.argsort(distances, axis=None):
+                i, j = divmod(int(flat), len(slots))
+                if distances[i, j] > self.max_distance:
+                    break
+                if assigned[i] is not None or j in used:
+                    continue
+                assigned[i] = slots[j]
+                used.add(j)
+
+        kept = set(assigned)
+        for slot in slots:
+            if slot not in kept:
+                self.active[slot] = False
+                self.states[slot].active = False
+                if self.on_lost:
+                    self.on_lost(self.states[slot])
+
+        # New hands take the lowest free slot
+        for i in range(count):
+            if assigned[i] is None:
+                slot = self.active.index(False)
+                self.states[slot].reset()
+                assigned[i] = slot
+            slot = assigned[i]
+            self.anchors[slot] = anchors[i]
+            self.active[slot] = True
+            self.states[slot].active = True
+            self.states[slot].metric = metric[i] if metric else None
+
+        if count == 1:
+            return [(self.states[assigned[0]], detections[0])]
+        return sorted(((self.states[slot], detections[i]) for i, slot in enumerate(assigned)),
+                      key=lambda pair: pair[0].slot)
+
+    def active_states(self):
+        return [state for state in self.states if state.active]
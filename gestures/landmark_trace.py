@@ -0,0 +1,93 @@
+"""Compact binary traces of hand landmarks.
+
+Layout (little endian):
+    header: magic b'LMTRACE1', uint16 frame width, uint16 frame height
+    record: float64 timestamp, uint8 hand count, then hand count x 21 x 3 float32 (x, y, z)
+
+A record with zero hands marks a frame where no hand was detected.
+"""
+import struct
+
+import numpy as np
+
+MAGIC = b'LMTRACE1'
+HEADER = struct.Struct('<8sHH')
+RECORD = struct.Struct('<dB')
+LANDMARK_COUNT = 21
+HAND_BYTES = LANDMARK_COUNT * 3 * 4
+
+
+class LandmarkTrace:
+    """A trace loaded into memory"""
+
+    def __init__(self, frame_width, frame_height, timestamps, frames):
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.timestamps = timestamps
+        self.frames = frames  # list of lists of (21, 3) float32 arrays
+
+    @property
+    def frame_shape(self):
+        return (self.frame_height, self.frame_width, 3)
+
+    def __len__(self):
+        return len(self.frames)
+
+
+def landmarks_to_array(hand_landmarks):
+    """Convert a MediaPipe landmark list to a (21, 3) float32 array"""
+    return np.array(
+        [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark],
+        dtype=np.float32
+    )
+
+
+class LandmarkTraceWriter:
+    """Append landmark frames to a trace file"""
+
+    def __init__(self, path, frame_width, frame_height):
+        self.path = path
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, frame_width, frame_height))
+        self.frames = 0
+
+    def write(self, timestamp, hands):
+        """Write one frame; hands is a list of (21, 3) arrays or MediaPipe landmark lists"""
+        hands = hands or []
+        parts = [RECORD.pack(timestamp, len(hands))]
+        for hand in hands:
+            if not isinstance(hand, np.ndarray):
+                hand = landmarks_to_array(hand)
+            parts.append(np.ascontiguousarray(hand, dtype=np.float32).tobytes())
+        self.file.write(b''.join(parts))
+        self.frames += 1
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+            print(f"💾 Landmark trace saved to {self.path} ({self.frames} frames)")
+
+
+def read_trace(path):
+    """Load a landmark trace file"""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    magic, frame_width, frame_height = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a landmark trace")
+
+    offset = HEADER.size
+    timestamps = []
+    frames = []
+    while offset < len(data):
+        timestamp, hand_count = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        size = hand_count * HAND_BYTES
+        points = np.frombuffer(data, dtype=np.float32, count=hand_count * LANDMARK_COUNT * 3, offset=offset)
+        offset += size
+        timestamps.append(timestamp)
+        frames.append(list(points.reshape(hand_count, LANDMARK_COUNT, 3)))
+
+    return LandmarkTrace(frame_width, frame_height, np.array(timestamps), frames)
@@ -0,0 +1,229 @@
+"""Hand detection on the OAK-D itself.
+
+The host MediaPipe path pulls full RGB previews over XLink and runs both
+hand networks on the CPU. Here palm detection and hand landmarks run on
+the Myriad X, and only the landmarks (a few hundred bytes per frame) come
+back, with an optional low-res preview for motion detection:
+
+    ColorCamera.preview -> Script --frame--> ImageManip -> palm NN --+
+                             ^  \\--crop cfg + frame--> ImageManip -> landmark NN
+                             |                                            |
+                             +--------------------------------------------+
+                           Script --"hands"--> XLinkOut
+    ColorCamera.preview -> ImageManip (small) --"preview"--> XLinkOut (optional)
+
+The Script node keeps one frame in flight: it forwards the frame to palm
+detection, crops a rotated square around every palm (MediaPipe's hand ROI:
+palm box shifted half a box towards the fingers, scaled 2.6x, rotated so
+the wrist-to-middle-knuckle axis points up), runs the landmark network on
+each crop and maps the landmarks back to frame coordinates.
+
+Blobs:
+    palm_blob      palm detection with post-processing built in; output
+                   layer 'result' holds rows of [score, cx, cy, w, h,
+                   wrist x, wrist y, middle knuckle x, middle knuckle y],
+                   normalized to the input
+    landmark_blob  MediaPipe hand landmark model; layers
+                   'Identity_dense/BiasAdd/Add' (21 x 3 in input pixels)
+                   and 'Identity_1' (hand presence score)
+
+Packets on the "hands" stream are marshalled dicts:
+    {'scores': [float, ...], 'hands': [[63 floats], ...]}
+with x, y normalized to the camera preview and z in units of its width,
+like MediaPipe. OakdHandDetector decodes them into the same (21, 3) arrays
+as the MediaPipe detector (see gestures/hand_detector.py).
+"""
+import marshal
+import time
+from string import Template
+
+import numpy as np
+
+HANDS_STREAM = 'hands'
+PREVIEW_STREAM = 'preview'
+
+# Runs on the device (depthai Script node Python)
+_SCRIPT = Template("""
+import marshal
+from math import atan2, cos, sin, pi, floor
+
+WIDTH = $width
+HEIGHT = $height
+LM_SIZE = $lm_size
+PD_SCORE = $pd_score
+LM_SCORE = $lm_score
+MAX_HANDS = $max_hands
+
+def hand_rect(det):
+    score, cx, cy, w, h, x0, y0, x1, y1 = det
+    rotation = pi / 2 - atan2(-(y1 - y0) * HEIGHT, (x1 - x0) * WIDTH)
+    rotation -= 2 * pi * floor((rotation + pi) / (2 * pi))
+    side = max(w * WIDTH, h * HEIGHT)
+    cx = cx * WIDTH + 0.5 * side * sin(rotation)
+    cy = cy * HEIGHT - 0.5 * side * cos(rotation)
+    return cx, cy, side * 2.6, rotation
+
+def crop_config(cx, cy, size, rotation):
+    rr = RotatedRect()
+    rr.center.x = cx / WIDTH
+    rr.center.y = cy / HEIGHT
+    rr.size.width = size / WIDTH
+    rr.size.height = size / HEIGHT
+    rr.angle = rotation * 180 / pi
+    cfg = ImageManipConfig()
+    cfg.setCropRotatedRect(rr, True)
+    cfg.setResize(LM_SIZE, LM_SIZE)
+    return cfg
+
+def to_frame(coords, cx, cy, size, rotation):
+    c, s = cos(rotation), sin(rotation)
+    scale = size / LM_SIZE
+    out = []
+    for i in range(0, len(coords), 3):
+        lx = (coords[i] - LM_SIZE / 2) * scale
+        ly = (coords[i + 1] - LM_SIZE / 2) * scale
+        out.append((cx + lx * c - ly * s) / WIDTH)
+        out.append((cy + lx * s + ly * c) / HEIGHT)
+        out.append(coords[i + 2] * scale / WIDTH)
+    return out
+
+while True:
+    frame = node.io['frame'].get()
+    node.io['pd_frame'].send(frame)
+    result = node.io['from_pd'].get().getLayerFp16('result')
+    detections = [result[i:i + 9] for i in range(0, len(result) - 8, 9)]
+    detections = [det for det in detections if det[0] >= PD_SCORE][:MAX_HANDS]
+
+    scores = []
+    hands = []
+    for det in detections:
+        cx, cy, size, rotation = hand_rect(det)
+        node.io['manip_cfg'].send(crop_config(cx, cy, size, rotation))
+        node.io['manip_frame'].send(frame)
+        lm = node.io['from_lm'].get()
+        score = lm.getLayerFp16('Identity_1')[0]
+        if score < LM_SCORE:
+            continue
+        scores.append(score)
+        hands.append(to_frame(lm.getLayerFp16('Identity_dense/BiasAdd/Add'), cx, cy, size, rotation))
+
+    data = marshal.dumps({'scores': scores, 'hands': hands})
+    packet = Buffer(len(data))
+    packet.setData(data)
+    node.io['host'].send(packet)
+""")
+
+
+def build_hand_pipeline(dai, width, height, config=None, max_hands=2):
+    """Build the on-device hand pipeline; returns (pipeline, has_preview).
+
+    dai is the depthai module (passed in so this file imports without it).
+    """
+    config = config or {}
+    palm_size = config.get('palm_input_size', 128)
+    lm_size = config.get('landmark_input_size', 224)
+    preview = config.get('preview', True)
+
+    pipeline = dai.Pipeline()
+
+    cam = pipeline.create(dai.node.ColorCamera)
+    cam.setPreviewSize(width, height)
+    cam.setInterleaved(False)
+    cam.setColorOrder(dai.ColorCameraProperties.ColorOrder.BGR)
+    cam.setFps(config.get('fps', 30))
+
+    script = pipeline.create(dai.node.Script)
+    script.setScript(_SCRIPT.substitute(
+        width=width,
+        height=height,
+        lm_size=lm_size,
+        pd_score=config.get('palm_threshold', 0.5),
+        lm_score=config.get('landmark_threshold', 0.5),
+        max_hands=max_hands,
+    ))
+    # Latest frame only: a frame arriving while the networks are busy is dropped
+    cam.preview.link(script.inputs['frame'])
+    script.inputs['frame'].setBlocking(False)
+    script.inputs['frame'].setQueueSize(1)
+
+    pd_manip = pipeline.create(dai.node.ImageManip)
+    pd_manip.initialConfig.setResize(palm_size, palm_size)
+    pd_manip.initialConfig.setFrameType(dai.ImgFrame.Type.BGR888p)
+    script.outputs['pd_frame'].link(pd_manip.inputImage)
+
+    pd_nn = pipeline.create(dai.node.NeuralNetwork)
+    pd_nn.setBlobPath(config['palm_blob'])
+    pd_manip.out.link(pd_nn.input)
+    pd_nn.out.link(script.inputs['from_pd'])
+
+    lm_manip = pipeline.create(dai.node.ImageManip)
+    lm_manip.setMaxOutputFrameSize(lm_size * lm_size * 3)
+    lm_manip.setWaitForConfigInput(True)
+    lm_manip.inputImage.setQueueSize(1)
+    lm_manip.inputImage.setBlocking(False)
+    script.outputs['manip_cfg'].link(lm_manip.inputConfig)
+    script.outputs['manip_frame'].link(lm_manip.inputImage)
+
+    lm_nn = pipeline.create(dai.node.NeuralNetwork)
+    lm_nn.setBlobPath(config['landmark_blob'])
+    lm_manip.out.link(lm_nn.input)
+    lm_nn.out.link(script.inputs['from_lm'])
+
+    xout_hands = pipeline.create(dai.node.XLinkOut)
+    xout_hands.setStreamName(HANDS_STREAM)
+    script.outputs['host'].link(xout_hands.input)
+
+    if preview:
+        preview_width = config.get('preview_width', 160)
+        preview_height = config.get('preview_height', 120)
+        preview_manip = pipeline.create(dai.node.ImageManip)
+        preview_manip.initialConfig.setResize(preview_width, preview_height)
+        preview_manip.initialConfig.setFrameType(dai.ImgFrame.Type.BGR888p)
+        preview_manip.setMaxOutputFrameSize(preview_width * preview_height * 3)
+        preview_manip.inputImage.setQueueSize(1)
+        preview_manip.inputImage.setBlocking(False)
+        cam.preview.link(preview_manip.inputImage)
+
+        xout_preview = pipeline.create(dai.node.XLinkOut)
+        xout_preview.setStreamName(PREVIEW_STREAM)
+        preview_manip.out.link(xout_preview.input)
+
+    return pipeline, preview
+
+
+def decode_hands(packet):
+    """(21, 3) float32 arrays from one "hands" packet"""
+    result = marshal.loads(bytes(packet.getData()))
+    if not result['hands']:
+        return []
+    return list(np.array(result['hands'], dtype=np.float32).reshape(-1, 21, 3))
+
+
+class OakdHandDetector:
+    """Landmark detector reading the device's "hands" stream.
+
+    Same contract as MediaPipeHandDetector, but no host frame is needed:
+    detect() returns the next frame's landmarks in order (the gesture state
+    machine debounces across frames), or None if the device has not
+    finished a frame since the last call.
+    """
+
+    needs_frame = False
+    rgb_input = False
+
+    def __init__(self, queue, frame_shape):
+        self.queue = queue
+        self.frame_shape = frame_shape
+        self.inference_seconds = 0.0
+
+    def detect(self, frame=None, trace=None, roi=None):
+        packet = self.queue.tryGet()
+        if packet is None:
+            return None
+        start = time.perf_counter()
+        hands = decode_hands(packet)
+        self.inference_seconds = time.perf_counter() - start
+        return hands
+
+    def close(self):
+        pass
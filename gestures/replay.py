@@ -0,0 +1,208 @@
+"""Record and replay camera sessions through the gesture pipeline.
+
+Record a session from the live camera:
+    python -m gestures.replay record session.npz --seconds 20
+
+Pack the frames of a .npz recording that was interrupted before it closed:
+    python -m gestures.replay recover session.npz
+
+Replay it headless and check the emitted gesture events:
+    python -m gestures.replay run session.npz --save-events golden.json
+    python -m gestures.replay run session.npz --expect golden.json
+
+Landmark traces (camera.record_landmarks in config.json) skip the camera and
+MediaPipe entirely and drive the gesture state machine directly:
+    python -m gestures.replay trace session.lmt --expect golden.json
+"""
+import argparse
+import json
+import sys
+import time
+
+from gestures.camera import CameraSystem, FrameRecorder
+from gestures.landmark_trace import read_trace
+from modules.latency_tracer import percentile
+
+
+def record_session(path, seconds, width=640, height=480, use_oakd=False):
+    """Record frames from the live camera into a replayable file"""
+    camera = CameraSystem(use_oakd=use_oakd, width=width, height=height, record_path=path)
+    end_time = time.monotonic() + seconds
+    frames = 0
+    try:
+        while time.monotonic() < end_time:
+            if camera.get_frame() is not None:
+                frames += 1
+            else:
+                time.sleep(0.005)
+    finally:
+        camera.release()
+    return frames
+
+
+def run_replay(path, config=None, realtime=False, screen_width=1920, screen_height=1080):
+    """Drive GestureController with a recorded session.
+
+    Runs the body of the tracking loop synchronously so the result is
+    deterministic. Returns (events, stats) where events is a list of
+    {'frame', 'type', 'data'} dicts.
+    """
+    # Imported here so recording does not need MediaPipe
+    from modules.gesture_controller import GestureController
+
+    config = dict(config or {})
+    camera_config = dict(config.get('camera', {}))
+    camera_config.update({'replay': path, 'replay_realtime': realtime, 'replay_loop': False})
+    camera_config.pop('record', None)
+    config['camera'] = camera_config
+
+    events = []
+    frame_index = 0
+
+    def callback(event_type, data):
+        events.append({'frame': frame_index, 'type': event_type, 'data': data})
+
+    controller = GestureController(screen_width, screen_height, callback, config)
+    latencies = []
+    start = time.perf_counter()
+    try:
+        while True:
+            frame = controller.camera.get_frame()
+            if frame is None:
+                if controller.camera.finished:
+                    break
+                continue
+            frame_start = time.perf_counter()
+            controller._process_frame(frame)
+            latencies.append(time.perf_counter() - frame_start)
+            frame_index += 1
+    finally:
+        controller.stop()
+    duration = time.perf_counter() - start
+
+    latencies.sort()
+    stats = {
+        'frames': frame_index,
+        'duration_s': duration,
+        'fps': frame_index / duration if duration > 0 else 0.0,
+        'latency_ms_p50': percentile(latencies, 50) * 1000,
+        'latency_ms_p95': percentile(latencies, 95) * 1000,
+        'latency_ms_max': latencies[-1] * 1000 if latencies else 0.0,
+    }
+    return events, stats
+
+
+def run_trace(trace, config=None, screen_width=1920, screen_height=1080):
+    """Drive the gesture state machine from a landmark trace (path or LandmarkTrace).
+
+    Returns (events, stats) like run_replay.
+    """
+    from modules.gesture_controller import GestureController
+
+    if isinstance(trace, str):
+        trace = read_trace(trace)
+
+    events = []
+    frame_index = 0
+
+    def callback(event_type, data):
+        events.append({'frame': frame_index, 'type': event_type, 'data': data})
+
+    controller = GestureController(screen_width, screen_height, callback, config or {}, use_camera=False)
+    frame_shape = trace.frame_shape
+
+    start = time.perf_counter()
+    for timestamp, hands in zip(trace.timestamps, trace.frames):
+        controller._process_landmarks(hands, frame_shape, float(timestamp))
+        frame_index += 1
+    duration = time.perf_counter() - start
+
+    stats = {
+        'frames': frame_index,
+        'duration_s': duration,
+        'fps': frame_index / duration if duration > 0 else 0.0,
+    }
+    return events, stats
+
+
+def compare_events(actual, expected):
+    """Return a description of the first mismatch between two event logs, or None"""
+    for index, (got, want) in enumerate(zip(actual, expected)):
+        if got != want:
+            return f"event {index}: expected {want}, got {got}"
+    if len(actual) != len(expected):
+        return f"expected {len(expected)} events, got {len(actual)}"
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record/replay gesture sessions")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rec = sub.add_parser('record', help="record from the live camera")
+    rec.add_argument('path', help="output file (.npz or video)")
+    rec.add_argument('--seconds', type=float, default=10.0)
+    rec.add_argument('--width', type=int, default=640)
+    rec.add_argument('--height', type=int, default=480)
+    rec.add_argument('--oakd', action='store_true')
+
+    recover = sub.add_parser('recover', help="pack the spooled frames of an interrupted .npz recording")
+    recover.add_argument('path', help="the .npz path the recording was writing")
+
+    run = sub.add_parser('run', help="replay a session through GestureController")
+    run.add_argument('path', help="recorded .npz or video file")
+    run.add_argument('--realtime', action='store_true', help="pace frames at recorded speed")
+    run.add_argument('--config', help="config.json to take gesture settings from")
+    run.add_argument('--save-events', help="write the emitted events to a JSON file")
+    run.add_argument('--expect', help="compare emitted events against a JSON file")
+
+    trace = sub.add_parser('trace', help="replay a landmark trace through the gesture state machine")
+    trace.add_argument('path', help="landmark trace file")
+    trace.add_argument('--config', help="config.json to take gesture settings from")
+    trace.add_argument('--save-events', help="write the emitted events to a JSON file")
+    trace.add_argument('--expect', help="compare emitted events against a JSON file")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'record':
+        frames = record_session(args.path, args.seconds, args.width, args.height, args.oakd)
+        print(f"Recorded {frames} frames to {args.path}")
+        return 0
+
+    if args.command == 'recover':
+        frames = FrameRecorder.finish(args.path)
+        print(f"Recovered {frames} frames to {args.path}")
+        return 0
+
+    config = {}
+    if args.config:
+        with open(args.config, 'r') as f:
+            config = json.load(f)
+
+    if args.command == 'trace':
+        events, stats = run_trace(args.path, config)
+        print(f"Frames: {stats['frames']}  FPS: {stats['fps']:.1f}")
+    else:
+        events, stats = run_replay(args.path, config, realtime=args.realtime)
+        print(f"Frames: {stats['frames']}  FPS: {stats['fps']:.1f}  "
+              f"latency p50/p95/max: {stats['latency_ms_p50']:.2f}/"
+              f"{stats['latency_ms_p95']:.2f}/{stats['latency_ms_max']:.2f} ms")
+    print(f"Events: {len(events)}")
+
+    if args.save_events:
+        with open(args.save_events, 'w') as f:
+            json.dump(events, f, indent=1)
+
+    if args.expect:
+        with open(args.expect, 'r') as f:
+            expected = json.load(f)
+        mismatch = compare_events(events, expected)
+        if mismatch:
+            print(f"❌ Event mismatch: {mismatch}")
+            return 1
+        print("✅ Event sequence matches")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
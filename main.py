@@ -1,5 +1,7 @@
 import sys
+import os
 import json
+import tempfile
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QObject, pyqtSignal
 # Modules import / Modules ko import karein
@@ -11,10 +13,13 @@ from modules.news_service import NewsService
 from modules.calendar_service import CalendarService
 from modules.ai_assistant import AIAssistant
 from modules.command_processor import CommandProcessor # Import CommandProcessor
+from modules.metrics import MetricsServer
+from modules.presence_monitor import PresenceMonitor
 
 class SmartMirror(QObject):
     gesture_signal = pyqtSignal(str, object)
     voice_signal = pyqtSignal(str, object) # Signal for voice events
+    presence_signal = pyqtSignal(str) # Power state changes
 
     def __init__(self):
         super().__init__()
@@ -34,23 +39,32 @@ class SmartMirror(QObject):
         # Connect signal to handler for thread safety
         self.gesture_signal.connect(self.on_gesture_event)
         self.voice_signal.connect(self.on_voice_event) # Connect voice signal
+        self.presence_signal.connect(self.on_presence_change)
         
         screen = self.app.primaryScreen().geometry()
         self.screen_width = screen.width()
         self.screen_height = screen.height()
         
+        # Metrics endpoint (off unless metrics.enabled) / Metrics endpoint
+        self.metrics_server = MetricsServer(self.config)
+        self.metrics_server.start()
+        
         # Initialize Services / Services shuru karein
         print("Initializing services...")
         self.weather_service = WeatherService(self.config)
         self.news_service = NewsService(self.config)
         self.calendar_service = CalendarService(self.config)
         self.ai_assistant = AIAssistant(self.config)
+        self.ai_assistant.start() # Preload the model in the background
         
         # Initialize Command Processor / Command Processor shuru karein
         self.command_processor = CommandProcessor(self.config, self.ai_assistant, self.weather_service)
         self.command_processor.response_signal.connect(self.on_command_response)
         self.command_processor.action_signal.connect(self.on_command_action)
         
+        # Presence monitor (dims / low power when nobody is around)
+        self.presence = PresenceMonitor(self.config, self.presence_signal.emit)
+        
         # Initialize Gesture Control / Gesture control shuru karein
         print("Initializing gesture control...")
         self.gesture_controller = GestureController(
@@ -59,6 +73,7 @@ class SmartMirror(QObject):
             self.gesture_signal.emit,
             self.config
         )
+        self.gesture_controller.set_presence_monitor(self.presence)
         
         # Initialize Voice Control / Awaaz control shuru karein
         print("Initializing voice control...")
@@ -66,6 +81,7 @@ class SmartMirror(QObject):
             self.voice_signal.emit, # Use voice_signal.emit
             self.config
         )
+        self.voice_controller.set_presence_monitor(self.presence)
         
         
         print("Initializing UI...")
@@ -76,11 +92,15 @@ class SmartMirror(QObject):
             self.news_service,
             self.calendar_service,
             self.ai_assistant,
-            self.gesture_controller
+            self.gesture_controller,
+            self.config
         )
         
         
         self.ui_manager.set_gesture_controller(self.gesture_controller)
+        self.ui_manager.set_voice_controller(self.voice_controller)
+        if self.config.get('perf', {}).get('hud', False):
+            self.ui_manager.toggle_hud()
         
         
         self.gesture_controller.start()
@@ -95,54 +115,109 @@ class SmartMirror(QObject):
             self.ui_manager.show()
         
         print("Smart Mirror initialized successfully!")
-        print("Press F11 to toggle fullscreen, ESC to exit")
+        print("Press F11 to toggle fullscreen, F10 to calibrate gestures, F12 for the performance HUD, ESC to exit")
+    
+    def on_presence_change(self, state):
+        """Apply power state changes on the UI thread"""
+        self.ui_manager.set_power_state(state)
+        self.ai_assistant.set_in_use(state != 'away')
+        if state == 'away':
+            # Whoever comes next starts a new conversation
+            self.ai_assistant.end_session()
     
     def on_gesture_event(self, event_type, data):
         """Handle gesture events from the gesture controller"""
         if event_type == 'cursor_move':
-            self.ui_manager.update_cursor_position(data['x'], data['y'])
+            trace = data.get('trace')
+            if trace:
+                trace.mark('qt_dispatch')
+            self.ui_manager.update_cursor_position(data['x'], data['y'], trace, data.get('hand', 0))
         
         elif event_type == 'pinch_start':
-            self.ui_manager.handle_pinch_start(data['x'], data['y'])
+            self.ui_manager.handle_pinch_start(data['x'], data['y'], data.get('hand', 0))
         
         elif event_type == 'drag_start':
             self.ui_manager.handle_drag_start(
                 data['x'], data['y'],
-                data['start_x'], data['start_y']
+                data['start_x'], data['start_y'],
+                data.get('hand', 0)
             )
         
         elif event_type == 'drag_move':
             self.ui_manager.handle_drag_move(
                 data['x'], data['y'],
-                data['delta_x'], data['delta_y']
+                data['delta_x'], data['delta_y'],
+                data.get('hand', 0)
             )
         
         elif event_type == 'drag_end':
-            self.ui_manager.handle_drag_end(data['x'], data['y'])
+            self.ui_manager.handle_drag_end(data['x'], data['y'], data.get('hand', 0))
         
         elif event_type == 'click':
             self.ui_manager.handle_click(data['x'], data['y'])
         
+        elif event_type == 'resize_start':
+            self.ui_manager.handle_resize_start(data['x'], data['y'], data['hands'])
+        
+        elif event_type == 'resize_move':
+            self.ui_manager.handle_resize_move(data['scale'])
+        
+        elif event_type == 'resize_end':
+            self.ui_manager.handle_resize_end()
+        
+        elif event_type == 'swipe':
+            self.ui_manager.handle_swipe(data['direction'], data.get('hand', 0))
+        
+        elif event_type == 'scroll':
+            self.ui_manager.handle_scroll(data['steps'], data.get('hand', 0))
+        
+        elif event_type == 'calibration_target':
+            self.ui_manager.show_calibration_target(data['x'], data['y'], data['index'], data['total'])
+        
+        elif event_type == 'calibration_done':
+            self.ui_manager.hide_calibration()
+            self.config.setdefault('gestures', {})['calibration'] = data['calibration']
+            self.save_config()
+        
+        elif event_type == 'calibration_failed':
+            self.ui_manager.hide_calibration()
+        
+        elif event_type == 'hand_lost':
+            self.ui_manager.hide_hand_cursor(data['hand'])
+        
         elif event_type == 'voice_command':
             action = data.get('action')
             if action == 'show_weather':
                 # Focus weather widget
                 if 'weather' in self.ui_manager.widgets:
-                    self.ui_manager.widgets['weather'].raise_()
+                    self.ui_manager.raise_widget(self.ui_manager.widgets['weather'])
             elif action == 'show_clock':
                 if 'clock' in self.ui_manager.widgets:
-                    self.ui_manager.widgets['clock'].raise_()
+                    self.ui_manager.raise_widget(self.ui_manager.widgets['clock'])
             elif action == 'show_calendar':
                 if 'calendar' in self.ui_manager.widgets:
-                    self.ui_manager.widgets['calendar'].raise_()
+                    self.ui_manager.raise_widget(self.ui_manager.widgets['calendar'])
             elif action == 'show_news':
                 if 'news' in self.ui_manager.widgets:
-                    self.ui_manager.widgets['news'].raise_()
+                    self.ui_manager.raise_widget(self.ui_manager.widgets['news'])
             elif action == 'show_notes':
                 if 'notes' in self.ui_manager.widgets:
-                    self.ui_manager.widgets['notes'].raise_()
+                    self.ui_manager.raise_widget(self.ui_manager.widgets['notes'])
                     self.ui_manager.widgets['notes'].notes_text.setFocus()
     
+    def save_config(self):
+        """Write config.json atomically / Config file save karein"""
+        try:
+            fd, temp_path = tempfile.mkstemp(dir='.', prefix='.config.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.config, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, 'config.json')
+            print("Configuration saved")
+        except Exception as e:
+            print(f"Error saving config: {e}")
+    
     def run(self):
         """Start the application"""
         try:
@@ -187,6 +262,12 @@ class SmartMirror(QObject):
             self.gesture_controller.stop()
         if self.voice_controller:
             self.voice_controller.stop()
+        self.ai_assistant.stop()
+        self.ui_manager.layout_store.close()
+        self.metrics_server.stop()
+        if self.presence.enabled:
+            print("Presence CPU usage:")
+            self.presence.print_report()
         print("Cleanup complete")
 
 if __name__ == "__main__":
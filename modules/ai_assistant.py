@@ -1,108 +1,54 @@
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-
-try:
-    import google.generativeai as genai
-    GOOGLE_AVAILABLE = True
-except ImportError:
-    GOOGLE_AVAILABLE = False
+from modules.ai_providers import make_providers
+from modules.ai_router import AIRouter
+from modules.conversation import ConversationStore
 
 class AIAssistant:
     def __init__(self, config):
         """Initialize AI Assistant / AI Assistant shuru karein"""
         self.config = config
-        self.api_key = config.get('ai', {}).get('api_key', '')
-        self.model_name = config.get('ai', {}).get('model', 'gpt-3.5-turbo')
-        self.provider = config.get('ai', {}).get('provider', 'openai')
-        self.client = None
+        ai_config = config.get('ai', {})
         
-        if self.provider == 'google':
-             if not GOOGLE_AVAILABLE:
-                 print("⚠️ Google GenAI not available - Install 'google-generativeai'")
-                 return
-             if self.api_key and self.api_key != 'YOUR_OPENAI_API_KEY':
-                 try:
-                     genai.configure(api_key=self.api_key)
-                     self.model = genai.GenerativeModel('gemini-pro')
-                     self.client = True # Mark as active
-                     print("✅ Google Gemini Initialized")
-                 except Exception as e:
-                     print(f"Google AI error: {e}")
+        # Conversation memory / Guftagu yaad rakhein
+        self.memory = ConversationStore(ai_config.get('memory', {}))
         
-        elif self.provider == 'openai':
-            if not OPENAI_AVAILABLE:
-                print("⚠️ OpenAI not available - AI Assistant disabled")
-                return
-            
-            if self.api_key and self.api_key != 'YOUR_OPENAI_API_KEY':
-                try:
-                    openai.api_key = self.api_key
-                    self.client = openai
-                    print("✅ OpenAI Initialized")
-                except Exception as e:
-                    print(f"AI Assistant initialization error: {e}")
+        # One or more providers behind a router / Ek ya zyada providers
+        self.providers = make_providers(ai_config, self.memory)
+        self.provider = self.providers[0].name if self.providers else ai_config.get('provider', 'openai')
+        self.client = bool(self.providers)
+        self.router = AIRouter(self.providers, ai_config.get('routing', {}))
+        if len(self.providers) > 1:
+            print(f"✅ AI routing across: {', '.join(p.name for p in self.providers)}")
+    
+    @property
+    def is_ready(self):
+        """True when a query will not have to wait for a model load"""
+        return self.router.ready
+    
+    def start(self):
+        """Start preloading models in the background / Model background mein load karein"""
+        self.router.start()
+    
+    def stop(self):
+        self.router.stop()
     
-    def process_query(self, query):
+    def set_in_use(self, in_use):
+        """Someone is (not) at the mirror: keep local models warm only while they are"""
+        self.router.set_in_use(in_use)
+    
+    def process_query(self, query, session='default'):
         """Process a user query / User ka sawal hal karein"""
         if not self.client:
             return "AI Assistant not configured. Please add your API key."
         
+        conversation = self.memory.get(session) if self.memory.enabled else None
         try:
-            if self.provider == 'google':
-                 # System Prompt for Richard Persona / Richard ka kirdaar
-                 system_prompt = (
-                     "You are Richard, a helpful smart mirror assistant. "
-                     "Answer directly and naturally. "
-                     "Do NOT say 'The AI says' or 'Here is the response'. "
-                     "Be concise."
-                 )
-                 full_prompt = f"{system_prompt}\nUser: {query}\nRichard:"
-                 
-                 response = self.model.generate_content(full_prompt)
-                 return response.text
-                 
-            elif self.provider == 'openai':
-                response = self.client.ChatCompletion.create(
-                    model=self.model_name,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful smart mirror assistant."},
-                        {"role": "user", "content": query}
-                    ],
-                    max_tokens=150
-                )
-                return response.choices[0].message.content
-                
-            elif self.provider == 'ollama':
-                import requests
-                import json
-                
-                url = self.config.get('ai', {}).get('api_url', 'http://localhost:11434/api/generate')
-                # Use model from config, default to llama3 as requested
-                model = self.config.get('ai', {}).get('model', 'llama3') 
-                
-                # System Prompt for Richard Persona (Ollama)
-                system_prompt = "You are Richard, a concise helpful assistant. Answer directly in first person and never say 'AI response'."
-                
-                # Construct payload as per user snippet
-                payload = {
-                    "model": model,
-                    "prompt": f"System: {system_prompt}\nUser: {query}\nAssistant:",
-                    "stream": False, # Ensure non-streaming for simple parsing
-                    "max_tokens": 512,
-                    "temperature": 0.2
-                }
-                
-                try:
-                    response = requests.post(url, json=payload, timeout=60)
-                    response.raise_for_status()
-                    data = response.json()
-                    # Parse response as per user snippet (result or response or content)
-                    return data.get("response", data.get("result", data.get("content", ""))).strip()
-                except Exception as e:
-                    return f"Ollama Connection Error: {e}"
+            name, reply, context = self.router.ask(conversation, query)
         except Exception as e:
             return f"Error: {str(e)}"
-
+        if conversation is not None:
+            self.memory.add_exchange(conversation, query, reply, context, name)
+        return reply
+    
+    def end_session(self, session='default'):
+        """Forget a conversation / Guftagu bhool jayein"""
+        self.memory.end(session)
@@ -0,0 +1,253 @@
+import abc
+import json
+from modules import metrics
+from modules.conversation import estimate_tokens, transcript
+from modules.ollama_warmer import OllamaWarmer
+
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+try:
+    import google.generativeai as genai
+    GOOGLE_AVAILABLE = True
+except ImportError:
+    GOOGLE_AVAILABLE = False
+
+LLM_PROMPT_TOKENS = metrics.histogram(
+    'mirror_llm_prompt_tokens', 'Prompt tokens sent per AI request (estimated)', ['provider'],
+    buckets=(64, 128, 256, 512, 1024, 2048, 4096)
+)
+
+
+class Provider(abc.ABC):
+    """One AI backend. ask() returns (reply, ollama_context) or raises.
+
+    on_token is called once the first part of the reply has arrived;
+    backends that do not stream call it with the whole reply.
+    """
+    kind = None
+
+    def __init__(self, name, config, memory):
+        self.name = name
+        self.config = config
+        self.memory = memory
+        self.api_key = config.get('api_key', '')
+        self.client = None
+
+    @property
+    def ready(self):
+        """True when a query will not have to wait for a model load"""
+        return bool(self.client)
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def set_in_use(self, in_use):
+        pass
+
+    @abc.abstractmethod
+    def ask(self, conversation, query, on_token):
+        """(reply, ollama_context) for query, calling on_token at the first token"""
+
+    def _has_key(self):
+        return self.api_key and self.api_key != 'YOUR_OPENAI_API_KEY'
+
+    def _messages(self, conversation, system_prompt, query):
+        """System prompt, remembered turns (fitted to the token budget) and the query"""
+        if conversation is None:
+            return [{"role": "system", "content": system_prompt}, {"role": "user", "content": query}]
+        self.memory.fit(conversation, system_prompt, query)
+        return self.memory.messages(conversation, system_prompt, query)
+
+
+class GoogleProvider(Provider):
+    kind = 'google'
+
+    def __init__(self, name, config, memory):
+        super().__init__(name, config, memory)
+        if not GOOGLE_AVAILABLE:
+            print("⚠️ Google GenAI not available - Install 'google-generativeai'")
+            return
+        if self._has_key():
+            try:
+                genai.configure(api_key=self.api_key)
+                self.model = genai.GenerativeModel('gemini-pro')
+                self.client = True # Mark as active
+                print("✅ Google Gemini Initialized")
+            except Exception as e:
+                print(f"Google AI error: {e}")
+
+    def ask(self, conversation, query, on_token):
+        # System Prompt for Richard Persona / Richard ka kirdaar
+        system_prompt = (
+            "You are Richard, a helpful smart mirror assistant. "
+            "Answer directly and naturally. "
+            "Do NOT say 'The AI says' or 'Here is the response'. "
+            "Be concise."
+        )
+        full_prompt = transcript(self._messages(conversation, system_prompt, query), "Richard")
+        LLM_PROMPT_TOKENS.labels(self.name).observe(estimate_tokens(full_prompt))
+
+        response = self.model.generate_content(full_prompt)
+        on_token()
+        return response.text, None
+
+
+class OpenAIProvider(Provider):
+    kind = 'openai'
+
+    def __init__(self, name, config, memory):
+        super().__init__(name, config, memory)
+        self.model_name = config.get('model', 'gpt-3.5-turbo')
+        if not OPENAI_AVAILABLE:
+            print("⚠️ OpenAI not available - AI Assistant disabled")
+            return
+        if self._has_key():
+            try:
+                openai.api_key = self.api_key
+                self.client = openai
+                print("✅ OpenAI Initialized")
+            except Exception as e:
+                print(f"AI Assistant initialization error: {e}")
+
+    def ask(self, conversation, query, on_token):
+        messages = self._messages(conversation, "You are a helpful smart mirror assistant.", query)
+        LLM_PROMPT_TOKENS.labels(self.name).observe(
+            sum(estimate_tokens(message['content']) for message in messages)
+        )
+        response = self.client.ChatCompletion.create(
+            model=self.model_name,
+            messages=messages,
+            max_tokens=150,
+            api_key=self.api_key
+        )
+        on_token()
+        return response.choices[0].message.content, None
+
+
+class OllamaProvider(Provider):
+    kind = 'ollama'
+
+    def __init__(self, name, config, memory):
+        super().__init__(name, config, memory)
+        self.url = config.get('api_url', 'http://localhost:11434/api/generate')
+        # Use model from config, default to llama3 as requested
+        self.model_name = config.get('model', 'llama3')
+        self.keep_alive = config.get('keep_alive', '30m')
+        self.timeout = config.get('timeout_s', 60)
+        self.warmer = None
+        # Local server, nothing to authenticate
+        self.client = True
+        print(f"✅ Ollama configured ({self.name})")
+        # Preload and keepalive / Model pehle se load rakhein
+        warm_config = config.get('warm', {})
+        if warm_config.get('enabled', True):
+            self.warmer = OllamaWarmer(self.url, self.model_name, self.keep_alive, warm_config)
+
+    @property
+    def ready(self):
+        if self.warmer:
+            return self.warmer.ready
+        return True
+
+    def start(self):
+        if self.warmer:
+            self.warmer.start()
+
+    def stop(self):
+        if self.warmer:
+            self.warmer.stop()
+
+    def set_in_use(self, in_use):
+        if self.warmer:
+            self.warmer.set_in_use(in_use)
+
+    def ask(self, conversation, query, on_token):
+        """Ollama /api/generate, continuing from the session's token context when it has one"""
+        import requests
+
+        # System Prompt for Richard Persona (Ollama)
+        system_prompt = "System: You are Richard, a concise helpful assistant. Answer directly in first person and never say 'AI response'."
+
+        payload = {
+            "model": self.model_name,
+            "stream": True, # Streamed so the router sees the first token
+            "keep_alive": self.keep_alive,  # keep the model (and its KV cache) loaded between turns
+            "options": {"num_predict": 512, "temperature": 0.2},
+        }
+        num_ctx = self.config.get('num_ctx')
+        if num_ctx:
+            payload["options"]["num_ctx"] = num_ctx
+
+        messages = self._messages(conversation, system_prompt, query)
+        if conversation is not None and conversation.ollama_context and conversation.context_source == self.name:
+            # This server already holds everything said so far: send only the new turn
+            payload["context"] = conversation.ollama_context
+            payload["prompt"] = f"User: {query}\nAssistant:"
+        else:
+            payload["prompt"] = transcript(messages, "Assistant")
+        LLM_PROMPT_TOKENS.labels(self.name).observe(estimate_tokens(payload["prompt"]))
+
+        try:
+            with requests.post(self.url, json=payload, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                parts = []
+                context = None
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    if data.get("error"):
+                        raise RuntimeError(data["error"])
+                    # Parse response as per user snippet (result or response or content)
+                    part = data.get("response", data.get("result", data.get("content", "")))
+                    if part:
+                        if not parts:
+                            on_token()
+                        parts.append(part)
+                    if data.get("done"):
+                        context = data.get("context")
+                        break
+        except Exception as e:
+            raise ConnectionError(f"Ollama Connection Error: {e}") from e
+        on_token()
+        if self.warmer:
+            self.warmer.touch()
+        return ''.join(parts).strip(), context
+
+
+PROVIDERS = {
+    'google': GoogleProvider,
+    'openai': OpenAIProvider,
+    'ollama': OllamaProvider,
+}
+
+
+def make_providers(ai_config, memory):
+    """Providers from ai.providers (a list), or the single ai.provider.
+
+    Each entry inherits the ai.* settings it does not set itself.
+    """
+    shared = {key: value for key, value in ai_config.items() if key != 'providers'}
+    entries = ai_config.get('providers') or [{}]
+    providers = []
+    for entry in entries:
+        entry = dict(shared, **entry)
+        kind = entry.get('provider', 'openai')
+        cls = PROVIDERS.get(kind)
+        if cls is None:
+            print(f"⚠️ Unknown AI provider '{kind}' - skipped")
+            continue
+        name = entry.get('name', kind)
+        if any(provider.name == name for provider in providers):
+            name = f"{name}-{len(providers) + 1}"
+        provider = cls(name, entry, memory)
+        if provider.client:
+            providers.append(provider)
+    return providers
@@ -0,0 +1,262 @@
+"""Routes AI queries across several providers.
+
+Providers are tried fastest first, by the median of their recent response
+times (so an occasional stall does not demote a provider for good). One
+that has not answered yet goes first, in configured order, and so does one
+passed over probe_after times in a row, to refresh its numbers. If the
+chosen provider has not produced its first token within the hedge
+deadline, the next one is asked as well and whichever answers first wins
+(the slower answer is dropped, but its time still counts). A provider that
+fails failure_threshold times in a row is skipped for cooldown_s, then gets
+a single trial request (circuit breaker).
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from modules import metrics
+
+LLM_SECONDS = metrics.histogram(
+    'mirror_llm_request_seconds', 'AI assistant request latency', ['provider'],
+    buckets=(0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 60.0)
+)
+LLM_FIRST_TOKEN_SECONDS = metrics.histogram(
+    'mirror_llm_first_token_seconds', 'Time until a provider produced its first token', ['provider'],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0)
+)
+LLM_ERRORS = metrics.counter('mirror_llm_errors_total', 'AI assistant request failures', ['provider'])
+LLM_HEDGES = metrics.counter('mirror_llm_hedged_requests_total', 'Requests also sent to a backup provider', ['provider'])
+LLM_WINS = metrics.counter('mirror_llm_answers_total', 'Answers used, by the provider that gave them', ['provider'])
+BREAKER_OPEN = metrics.gauge('mirror_llm_breaker_open', 'Provider skipped after repeated failures (1 = open)', ['provider'])
+
+
+class NoProviderAvailable(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """closed -> open after `threshold` failures in a row -> one trial after `cooldown` seconds"""
+
+    def __init__(self, threshold=3, cooldown=30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return 'half_open'
+        return 'open'
+
+    def available(self):
+        """May a request be sent now (without claiming the half-open trial)"""
+        state = self.state
+        return state == 'closed' or (state == 'half_open' and not self.trial_running)
+
+    def claim(self):
+        """Reserve a request; in half-open state only one is let through"""
+        state = self.state
+        if state == 'closed':
+            return True
+        if state == 'half_open' and not self.trial_running:
+            self.trial_running = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+
+    def record_failure(self):
+        """Returns True when this failure opened the breaker"""
+        self.failures += 1
+        was_open = self.opened_at is not None
+        if was_open or self.failures >= self.threshold:
+            # A failed trial starts a new cooldown
+            self.opened_at = time.monotonic()
+            self.trial_running = False
+            return not was_open
+        return False
+
+
+class Route:
+    """A provider with its breaker and latency history"""
+
+    def __init__(self, provider, breaker, history=20):
+        self.provider = provider
+        self.name = provider.name
+        self.breaker = breaker
+        self.latencies = deque(maxlen=history)  # whole-answer times
+        self.first_tokens = deque(maxlen=history)
+        self.passed_over = 0
+
+    def record_latency(self, seconds, first_token):
+        self.latencies.append(seconds)
+        if first_token is not None:
+            self.first_tokens.append(first_token)
+
+    @property
+    def latency(self):
+        """Median recent answer time, None before the first answer"""
+        return _quantile(self.latencies, 0.5)
+
+    def first_token_p90(self):
+        return _quantile(self.first_tokens, 0.9)
+
+
+def _quantile(values, share):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))]
+
+
+class AIRouter:
+    def __init__(self, providers, config=None):
+        config = config or {}
+        self.hedge = config.get('hedge', True)
+        self.hedge_after = config.get('hedge_after_s')  # None: from the provider's first-token times
+        self.hedge_min = config.get('hedge_min_s', 0.5)
+        self.hedge_max = config.get('hedge_max_s', 4.0)
+        self.max_in_flight = config.get('max_in_flight', 2)
+        self.probe_after = config.get('probe_after', 20)
+        self.routes = [
+            Route(provider, CircuitBreaker(config.get('failure_threshold', 3), config.get('cooldown_s', 30.0)))
+            for provider in providers
+        ]
+        self.lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=max(2, len(self.routes) * 2), thread_name_prefix='ai-route')
+        for route in self.routes:
+            BREAKER_OPEN.labels(route.name).set(0)
+
+    def order(self):
+        """Usable routes, fastest first (untried or long-unused ones ahead of the rest)"""
+        with self.lock:
+            usable = [(index, route) for index, route in enumerate(self.routes) if route.breaker.available()]
+            ranked = [
+                (route.latency is not None and route.passed_over < self.probe_after, route.latency or 0.0, index, route)
+                for index, route in usable
+            ]
+        ranked.sort(key=lambda item: item[:3])
+        return [item[3] for item in ranked]
+
+    @property
+    def ready(self):
+        """True when a usable provider can answer without loading a model first"""
+        return any(route.provider.ready for route in self.order())
+
+    def hedge_deadline(self, route):
+        """Seconds to wait for route's first token before asking the next provider"""
+        if self.hedge_after is not None:
+            return self.hedge_after
+        p90 = route.first_token_p90()
+        if p90 is None:
+            return self.hedge_max
+        return min(self.hedge_max, max(self.hedge_min, p90 * 1.5))
+
+    def ask(self, conversation, query):
+        """Returns (provider name, reply, ollama_context) from the first provider to answer"""
+        candidates = self.order()
+        if not candidates:
+            raise NoProviderAvailable("No AI provider available")
+        with self.lock:
+            candidates[0].passed_over = 0
+            for route in candidates[1:]:
+                route.passed_over += 1
+
+        in_flight = {}  # future -> (route, first token event)
+        errors = []
+
+        def launch(hedged=False):
+            while candidates:
+                route = candidates.pop(0)
+                with self.lock:
+                    claimed = route.breaker.claim()
+                if not claimed:
+                    continue
+                if hedged:
+                    LLM_HEDGES.labels(route.name).inc()
+                first_token = threading.Event()
+                future = self.pool.submit(self._call, route, conversation, query, first_token)
+                in_flight[future] = (route, first_token)
+                return True
+            return False
+
+        launch()
+        while in_flight:
+            timeout = None
+            if self.hedge and candidates and len(in_flight) < self.max_in_flight:
+                # Hedge only while nothing in flight has started answering
+                if not any(event.is_set() for _, event in in_flight.values()):
+                    newest_route = list(in_flight.values())[-1][0]
+                    timeout = self.hedge_deadline(newest_route)
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if any(event.is_set() for _, event in in_flight.values()):
+                    continue
+                launch(hedged=True)
+                continue
+            for future in done:
+                route, _ = in_flight.pop(future)
+                try:
+                    reply, context = future.result()
+                except Exception as e:
+                    errors.append(f"{route.name}: {e}")
+                    if not in_flight:
+                        launch()  # fail over to the next provider
+                    continue
+                LLM_WINS.labels(route.name).inc()
+                return route.name, reply, context
+        raise NoProviderAvailable('; '.join(errors) or "No AI provider available")
+
+    def _call(self, route, conversation, query, first_token):
+        """Run one provider request, recording its latency and health"""
+        start = time.perf_counter()
+        first_token_seconds = []
+
+        def on_token():
+            if not first_token.is_set():
+                first_token_seconds.append(time.perf_counter() - start)
+                first_token.set()
+
+        try:
+            result = route.provider.ask(conversation, query, on_token)
+        except Exception:
+            LLM_ERRORS.labels(route.name).inc()
+            with self.lock:
+                opened = route.breaker.record_failure()
+            if opened:
+                BREAKER_OPEN.labels(route.name).set(1)
+                print(f"⚠️ AI provider '{route.name}' failing, skipping it for {route.breaker.cooldown:.0f}s")
+            raise
+        seconds = time.perf_counter() - start
+        LLM_SECONDS.labels(route.name).observe(seconds)
+        if first_token_seconds:
+            LLM_FIRST_TOKEN_SECONDS.labels(route.name).observe(first_token_seconds[0])
+        with self.lock:
+            was_open = route.breaker.opened_at is not None
+            route.breaker.record_success()
+            route.record_latency(seconds, first_token_seconds[0] if first_token_seconds else None)
+        if was_open:
+            BREAKER_OPEN.labels(route.name).set(0)
+            print(f"✅ AI provider '{route.name}' is answering again")
+        return result
+
+    def start(self):
+        for route in self.routes:
+            route.provider.start()
+
+    def stop(self):
+        for route in self.routes:
+            route.provider.stop()
+        self.pool.shutdown(wait=False)
+
+    def set_in_use(self, in_use):
+        for route in self.routes:
+            route.provider.set_in_use(in_use)
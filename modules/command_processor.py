@@ -1,7 +1,14 @@
 import webbrowser
 import datetime
 import os
+import threading
+import time
 from PyQt6.QtCore import QObject, pyqtSignal
+from modules import metrics
+
+COMMANDS = metrics.counter('mirror_commands_total', 'Commands processed by intent', ['intent'])
+COMMAND_SECONDS = metrics.histogram('mirror_command_seconds', 'Command processing time including AI calls')
+AI_ACKS = metrics.counter('mirror_ai_cold_acks_total', 'Spoken acknowledgements given while the AI model was loading')
 
 class CommandProcessor(QObject):
     # Signals to update UI / UI update karne ke liye signals
@@ -13,29 +20,47 @@ class CommandProcessor(QObject):
         self.config = config
         self.ai_assistant = ai_assistant
         self.weather_service = weather_service
+        self.ack_when_cold = config.get('ai', {}).get('warm', {}).get('ack', True)
+        # AI questions run off the UI thread, one at a time so answers keep their order
+        self.ai_lock = threading.Lock()
+        self.ai_threads = []
         
     def process(self, text):
         """Process user text and determine action / User ki baat samajhna"""
+        start_time = time.perf_counter()
+        intent = self._handle(text, start_time)
+        COMMANDS.labels(intent).inc()
+        if intent not in ('ai', 'screen'):
+            # AI intents observe their time when the answer arrives
+            COMMAND_SECONDS.observe(time.perf_counter() - start_time)
+
+    def wait(self, timeout=None):
+        """Wait for AI questions still being answered (tests and shutdown)"""
+        for thread in list(self.ai_threads):
+            thread.join(timeout)
+
+    def _handle(self, text, start_time=None):
+        """Run the matching command and return its intent name / Command chalayein"""
         text = text.lower().strip()
         print(f"DEBUG: Processing '{text}'")
         
         # 1. Greetings / Salam dua
         if any(word in text for word in ['hello', 'hi', 'hey']):
             self._respond(text, "Hello! How can I help you?", "HiMirror: Hello!")
-            return
+            return 'greeting'
 
         # 2. Time & Date / Waqt aur Tareekh
         if 'time' in text:
             now = datetime.datetime.now().strftime("%I:%M %p")
             self._respond(text, f"It is currently {now}", f"Time: {now}")
             self.action_signal.emit('show_clock', None)
-            return
+            return 'time'
             
         if 'date' in text or 'day' in text:
             now = datetime.datetime.now().strftime("%A, %B %d, %Y")
             self._respond(text, f"Today is {now}", f"Date: {now}")
             self.action_signal.emit('show_calendar', None)
-            return
+            return 'date'
 
         # 3. Weather / Mausam
         if 'weather' in text or 'temperature' in text:
@@ -59,22 +84,22 @@ class CommandProcessor(QObject):
                 self._respond(text, speech_text, display_text)
             else:
                 self._respond(text, "Checking the weather for you...", "Checking Weather...")
-            return
+            return 'weather'
 
         # 4. Website Commands / Websites kholna
         if 'open' in text:
             if 'youtube' in text:
                 self._open_website("https://youtube.com", "Opening YouTube...")
                 self._respond(text, "Opening YouTube", "Opening YouTube...")
-                return
+                return 'open_website'
             elif 'google' in text:
                 self._open_website("https://google.com", "Opening Google...")
                 self._respond(text, "Opening Google", "Opening Google...")
-                return
+                return 'open_website'
             elif 'news' in text:
                 self.action_signal.emit('show_news', None)
                 self._respond(text, "Here is the latest news", "Opening News...")
-                return
+                return 'news'
 
         # 5. Smart Home (Mock) / Smart Home control
         if 'light' in text or 'lamp' in text:
@@ -82,7 +107,7 @@ class CommandProcessor(QObject):
                 self._respond(text, "Turning on the lights", "Lights: ON")
             elif 'off' in text:
                 self._respond(text, "Turning off the lights", "Lights: OFF")
-            return
+            return 'smart_home'
 
         # 6. Notes / Notes likhna aur parhna
         note_triggers = ['write note', 'add note', 'take note', 'note:']
@@ -92,14 +117,14 @@ class CommandProcessor(QObject):
                 if note_content:
                     self.action_signal.emit('add_note', note_content)
                     self._respond(text, "Note saved", "Note Saved")
-                    return
+                    return 'add_note'
                 else:
                     self._respond(text, "What should I write?", "Empty Note")
-                    return
+                    return 'add_note'
         
         if 'show notes' in text or 'read notes' in text:
             self.action_signal.emit('read_notes', None)
-            return
+            return 'read_notes'
             
         # 7. Screen Context / Screen par kya hai
         if 'screen' in text or 'display' in text or 'showing' in text:
@@ -112,20 +137,39 @@ class CommandProcessor(QObject):
             )
             # Ask AI to describe it naturally
             if self.ai_assistant:
-                response = self.ai_assistant.process_query(f"User asked: '{text}'. Context: {context}. Answer naturally as Richard.")
-                self._respond(text, response, response) # Show actual response, not placeholder
+                # Show actual response, not placeholder
+                self._ask_ai(text, f"User asked: '{text}'. Context: {context}. Answer naturally as Richard.", start_time)
             else:
                 self._respond(text, context, "Displaying Clock, Weather, News...")
-            return
+            return 'screen'
 
         # 7. AI Fallback / AI Jawab dega
         if text and self.ai_assistant:
             # Send to AI Assistant
-            response = self.ai_assistant.process_query(text)
-            self._respond(text, response, response) # Show actual response text
+            self._ask_ai(text, text, start_time)
+            return 'ai'
         elif text:
             self._respond(text, "I'm not sure how to help with that yet.", "Unknown Command")
+        return 'unknown'
     
+    def _ask_ai(self, text, query, start_time=None):
+        """Answer with the AI on a worker thread, acknowledging first if the model is still loading
+        Model load ho raha ho to pehle jawab dein; asal jawab alag thread se aata hai"""
+        if self.ack_when_cold and not self.ai_assistant.is_ready:
+            AI_ACKS.inc()
+            self._respond(text, "One moment, let me think about that.", "Thinking...")
+        start_time = start_time or time.perf_counter()
+        thread = threading.Thread(target=self._answer, args=(text, query, start_time), daemon=True)
+        self.ai_threads = [t for t in self.ai_threads if t.is_alive()] + [thread]
+        thread.start()
+
+    def _answer(self, text, query, start_time):
+        # response_signal is delivered to the UI thread by Qt (queued connection)
+        with self.ai_lock:
+            response = self.ai_assistant.process_query(query)
+        self._respond(text, response, response) # Show actual response text
+        COMMAND_SECONDS.observe(time.perf_counter() - start_time)
+
     def _respond(self, user_text, speech_text, display_text):
         """Send response to UI and TTS / Jawab dena"""
         self.response_signal.emit(user_text, display_text)
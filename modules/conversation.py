@@ -0,0 +1,161 @@
+"""Per-session conversation memory for the AI assistant.
+
+Each session keeps its turns and fits them into a token budget when a
+prompt is built: recent turns are kept verbatim, older ones are folded into
+a short running summary. Compaction cuts the history to half the budget in
+one go, so the prompt prefix stays identical for the next several turns and
+a local model keeps reusing its KV cache; with Ollama the session also
+keeps the token context Ollama returns and only sends the new turn.
+
+Tokens are estimated at about four characters each; Ollama's context
+length gives the exact count for its sessions.
+"""
+import re
+import threading
+import time
+
+from modules import metrics
+
+COMPACTIONS = metrics.counter('mirror_llm_history_compactions_total', 'Conversation histories folded into a summary')
+
+
+def estimate_tokens(text):
+    """Rough token count (about 4 characters per token)"""
+    return max(1, (len(text) + 3) // 4)
+
+
+def _clip_words(text, count):
+    words = text.split()
+    return ' '.join(words[:count]) + (' ...' if len(words) > count else '')
+
+
+def _first_sentence(text, max_words=20):
+    sentence = re.split(r'(?<=[.!?])\s', text.strip(), maxsplit=1)[0]
+    return _clip_words(sentence, max_words)
+
+
+class Conversation:
+    """Turns, summary and cached model context of one session"""
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.turns = []  # [role, text, tokens]
+        self.summary = ''
+        self.ollama_context = None  # Ollama token ids for everything said so far
+        self.context_source = None  # the provider that returned them
+        self.last_active = time.monotonic()
+
+    def history_tokens(self):
+        return estimate_tokens(self.summary) + sum(tokens for _, _, tokens in self.turns)
+
+
+class ConversationStore:
+    """Conversations by session id, expired after session_timeout_s of silence"""
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.enabled = config.get('enabled', True)
+        self.max_tokens = config.get('max_context_tokens', 1024)
+        self.summary_tokens = config.get('summary_tokens', 160)
+        self.session_timeout = config.get('session_timeout_s', 300)
+        self.use_ollama_context = config.get('ollama_context', True)
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def get(self, session_id='default'):
+        """The session's conversation; a new one after the timeout"""
+        now = time.monotonic()
+        with self.lock:
+            conversation = self.sessions.get(session_id)
+            if conversation is None or now - conversation.last_active > self.session_timeout:
+                conversation = Conversation(session_id)
+                self.sessions[session_id] = conversation
+            conversation.last_active = now
+            return conversation
+
+    def end(self, session_id='default'):
+        """Forget a session (e.g. the user walked away)"""
+        with self.lock:
+            self.sessions.pop(session_id, None)
+
+    def add_exchange(self, conversation, query, reply, ollama_context=None, source=None):
+        """Record a completed question/answer pair (source: the provider that answered)"""
+        with self.lock:
+            conversation.turns.append(['user', query, estimate_tokens(query)])
+            conversation.turns.append(['assistant', reply, estimate_tokens(reply)])
+            conversation.ollama_context = ollama_context if self.use_ollama_context else None
+            conversation.context_source = source
+            conversation.last_active = time.monotonic()
+
+    def fit(self, conversation, system_prompt, query):
+        """Compact the history if system prompt + history + query exceed the budget.
+
+        Returns True when the history changed (any cached prefix is stale).
+        """
+        with self.lock:
+            fixed = estimate_tokens(system_prompt) + estimate_tokens(query)
+            used = fixed + conversation.history_tokens()
+            if conversation.ollama_context is not None:
+                used = max(used, len(conversation.ollama_context) + estimate_tokens(query))
+            if used <= self.max_tokens:
+                return False
+
+            # Keep whole exchanges, newest first, in half the budget
+            summary_budget = min(self.summary_tokens, self.max_tokens // 4)
+            keep = self.max_tokens // 2 - fixed - summary_budget
+            dropped = []
+            turns = conversation.turns
+            while turns and sum(t[2] for t in turns) > keep:
+                dropped.extend(turns[:2])
+                del turns[:2]
+            conversation.summary = self._summarize(conversation.summary, dropped, summary_budget)
+            conversation.ollama_context = None
+            COMPACTIONS.inc()
+            return True
+
+    def _summarize(self, summary, dropped, max_tokens):
+        """Fold dropped turns into the running summary (extractive, no model call)"""
+        notes = []
+        for role, text, _ in dropped:
+            if role == 'user':
+                notes.append(f"User asked: {_clip_words(text, 12)}")
+            else:
+                notes.append(f"You answered: {_first_sentence(text)}")
+        summary = ' '.join(filter(None, [summary] + notes))
+        # When the summary outgrows its share keep its opening (who the user
+        # is, what the chat is about) and the most recent part
+        max_chars = max_tokens * 4
+        if len(summary) > max_chars:
+            head = summary[:max_chars // 3 + 5]
+            if ' ... ' in head:
+                head = head.split(' ... ', 1)[0]
+            else:
+                head = head[:max_chars // 3].rsplit(' ', 1)[0]
+            tail = summary[-(max_chars - len(head) - 5):].split(' ', 1)[-1]
+            summary = f"{head} ... {tail}"
+        return summary
+
+    def messages(self, conversation, system_prompt, query):
+        """Chat messages: system prompt (+ summary), the kept turns, then the query"""
+        with self.lock:
+            system = system_prompt
+            if conversation.summary:
+                system += f"\nEarlier in this conversation: {conversation.summary}"
+            messages = [{"role": "system", "content": system}]
+            messages.extend({"role": role, "content": text} for role, text, _ in conversation.turns)
+            messages.append({"role": "user", "content": query})
+            return messages
+
+
+def transcript(messages, assistant_name='Assistant'):
+    """Plain-text prompt for completion-style models, ending with the assistant's cue"""
+    lines = []
+    for message in messages:
+        if message['role'] == 'system':
+            lines.append(message['content'])
+        elif message['role'] == 'user':
+            lines.append(f"User: {message['content']}")
+        else:
+            lines.append(f"{assistant_name}: {message['content']}")
+    lines.append(f"{assistant_name}:")
+    return '\n'.join(lines)
@@ -1,55 +1,132 @@
 import cv2
-import mediapipe as mp
 import threading
 import time
 import math
 from gestures.camera import CameraSystem
+from gestures.hand_detector import MediaPipeHandDetector
+from gestures.oakd_hands import OakdHandDetector
+from gestures.landmark_trace import LandmarkTraceWriter
+from gestures.hand_tracker import HandTracker
+from gestures.gesture_recognizer import GestureRecognizer
+from gestures.calibration import TARGETS, Calibration, CursorMapping
+from gestures.depth import KEY_INDEX, KEY_KNUCKLE, KEY_THUMB, KEY_WRIST, DepthGate
+from modules.latency_tracer import LatencyTracer
+from modules import metrics
+
+CAMERA_FRAMES = metrics.counter('mirror_camera_frames_total', 'Camera frames run through hand tracking')
+SKIPPED_FRAMES = metrics.counter('mirror_camera_skipped_frames_total', 'Camera reads that returned no frame')
+INFERENCE_SECONDS = metrics.histogram(
+    'mirror_hand_inference_seconds', 'Hand landmark inference latency',
+    buckets=(0.005, 0.01, 0.02, 0.03, 0.05, 0.075, 0.1, 0.2, 0.5)
+)
+GESTURE_EVENTS = metrics.counter('mirror_gesture_events_total', 'Gesture events emitted', ['type'])
+DEPTH_REJECTED_HANDS = metrics.counter(
+    'mirror_depth_rejected_hands_total', 'Hands dropped for being outside the depth band'
+)
+DEPTH_SKIPPED_INFERENCE = metrics.counter(
+    'mirror_depth_skipped_inference_total', 'Frames with nobody in the depth band (no inference run)'
+)
 
 
 class GestureController:
-    def __init__(self, screen_width, screen_height, callback, config):
+    def __init__(self, screen_width, screen_height, callback, config, use_camera=True):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.callback = callback
         self.config = config
+        self.camera = None
+        self.detector = None
+        self.depth_gate = None
+        gesture_config = config.get('gestures', {})
+        self.max_hands = gesture_config.get('max_hands', 2)
         
         # Camera setup / Camera ki settings
+        # use_camera=False builds only the gesture state machine (landmark trace replay)
         camera_config = config.get('camera', {})
-        self.camera = CameraSystem(
-            use_oakd=camera_config.get('use_oakd', False),
-            width=camera_config.get('width', 640),
-            height=camera_config.get('height', 480)
-        )
+        if use_camera:
+            self.camera = CameraSystem(
+                use_oakd=camera_config.get('use_oakd', False),
+                width=camera_config.get('width', 640),
+                height=camera_config.get('height', 480),
+                replay_path=camera_config.get('replay'),
+                replay_realtime=camera_config.get('replay_realtime', True),
+                replay_loop=camera_config.get('replay_loop', False),
+                record_path=camera_config.get('record'),
+                oakd_hands=camera_config.get('oakd_hands'),
+                max_hands=self.max_hands,
+                oakd_depth=camera_config.get('oakd_depth'),
+                device=camera_config.get('device', camera_config.get('device_id', 0)),
+                capture=camera_config
+            )
+            
+            # Hand detector: on the OAK-D itself, or MediaPipe on the host
+            # Haath pehchanne wala: OAK-D par ya MediaPipe se
+            if self.camera.on_device_hands:
+                self.detector = OakdHandDetector(self.camera.q_hands, self.camera.frame_shape)
+            else:
+                self.detector = MediaPipeHandDetector(self.max_hands)
+                self.detector.rgb_input = self.camera.rgb
+            
+            # Distance band from OAK-D stereo depth / Depth se faasle ki had
+            if self.camera.q_depth is not None:
+                self.depth_gate = DepthGate(
+                    camera_config.get('oakd_depth'), self.camera.depth_intrinsics, self.camera.depth_crop
+                )
         
-        # MediaPipe setup / MediaPipe start karein
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
+        # Landmark trace recorder, opened on the first frame / Landmark recorder
+        self.trace_path = camera_config.get('record_landmarks')
+        self.trace_writer = None
+        
+        # Latency tracing (off unless perf.latency_trace) / Latency tracing
+        self.tracer = LatencyTracer(config)
+        self.frame_trace = None
+        
+        # Presence / low-power mode / Mojoodgi aur kam bijli mode
+        presence_config = config.get('presence', {})
+        self.presence = None
+        self.low_power = False
+        self.low_power_delay = 1.0 / presence_config.get('low_power_fps', 5)
+        self.low_power_size = (
+            presence_config.get('low_power_width', 320),
+            presence_config.get('low_power_height', 240)
         )
-        self.mp_draw = mp.solutions.drawing_utils
+        self.motion_threshold = presence_config.get('motion_threshold', 4.0)
+        self.prev_motion_frame = None
+        
+        # Counters for the performance HUD / HUD ke liye ginti
+        self.stats = {
+            'frames': 0,
+            'skipped_frames': 0,
+            'cursor_events': 0,
+            'inference_ms': 0.0
+        }
         
         # State management / State sambhalna
         self.running = False
         self.thread = None
+        # Max-speed replay runs the loop without the idle sleep
+        replay_max_speed = self.camera and self.camera.replay_path and not self.camera.replay_realtime
+        self.loop_delay = 0.0 if replay_max_speed else 0.01
+        
+        # Per-hand cursor and pinch state, identity kept across frames
+        # Har haath ki apni cursor aur pinch state
+        self.hand_tracker = HandTracker(self.max_hands, on_lost=self._release_hand)
+        # Pinch thresholds in palm sizes (thumb-index gap / wrist-knuckle
+        # length), so they hold at any resolution or distance. Engaging needs
+        # a tighter gap than releasing, and both must hold for pinch_frames.
+        self.pinch_engage = gesture_config.get('pinch_engage', 0.35)
+        self.pinch_release = gesture_config.get('pinch_release', 0.5)
+        self.pinch_frames = gesture_config.get('pinch_frames', 2)
         
-        # Cursor state / Cursor ki halat
-        self.cursor_x = screen_width // 2
-        self.cursor_y = screen_height // 2
-        self.prev_index_x = 0
-        self.prev_index_y = 0
+        # Pose / swipe / scroll recognition / Haath ke ishare pehchanna
+        self.recognizer = GestureRecognizer(gesture_config) if gesture_config.get('recognizer', True) else None
         
-        # Pinch state machine / Pinch state machine
-        self.pinch_state = 'idle'  # idle, pinching, dragging
-        self.pinch_threshold = 50  # pixels distance
-        self.dragged_widget = None
-        self.drag_start_x = 0
-        self.drag_start_y = 0
+        # Two-hand pinch-to-resize / Do haathon se resize
+        self.resize_hands = None
+        self.resize_start_distance = 0.0
         
         # Smoothing / Smoothing factor
-        self.smoothing_factor = config.get('gestures', {}).get('smoothing', 0.5)
+        self.smoothing_factor = gesture_config.get('smoothing', 0.5)
         
         # Window bounds
         self.widget_bounds = {
@@ -58,50 +135,104 @@ class GestureController:
             'width': screen_width,
             'height': screen_height
         }
+        
+        # Camera-to-screen mapping (calibrated zone/homography) / Calibration
+        self.mapping = CursorMapping(gesture_config.get('calibration'))
+        self.mapping.set_bounds(0, 0, screen_width, screen_height)
+        self.calibration = None
+    
+    def set_presence_monitor(self, presence):
+        """Report hands/motion to a PresenceMonitor and follow its power state"""
+        self.presence = presence
     
     def set_widget_bounds(self, x, y, width, height):
         """Set the bounds of the widget area / Widget area ki hadood set karein"""
         self.widget_bounds = {'x': x, 'y': y, 'width': width, 'height': height}
+        self.mapping.set_bounds(x, y, width, height)
+    
+    def start_calibration(self):
+        """Ask the user to point at and pinch on each calibration target"""
+        self.calibration = Calibration()
+        print("🎯 Calibration started")
+        self._emit_calibration_target()
+    
+    def _emit_calibration_target(self):
+        target_x, target_y = TARGETS[self.calibration.target_index]
+        self._emit('calibration_target', {
+            'x': int(self.widget_bounds['x'] + target_x * self.widget_bounds['width']),
+            'y': int(self.widget_bounds['y'] + target_y * self.widget_bounds['height']),
+            'index': self.calibration.target_index,
+            'total': len(TARGETS)
+        })
     
+    def _record_calibration_point(self, hand):
+        """A pinch during calibration records where the hand is pointing"""
+        calibration = self.calibration
+        calibration.add_point(hand.camera_u, hand.camera_v)
+        if not calibration.done:
+            self._emit_calibration_target()
+            return
+        self.calibration = None
+        result = calibration.result()
+        if result is None:
+            self._emit('calibration_failed', {})
+            return
+        self.mapping.set_calibration(result)
+        print(f"🎯 Calibration done, interaction zone {result['zone']}")
+        self._emit('calibration_done', {'calibration': result})
+
     def _is_point_in_bounds(self, x, y):
         """Check if point is within widget bounds / Check karein kya point hadood mein hai"""
         return (self.widget_bounds['x'] <= x <= self.widget_bounds['x'] + self.widget_bounds['width'] and
                 self.widget_bounds['y'] <= y <= self.widget_bounds['y'] + self.widget_bounds['height'])
     
-    def _calculate_cursor_position(self, index_x, index_y, frame_width, frame_height):
-        """Calculate cursor position from hand landmark / Cursor ki position hisaab karein"""
-        # Normalize to 0-1 range
-        normalized_x = 1.0 - (index_x / frame_width)
-        normalized_y = index_y / frame_height
+    def _calculate_cursor_position(self, hand, index_x, index_y, frame_width, frame_height):
+        """Calculate a hand's cursor position from its landmark / Cursor ki position hisaab karein"""
+        # Normalize to 0-1 range (mirrored)
+        hand.camera_u = 1.0 - (index_x / frame_width)
+        hand.camera_v = index_y / frame_height
         
-        # Map to screen coordinates
-        screen_x = self.widget_bounds['x'] + (normalized_x * self.widget_bounds['width'])
-        screen_y = self.widget_bounds['y'] + (normalized_y * self.widget_bounds['height'])
+        # Map to screen coordinates through the calibrated matrix
+        screen_x, screen_y = self.mapping.map(hand.camera_u, hand.camera_v)
         
-        # Apply smoothing
-        self.cursor_x = self.cursor_x * (1 - self.smoothing_factor) + screen_x * self.smoothing_factor
-        self.cursor_y = self.cursor_y * (1 - self.smoothing_factor) + screen_y * self.smoothing_factor
+        # Apply smoothing (a new hand starts where it is)
+        if hand.cursor_x is None:
+            cursor_x, cursor_y = screen_x, screen_y
+        else:
+            cursor_x = hand.cursor_x * (1 - self.smoothing_factor) + screen_x * self.smoothing_factor
+            cursor_y = hand.cursor_y * (1 - self.smoothing_factor) + screen_y * self.smoothing_factor
         
         # Clamp to bounds
-        self.cursor_x = max(self.widget_bounds['x'], 
-                           min(self.widget_bounds['x'] + self.widget_bounds['width'] - 1, self.cursor_x))
-        self.cursor_y = max(self.widget_bounds['y'], 
-                           min(self.widget_bounds['y'] + self.widget_bounds['height'] - 1, self.cursor_y))
+        hand.cursor_x = max(self.widget_bounds['x'], 
+                            min(self.widget_bounds['x'] + self.widget_bounds['width'] - 1, cursor_x))
+        hand.cursor_y = max(self.widget_bounds['y'], 
+                            min(self.widget_bounds['y'] + self.widget_bounds['height'] - 1, cursor_y))
         
-        return self.cursor_x, self.cursor_y
+        return hand.cursor_x, hand.cursor_y
     
-    def _detect_pinch(self, hand_landmarks):
-        """Detect pinch gesture / Pinch gesture pehchanein"""
-        thumb = hand_landmarks.landmark[4]
-        index = hand_landmarks.landmark[8]
-        
-        distance = math.sqrt(
-            (thumb.x - index.x) ** 2 + (thumb.y - index.y) ** 2
-        )
+    def _detect_pinch(self, hand, points, aspect):
+        """Debounced pinch with hysteresis / Pinch gesture pehchanein"""
+        if hand.metric is not None:
+            # True 3D distances from depth: a hand turned edge-on to the
+            # camera no longer closes the gap in the image
+            m = hand.metric
+            palm_size = math.dist(m[KEY_WRIST].tolist(), m[KEY_KNUCKLE].tolist())
+            gap = math.dist(m[KEY_THUMB].tolist(), m[KEY_INDEX].tolist()) / max(palm_size, 1e-6)
+        else:
+            (thumb_x, thumb_y), (index_x, index_y) = points[[4, 8], :2].tolist()
+            (wrist_x, wrist_y), (knuckle_x, knuckle_y) = points[[0, 9], :2].tolist()
+            palm_size = math.hypot((knuckle_x - wrist_x) * aspect, knuckle_y - wrist_y)
+            gap = math.hypot((thumb_x - index_x) * aspect, thumb_y - index_y) / max(palm_size, 1e-6)
         
-        pixel_distance = distance * 640
-        is_pinching = pixel_distance < self.pinch_threshold
-        return is_pinching, pixel_distance
+        threshold = self.pinch_release if hand.pinching else self.pinch_engage
+        if (gap < threshold) != hand.pinching:
+            hand.pinch_frames += 1
+            if hand.pinch_frames >= self.pinch_frames:
+                hand.pinching = not hand.pinching
+                hand.pinch_frames = 0
+        else:
+            hand.pinch_frames = 0
+        return hand.pinching, gap
     
     def start(self):
         """Start gesture tracking / Tracking shuru karein"""
@@ -116,100 +247,320 @@ class GestureController:
             self.camera.release()
         if self.thread:
             self.thread.join(timeout=2)
+        if self.detector:
+            self.detector.close()
+        if self.trace_writer:
+            self.trace_writer.close()
+            self.trace_writer = None
+        if self.tracer.enabled:
+            self.tracer.print_summary()
+            self.tracer.export_chrome_trace()
     
     def get_cursor_position(self):
-        """Get current cursor position / Cursor ki mojuda jagah lein"""
-        return {'x': int(self.cursor_x), 'y': int(self.cursor_y)}
+        """Get the first tracked hand's cursor position / Cursor ki mojuda jagah lein"""
+        for hand in self.hand_tracker.active_states():
+            if hand.cursor_x is not None:
+                return {'x': int(hand.cursor_x), 'y': int(hand.cursor_y)}
+        return {'x': self.screen_width // 2, 'y': self.screen_height // 2}
     
     def _track_loop(self):
         """Main tracking loop / Bunyadi tracking loop"""
         while self.running:
+            if self.presence:
+                self.presence.tick()
+                self._update_power_mode()
+            
+            trace = self.tracer.begin_frame()
             frame = self.camera.get_frame()
-            if frame is None:
+            # On-device detection needs no host frame (the preview is optional)
+            if frame is None and self.detector.needs_frame:
+                if self.camera.finished:
+                    print("⏹️ Replay finished")
+                    self.running = False
+                    break
+                if not self.camera.connected:
+                    # Camera unplugged: it reconnects with backoff, no need to spin
+                    time.sleep(0.1)
+                    continue
                 # print("⚠️ No frame captured")
+                self.stats['skipped_frames'] += 1
+                SKIPPED_FRAMES.inc()
                 time.sleep(0.01)
                 continue
             
-            frame = cv2.flip(frame, 1)
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if self.presence and frame is not None and self._detect_motion(frame):
+                self.presence.report_activity('motion')
+            
+            if self.low_power:
+                # Nobody around: motion check only, no host hand inference.
+                # On-device hands cost the host nothing, so they keep feeding
+                # presence (with preview off there is no frame to diff)
+                if self.presence and not self.detector.needs_frame and self._device_hand_seen():
+                    self.presence.report_activity('hand')
+                time.sleep(self.low_power_delay)
+                continue
             
-            results = self.hands.process(frame_rgb)
+            if trace:
+                trace.mark('capture')
+            self.frame_trace = trace
+            if not self._process_frame(frame):
+                # Nothing new from the device yet: not a frame worth tracing
+                self.frame_trace = None
             
-            if results.multi_hand_landmarks:
-                for hand_landmarks in results.multi_hand_landmarks:
-                    self._process_hand(hand_landmarks, frame.shape)
+            # Frames that did not hand a cursor_move to the UI end here
+            if self.frame_trace:
+                self.frame_trace.finish()
+                self.frame_trace = None
+
+            if self.loop_delay:
+                time.sleep(self.loop_delay)
+
+    def _device_hand_seen(self):
+        """Drain the on-device results queue: True if any pending frame had a hand / Device par haath dekha?"""
+        seen = False
+        while True:
+            hands = self.detector.detect()
+            if hands is None:
+                return seen
+            seen = seen or bool(hands)
+
+    def _update_power_mode(self):
+        """Switch the camera between normal and low-power capture"""
+        low_power = self.presence.state == 'away'
+        if low_power != self.low_power:
+            self.low_power = low_power
+            self.prev_motion_frame = None
+            width, height = self.low_power_size
+            self.camera.set_low_power(low_power, width, height, round(1.0 / self.low_power_delay))
+    
+    def _detect_motion(self, frame):
+        """Cheap frame-difference motion check on a tiny grayscale copy"""
+        small = cv2.resize(frame, (64, 48), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY if self.camera.rgb else cv2.COLOR_BGR2GRAY)
+        previous = self.prev_motion_frame
+        self.prev_motion_frame = gray
+        if previous is None:
+            return False
+        return cv2.absdiff(gray, previous).mean() > self.motion_threshold
+    
+    def _process_frame(self, frame):
+        """Run hand tracking on a single camera frame / Ek frame par tracking chalayein
+        
+        Returns False if the detector had no new result (on-device detection).
+        """
+        depth = self.camera.get_depth() if self.depth_gate else None
+        inference_seconds = 0.0
+        if depth is not None and self.detector.needs_frame and self.depth_gate.use_roi:
+            # Host inference only on the part of the frame inside the depth band
+            roi = self.depth_gate.roi(depth)
+            if roi is None:
+                hands = []
+                DEPTH_SKIPPED_INFERENCE.inc()
             else:
-                if self.pinch_state != 'idle':
-                   self._reset_pinch_state()
+                hands = self.detector.detect(frame, self.frame_trace, roi)
+                inference_seconds = self.detector.inference_seconds
+        else:
+            hands = self.detector.detect(frame, self.frame_trace)
+            if hands is None:
+                return False
+            inference_seconds = self.detector.inference_seconds
+        inference_ms = inference_seconds * 1000
+        self.stats['frames'] += 1
+        CAMERA_FRAMES.inc()
+        INFERENCE_SECONDS.observe(inference_seconds)
+        self.stats['inference_ms'] += (inference_ms - self.stats['inference_ms']) * 0.1
+        if self.frame_trace:
+            self.frame_trace.mark('inference')
+        
+        # Hands are (21, 3) arrays from here on
+        timestamp = time.monotonic()
+        frame_shape = self.detector.frame_shape or frame.shape
+        metric = None
+        if depth is not None and hands:
+            count = len(hands)
+            hands, metric = self.depth_gate.filter(hands, depth)
+            if len(hands) < count:
+                DEPTH_REJECTED_HANDS.inc(count - len(hands))
+        
+        if self.trace_path:
+            if self.trace_writer is None:
+                self.trace_writer = LandmarkTraceWriter(self.trace_path, frame_shape[1], frame_shape[0])
+            self.trace_writer.write(timestamp, hands)
+        
+        if self.camera:
+            self.camera.report_hands(len(hands))
+        self._process_landmarks(hands, frame_shape, timestamp, metric)
+        return True
+
+    def _process_landmarks(self, hands, frame_shape, timestamp=None, metric=None):
+        """Feed detected hands ((21, 3) arrays) into the gesture state machine / Haathon ko state machine mein bhejein
+        
+        metric optionally holds each hand's depth key points (gestures/depth.py).
+        """
+        if hands and self.presence:
+            self.presence.report_activity('hand')
+        
+        # Lost hands are released (drag_end, hand_lost) inside update()
+        matched = self.hand_tracker.update(hands, metric)
+        for hand, points in matched:
+            self._process_hand(hand, points, frame_shape)
+        
+        self._update_two_hand_resize()
+        
+        for hand, _ in matched:
+            if hand.in_bounds:
+                self._handle_pinch_state(hand, hand.pinching, hand.cursor_x, hand.cursor_y)
+        
+        if self.recognizer:
+            if timestamp is None:
+                timestamp = time.monotonic()
+            aspect = frame_shape[1] / frame_shape[0]
+            for hand, points in matched:
+                busy = hand.pinch_state != 'idle' or not hand.in_bounds
+                for event_type, data in self.recognizer.update(hand.slot, points, timestamp, aspect, busy):
+                    self._emit(event_type, data)
 
-            time.sleep(0.01)
+    def _emit(self, event_type, data):
+        """Send a gesture event to the UI / UI ko gesture event bhejein"""
+        GESTURE_EVENTS.labels(event_type).inc()
+        self.callback(event_type, data)
 
-    def _process_hand(self, hand_landmarks, frame_shape):
-        """Process detected hand / Pakray gaye haath ko process karein"""
-        index_tip = hand_landmarks.landmark[8]
+    def _process_hand(self, hand, points, frame_shape):
+        """Move a hand's cursor and read its pinch / Haath ka cursor aur pinch"""
+        index_x, index_y = points[8, :2].tolist()
         frame_height, frame_width = frame_shape[:2]
         
         cursor_x, cursor_y = self._calculate_cursor_position(
-            index_tip.x * frame_width,
-            index_tip.y * frame_height,
+            hand,
+            index_x * frame_width,
+            index_y * frame_height,
             frame_width,
             frame_height
         )
         
-        if self._is_point_in_bounds(cursor_x, cursor_y):
-            self.callback('cursor_move', {'x': int(cursor_x), 'y': int(cursor_y)})
+        hand.in_bounds = self._is_point_in_bounds(cursor_x, cursor_y)
+        if hand.in_bounds:
+            data = {'x': int(cursor_x), 'y': int(cursor_y), 'hand': hand.slot}
+            # Hand the frame trace to the UI so it can mark dispatch and paint
+            trace = self.frame_trace
+            if trace:
+                trace.mark('filtering')
+                data['trace'] = trace
+                self.frame_trace = None
+            self._emit('cursor_move', data)
+            self.stats['cursor_events'] += 1
+            if trace:
+                trace.mark('signal_emit')
             
-            is_pinching, _ = self._detect_pinch(hand_landmarks)
-            self._handle_pinch_state(is_pinching, cursor_x, cursor_y)
+            self._detect_pinch(hand, points, frame_width / frame_height)
         else:
-            self._reset_pinch_state()
+            hand.pinching = False
+            hand.pinch_frames = 0
+            self._reset_pinch_state(hand)
+
+    def _update_two_hand_resize(self):
+        """Two pinching hands resize a widget by their change in distance"""
+        if self.resize_hands:
+            first, second = self.resize_hands
+            if first.active and second.active and first.pinching and second.pinching:
+                self._emit('resize_move', {
+                    'x': int((first.cursor_x + second.cursor_x) / 2),
+                    'y': int((first.cursor_y + second.cursor_y) / 2),
+                    'scale': self._hand_distance(first, second) / self.resize_start_distance
+                })
+                return
+            # One hand let go: the other is ignored until it releases too
+            self.resize_hands = None
+            self._emit('resize_end', {})
+            print("↔️ Two-hand resize finished")
+            return
+        
+        pinching = [hand for hand in self.hand_tracker.active_states() if hand.in_bounds and hand.pinching]
+        if len(pinching) < 2 or self.calibration:
+            return
+        first, second = pinching[:2]
+        distance = self._hand_distance(first, second)
+        if distance < 1:
+            return
+        self.resize_hands = (first, second)
+        self.resize_start_distance = distance
+        for hand in (first, second):
+            hand.pinch_state = 'resizing'
+        self._emit('resize_start', {
+            'x': int((first.cursor_x + second.cursor_x) / 2),
+            'y': int((first.cursor_y + second.cursor_y) / 2),
+            'hands': [first.slot, second.slot]
+        })
+        print("↔️ Two-hand resize started")
+
+    @staticmethod
+    def _hand_distance(first, second):
+        return math.hypot(first.cursor_x - second.cursor_x, first.cursor_y - second.cursor_y)
 
-    def _handle_pinch_state(self, is_pinching, cursor_x, cursor_y):
-        """Manage pinch state transitions / Pinch state sambhalna"""
-        if is_pinching and self.pinch_state == 'idle':
-            self.pinch_state = 'pinching'
-            self.drag_start_x = cursor_x
-            self.drag_start_y = cursor_y
-            self.callback('pinch_start', {'x': int(cursor_x), 'y': int(cursor_y)})
+    def _handle_pinch_state(self, hand, is_pinching, cursor_x, cursor_y):
+        """Manage a hand's pinch state transitions / Pinch state sambhalna"""
+        if hand.pinch_state in ('resizing', 'calibrating'):
+            if not is_pinching:
+                hand.pinch_state = 'idle'
+            
+        elif is_pinching and hand.pinch_state == 'idle' and self.calibration:
+            hand.pinch_state = 'calibrating'
+            self._record_calibration_point(hand)
+            
+        elif is_pinching and hand.pinch_state == 'idle':
+            hand.pinch_state = 'pinching'
+            hand.drag_start_x = cursor_x
+            hand.drag_start_y = cursor_y
+            self._emit('pinch_start', {'x': int(cursor_x), 'y': int(cursor_y), 'hand': hand.slot})
             print(f"✋ Pinch detected at ({int(cursor_x)}, {int(cursor_y)})")
             
-        elif is_pinching and self.pinch_state == 'pinching':
+        elif is_pinching and hand.pinch_state == 'pinching':
             move_distance = math.sqrt(
-                (cursor_x - self.drag_start_x) ** 2 + 
-                (cursor_y - self.drag_start_y) ** 2
+                (cursor_x - hand.drag_start_x) ** 2 + 
+                (cursor_y - hand.drag_start_y) ** 2
             )
             if move_distance > 10:
-                self.pinch_state = 'dragging'
-                self.callback('drag_start', {
+                hand.pinch_state = 'dragging'
+                self._emit('drag_start', {
                     'x': int(cursor_x),
                     'y': int(cursor_y),
-                    'start_x': int(self.drag_start_x),
-                    'start_y': int(self.drag_start_y)
+                    'start_x': int(hand.drag_start_x),
+                    'start_y': int(hand.drag_start_y),
+                    'hand': hand.slot
                 })
                 
-        elif is_pinching and self.pinch_state == 'dragging':
-            self.callback('drag_move', {
+        elif is_pinching and hand.pinch_state == 'dragging':
+            self._emit('drag_move', {
                 'x': int(cursor_x),
                 'y': int(cursor_y),
-                'delta_x': int(cursor_x - self.drag_start_x),
-                'delta_y': int(cursor_y - self.drag_start_y)
+                'delta_x': int(cursor_x - hand.drag_start_x),
+                'delta_y': int(cursor_y - hand.drag_start_y),
+                'hand': hand.slot
             })
             
-        elif not is_pinching and self.pinch_state != 'idle':
-            was_dragging = (self.pinch_state == 'dragging')
-            self.pinch_state = 'idle'
-            self.dragged_widget = None
+        elif not is_pinching and hand.pinch_state != 'idle':
+            was_dragging = (hand.pinch_state == 'dragging')
+            hand.pinch_state = 'idle'
             
             if was_dragging:
-                self.callback('drag_end', {'x': int(cursor_x), 'y': int(cursor_y)})
+                self._emit('drag_end', {'x': int(cursor_x), 'y': int(cursor_y), 'hand': hand.slot})
                 print(f"👆 Pinch released after drag")
             else:
-                self.callback('click', {'x': int(cursor_x), 'y': int(cursor_y)})
+                self._emit('click', {'x': int(cursor_x), 'y': int(cursor_y), 'hand': hand.slot})
                 print(f"👆 Pinch released (click)")
 
-    def _reset_pinch_state(self):
-        """Reset pinch state safely / Pinch state reset karein"""
-        if self.pinch_state != 'idle':
-            self.pinch_state = 'idle'
-            self.dragged_widget = None
-            self.callback('drag_end', {'x': int(self.cursor_x), 'y': int(self.cursor_y)})
+    def _reset_pinch_state(self, hand):
+        """Reset a hand's pinch state safely / Pinch state reset karein"""
+        if hand.pinch_state in ('resizing', 'calibrating'):
+            hand.pinch_state = 'idle'  # a resize itself ends in _update_two_hand_resize
+        elif hand.pinch_state != 'idle':
+            hand.pinch_state = 'idle'
+            self._emit('drag_end', {'x': int(hand.cursor_x), 'y': int(hand.cursor_y), 'hand': hand.slot})
+
+    def _release_hand(self, hand):
+        """A hand left the frame: end its pinch and hide its cursor"""
+        hand.pinching = False
+        self._reset_pinch_state(hand)
+        if self.recognizer:
+            self.recognizer.reset(hand.slot)
+        self._emit('hand_lost', {'hand': hand.slot})
@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+from collections import deque
+
+# Pipeline stages in order; each span runs from the previous mark to this one
+STAGES = ('capture', 'color_convert', 'inference', 'filtering', 'signal_emit', 'qt_dispatch', 'paint')
+STAGE_INDEX = {name: index for index, name in enumerate(STAGES)}
+
+# Chrome trace "threads" so the gesture and UI halves show as separate rows
+GESTURE_TID = 1
+UI_TID = 2
+UI_STAGES = ('qt_dispatch', 'paint')
+
+
+class FrameTrace:
+    """Monotonic timestamps for one camera frame as it moves through the pipeline"""
+    __slots__ = ('tracer', 'frame_id', 'start', 'times')
+
+    def __init__(self, tracer, frame_id):
+        self.tracer = tracer
+        self.frame_id = frame_id
+        self.start = time.perf_counter()
+        self.times = [None] * len(STAGES)
+
+    def mark(self, stage):
+        """Record the end of a stage / Stage khatam hone ka waqt likhein"""
+        self.times[STAGE_INDEX[stage]] = time.perf_counter()
+
+    def finish(self):
+        """Hand the completed trace back to the tracer"""
+        self.tracer.record(self)
+
+
+class LatencyTracer:
+    """Collects per-frame spans from camera capture to cursor paint.
+
+    Disabled by default; when off begin_frame() returns None and callers
+    skip all marks, so the cost is a single attribute check per frame.
+    """
+
+    def __init__(self, config):
+        perf_config = config.get('perf', {})
+        self.enabled = perf_config.get('latency_trace', False)
+        self.export_path = perf_config.get('trace_export', 'latency_trace.json')
+        max_frames = perf_config.get('trace_max_frames', 5000)
+
+        self.lock = threading.Lock()
+        self.next_frame_id = 0
+        self.frames = deque(maxlen=max_frames)
+        self.durations = {stage: deque(maxlen=max_frames) for stage in STAGES + ('total',)}
+
+    def begin_frame(self):
+        """Start tracing a new frame, or None when tracing is off"""
+        if not self.enabled:
+            return None
+        with self.lock:
+            frame_id = self.next_frame_id
+            self.next_frame_id += 1
+        return FrameTrace(self, frame_id)
+
+    def record(self, trace):
+        """Turn a finished trace into spans and add them to the histograms"""
+        spans = []
+        previous = trace.start
+        for stage, timestamp in zip(STAGES, trace.times):
+            if timestamp is None:
+                continue
+            # Marks from different threads can land slightly out of order
+            timestamp = max(timestamp, previous)
+            spans.append((stage, previous, timestamp - previous))
+            previous = timestamp
+
+        with self.lock:
+            self.frames.append((trace.frame_id, spans))
+            for stage, _, duration in spans:
+                self.durations[stage].append(duration)
+            self.durations['total'].append(previous - trace.start)
+
+    def summary(self):
+        """Return {stage: {'count', 'p50', 'p95', 'p99'}} in milliseconds"""
+        result = {}
+        with self.lock:
+            snapshot = {stage: sorted(values) for stage, values in self.durations.items() if values}
+        for stage, values in snapshot.items():
+            result[stage] = {
+                'count': len(values),
+                'p50': percentile(values, 50) * 1000,
+                'p95': percentile(values, 95) * 1000,
+                'p99': percentile(values, 99) * 1000,
+            }
+        return result
+
+    def print_summary(self):
+        summary = self.summary()
+        if not summary:
+            return
+        print("⏱️ Latency (ms)      p50     p95     p99   count")
+        for stage in STAGES + ('total',):
+            if stage in summary:
+                s = summary[stage]
+                print(f"   {stage:<14} {s['p50']:7.2f} {s['p95']:7.2f} {s['p99']:7.2f} {s['count']:7d}")
+
+    def export_chrome_trace(self, path=None):
+        """Write recorded frames as Chrome trace JSON (chrome://tracing, Perfetto)"""
+        path = path or self.export_path
+        with self.lock:
+            frames = list(self.frames)
+
+        events = []
+        for frame_id, spans in frames:
+            for stage, start, duration in spans:
+                events.append({
+                    'name': stage,
+                    'cat': 'frame',
+                    'ph': 'X',
+                    'ts': start * 1e6,
+                    'dur': duration * 1e6,
+                    'pid': 1,
+                    'tid': UI_TID if stage in UI_STAGES else GESTURE_TID,
+                    'args': {'frame': frame_id}
+                })
+
+        try:
+            with open(path, 'w') as f:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+            print(f"💾 Latency trace exported to {path}")
+        except Exception as e:
+            print(f"Error exporting latency trace: {e}")
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of an ascending list (0.0 when empty)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percent / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
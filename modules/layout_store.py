@@ -0,0 +1,116 @@
+import json
+import os
+import queue
+import tempfile
+import threading
+from PyQt6.QtCore import QObject, QTimer
+
+
+class LayoutStore(QObject):
+    """In-memory widget layout with debounced, atomic writes to disk.
+
+    Position/size updates only touch a dict on the GUI thread. A single-shot
+    timer coalesces bursts (e.g. every drag frame) into one write, which is
+    done by a background thread via temp file + rename so a crash never
+    leaves a half-written file.
+    """
+
+    def __init__(self, path, debounce_ms=500):
+        super().__init__()
+        self.path = path
+        self.layout = self._read()
+        self.dirty = False
+
+        self.debounce_timer = QTimer()
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce_ms)
+        self.debounce_timer.timeout.connect(self.flush)
+
+        # Writer thread only ever writes the latest snapshot it receives
+        self.write_queue = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer.start()
+
+    def _read(self):
+        """Load the saved layout, or an empty one"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                layout = json.load(f)
+            return layout if isinstance(layout, dict) else {}
+        except Exception as e:
+            print(f"Error loading widget positions: {e}")
+            return {}
+
+    def get(self, widget_name):
+        """Saved layout for a widget: dict with x/y and optionally width/height"""
+        return self.layout.get(widget_name)
+
+    def set_position(self, widget_name, x, y):
+        entry = self.layout.setdefault(widget_name, {})
+        if entry.get('x') == x and entry.get('y') == y:
+            return
+        entry['x'] = x
+        entry['y'] = y
+        self._mark_dirty()
+
+    def set_size(self, widget_name, width, height):
+        entry = self.layout.setdefault(widget_name, {})
+        if entry.get('width') == width and entry.get('height') == height:
+            return
+        entry['width'] = width
+        entry['height'] = height
+        self._mark_dirty()
+
+    def _mark_dirty(self):
+        self.dirty = True
+        self.debounce_timer.start()  # restarting pushes the write back
+
+    def flush(self):
+        """Hand the current layout to the writer thread now"""
+        self.debounce_timer.stop()
+        if not self.dirty:
+            return
+        self.dirty = False
+        snapshot = {name: dict(entry) for name, entry in self.layout.items()}
+        self.write_queue.put(snapshot)
+
+    def close(self):
+        """Flush pending changes and wait for the writer to finish"""
+        if self.writer is None:
+            return
+        self.flush()
+        self.write_queue.put(None)
+        self.writer.join(timeout=2)
+        self.writer = None
+
+    def _write_loop(self):
+        while True:
+            snapshot = self.write_queue.get()
+            # Skip stale snapshots if several were queued
+            while snapshot is not None and not self.write_queue.empty():
+                newer = self.write_queue.get()
+                if newer is None:
+                    self._write(snapshot)
+                    return
+                snapshot = newer
+            if snapshot is None:
+                return
+            self._write(snapshot)
+
+    def _write(self, snapshot):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.widget_positions.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(snapshot, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Error saving widget positions: {e}")
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
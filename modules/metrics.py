@@ -0,0 +1,242 @@
+"""Minimal Prometheus-style metrics and an embedded /metrics HTTP endpoint.
+
+Metrics are module-level objects updated from any thread; the server runs
+on its own daemon thread and only reads them, so scrapes never touch the
+Qt main loop.
+"""
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Metric:
+    kind = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.children = {}
+
+    def labels(self, *values):
+        """Return the child metric for a set of label values"""
+        values = tuple(str(v) for v in values)
+        child = self.children.get(values)
+        if child is None:
+            with self.lock:
+                child = self.children.setdefault(values, self._new_child())
+        return child
+
+    def _label_text(self, values, extra=None):
+        pairs = list(zip(self.labelnames, values))
+        if extra:
+            pairs.append(extra)
+        if not pairs:
+            return ''
+        body = ','.join(f'{k}="{_escape(v)}"' for k, v in pairs)
+        return '{' + body + '}'
+
+    def _samples(self):
+        if not self.labelnames:
+            return [((), self._default())]
+        return list(self.children.items())
+
+    def _default(self):
+        return self.labels()
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in self._samples():
+            lines.extend(self._expose_child(values, child))
+        return lines
+
+
+class _Value:
+    __slots__ = ('value', 'lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1.0):
+        with self.lock:
+            self.value += amount
+
+    def set(self, value):
+        self.value = value
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount=1.0):
+        self.labels().inc(amount)
+
+    def _expose_child(self, values, child):
+        return [f"{self.name}{self._label_text(values)} {_format(child.value)}"]
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def set(self, value):
+        self.labels().set(value)
+
+
+class _HistogramValue:
+    __slots__ = ('buckets', 'counts', 'total', 'count', 'lock')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.total += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value):
+        self.labels().observe(value)
+
+    def _expose_child(self, values, child):
+        with child.lock:
+            counts = list(child.counts)
+            total, count = child.total, child.count
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += bucket_count
+            le = '+Inf' if bound == float('inf') else _format(bound)
+            lines.append(f"{self.name}_bucket{self._label_text(values, ('le', le))} {cumulative}")
+        lines.append(f"{self.name}_sum{self._label_text(values)} {_format(total)}")
+        lines.append(f"{self.name}_count{self._label_text(values)} {count}")
+        return lines
+
+
+class Registry:
+    """Holds metrics by name; registering the same name twice returns the original"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.metrics = {}
+
+    def _register(self, cls, name, documentation, labelnames=(), **kwargs):
+        with self.lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self.metrics[name] = metric
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def expose(self):
+        """Render all metrics in Prometheus text format"""
+        with self.lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.expose())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+counter = REGISTRY.counter
+gauge = REGISTRY.gauge
+histogram = REGISTRY.histogram
+
+# Shared by the API-backed widget services (news, weather), labelled by service
+SERVICE_CACHE_HITS = counter('mirror_service_cache_hits_total', 'Service reads served from cache', ['service'])
+SERVICE_FETCHES = counter('mirror_service_fetches_total', 'Service API fetches', ['service'])
+SERVICE_HTTP_ERRORS = counter('mirror_service_http_errors_total', 'Service API failures', ['service'])
+SERVICE_SECONDS = histogram('mirror_service_request_seconds', 'Service API request latency', ['service'])
+
+
+class MetricsServer:
+    """Serve REGISTRY on http://host:port/metrics from a background thread"""
+
+    def __init__(self, config, registry=REGISTRY):
+        metrics_config = config.get('metrics', {})
+        self.enabled = metrics_config.get('enabled', False)
+        self.host = metrics_config.get('host', '127.0.0.1')
+        self.port = metrics_config.get('port', 9108)
+        self.registry = registry
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """Start the endpoint / Metrics endpoint shuru karein"""
+        if not self.enabled:
+            return
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.expose().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            print(f"Could not start metrics endpoint: {e}")
+            return
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        print(f"📈 Metrics available at http://{self.host}:{self.server.server_address[1]}/metrics")
+
+    def stop(self):
+        """Stop the endpoint / Metrics endpoint band karein"""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+def _format(value):
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
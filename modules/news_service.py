@@ -1,5 +1,6 @@
 import requests
 import time
+from modules.metrics import SERVICE_CACHE_HITS, SERVICE_FETCHES, SERVICE_HTTP_ERRORS, SERVICE_SECONDS
 
 class NewsService:
     def __init__(self, config):
@@ -16,6 +17,8 @@ class NewsService:
         if current_time - self.last_update > self.update_interval or not self.cached_headlines:
             self._fetch_news()
             self.last_update = current_time
+        else:
+            SERVICE_CACHE_HITS.labels('news').inc()
     
     def _fetch_news(self):
         """Fetch news headlines from API"""
@@ -29,16 +32,21 @@ class NewsService:
                 'sources': self.source,
                 'apiKey': self.api_key
             }
+            SERVICE_FETCHES.labels('news').inc()
+            start_time = time.perf_counter()
             response = requests.get(url, params=params, timeout=5)
+            SERVICE_SECONDS.labels('news').observe(time.perf_counter() - start_time)
             if response.status_code == 200:
                 data = response.json()
                 self.cached_headlines = [article['title'] for article in data.get('articles', [])[:10]]
                 if not self.cached_headlines:
                     self.cached_headlines = ["No news available"]
             else:
+                SERVICE_HTTP_ERRORS.labels('news').inc()
                 self.cached_headlines = ["News API Error"]
         except Exception as e:
             print(f"News service error: {e}")
+            SERVICE_HTTP_ERRORS.labels('news').inc()
             self.cached_headlines = ["News service offline"]
     
     def get_headlines(self):
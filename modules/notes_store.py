@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+import time
+
+
+class NotesStore:
+    """Append-only journal of notes (one JSON record per line).
+
+    Each note is one line of the notes editor, kept with an id and creation
+    timestamp. New notes are appended as 'add' records, so saving never
+    rewrites the whole file. Any other edit has to record every note anyway,
+    so it rewrites the journal as a single 'set' snapshot, atomically (temp
+    file + rename); appends are compacted the same way once the journal
+    holds many more records than live notes.
+    """
+
+    def __init__(self, path="notes.jsonl", legacy_path="notes.json", compact_ratio=4, compact_min=200):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.compact_ratio = compact_ratio
+        self.compact_min = compact_min
+
+        self.notes = []  # [{'id', 'ts', 'text'}]
+        self.next_id = 1
+        self.records = 0
+        self.load()
+
+    def load(self):
+        """Replay the journal (or migrate the old notes.json)"""
+        self.notes = []
+        self.records = 0
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn write at the end of the journal
+                    self._apply(record)
+                    self.records += 1
+        elif self.legacy_path and os.path.exists(self.legacy_path):
+            try:
+                with open(self.legacy_path, 'r') as f:
+                    text = json.load(f).get('notes', '')
+                now = time.time()
+                self.notes = [self._new_note(line, now) for line in text.split('\n')] if text else []
+                self.compact()
+                print(f"Migrated {len(self.notes)} notes from {self.legacy_path}")
+            except Exception as e:
+                print(f"Error loading notes: {e}")
+
+        if self.notes:
+            self.next_id = max(note['id'] for note in self.notes) + 1
+        self._maybe_compact()
+
+    def _apply(self, record):
+        op = record.get('op')
+        if op == 'add':
+            self.notes.append({'id': record['id'], 'ts': record['ts'], 'text': record['text']})
+            self.next_id = max(self.next_id, record['id'] + 1)
+        elif op == 'set':
+            self.notes = [dict(note) for note in record['notes']]
+            if self.notes:
+                self.next_id = max(self.next_id, max(note['id'] for note in self.notes) + 1)
+
+    def _new_note(self, text, ts=None):
+        note = {'id': self.next_id, 'ts': ts if ts is not None else time.time(), 'text': text}
+        self.next_id += 1
+        return note
+
+    def text(self):
+        """Editor text for all notes"""
+        return '\n'.join(note['text'] for note in self.notes)
+
+    def lines(self):
+        return [note['text'] for note in self.notes]
+
+    def add(self, text):
+        """Append a single note"""
+        note = self._new_note(text)
+        self.notes.append(note)
+        self._append(dict(note, op='add'))
+        return note
+
+    def replace_lines(self, lines):
+        """Store edited editor lines, appending when only new lines were added"""
+        current = self.lines()
+        if lines == current:
+            return False
+
+        if lines[:len(current)] == current:
+            # Typing at the end: only the new lines hit the journal
+            for text in lines[len(current):]:
+                self.add(text)
+            return True
+
+        # Keep ids/timestamps of lines that survived the edit
+        survivors = {}
+        for note in self.notes:
+            survivors.setdefault(note['text'], []).append(note)
+        notes = []
+        for text in lines:
+            matches = survivors.get(text)
+            notes.append(matches.pop(0) if matches else self._new_note(text))
+        self.notes = notes
+        # A snapshot replaces the whole journal anyway
+        if not self.compact():
+            self._append({'op': 'set', 'ts': time.time(), 'notes': notes})
+        return True
+
+    def _append(self, record):
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+            self.records += 1
+        except Exception as e:
+            print(f"Error saving notes: {e}")
+            return
+        self._maybe_compact()
+
+    def _maybe_compact(self):
+        if self.records > max(self.compact_min, self.compact_ratio * len(self.notes)):
+            self.compact()
+
+    def compact(self):
+        """Rewrite the journal as a single snapshot, atomically; False on failure"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.notes.', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'op': 'set', 'ts': time.time(), 'notes': self.notes}) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self.records = 1
+            return True
+        except Exception as e:
+            print(f"Error compacting notes: {e}")
+            return False
@@ -0,0 +1,150 @@
+import re
+import threading
+import time
+from modules import metrics
+
+MODEL_LOADS = metrics.histogram(
+    'mirror_llm_model_load_seconds', 'Time Ollama spent loading the model for a warm-up or ping',
+    buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 60.0)
+)
+WARM_PINGS = metrics.counter('mirror_llm_warm_requests_total', 'Ollama preload and keepalive requests', ['kind', 'result'])
+MODEL_READY = metrics.gauge('mirror_llm_model_ready', 'Whether the Ollama model is believed to be loaded')
+
+
+def parse_duration(value):
+    """Seconds for an Ollama keep_alive value ("30m", "300s", "1h", 300); None = forever"""
+    if isinstance(value, (int, float)):
+        return None if value < 0 else float(value)
+    match = re.fullmatch(r'\s*(-?\d+(?:\.\d+)?)\s*(ms|s|m|h)?\s*', str(value))
+    if not match:
+        return 300.0  # Ollama's default
+    number = float(match.group(1))
+    if number < 0:
+        return None
+    return number * {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600, None: 1}[match.group(2)]
+
+
+class OllamaWarmer:
+    """Keeps the Ollama model loaded so questions do not pay for a cold start.
+
+    start() preloads the model on a background thread (a generate request
+    without a prompt only loads it). While the mirror is in use a keepalive
+    request is sent before keep_alive runs out; while nobody is there the
+    pings stop and Ollama may unload the model, and it is loaded again when
+    someone comes back. `ready` tells callers whether a question will be
+    answered without a model load.
+    """
+
+    def __init__(self, url, model, keep_alive='30m', config=None):
+        config = config or {}
+        self.url = url
+        self.model = model
+        self.keep_alive = keep_alive
+        self.keep_alive_s = parse_duration(keep_alive)
+        # Ping well before the server's keep_alive timer runs out
+        default_interval = min(240.0, self.keep_alive_s * 0.8) if self.keep_alive_s else 240.0
+        self.ping_interval = config.get('ping_interval_s', default_interval)
+        self.retry_max = config.get('retry_max_s', 30.0)
+        self.timeout = config.get('timeout_s', 120)
+
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopping = threading.Event()
+        self.thread = None
+        self.in_use = True
+        self.state = 'cold'  # cold, loading, ready, error
+        self.last_contact = None  # monotonic time of the last successful request
+        MODEL_READY.set(0)
+
+    @property
+    def ready(self):
+        """True while the model should still be loaded on the server"""
+        with self.lock:
+            if self.state != 'ready' or self.last_contact is None:
+                return False
+            if self.keep_alive_s is None:
+                return True
+            return time.monotonic() - self.last_contact < self.keep_alive_s
+
+    def start(self):
+        if self.thread:
+            return
+        self.thread = threading.Thread(target=self._warm_loop, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+        self.wake.set()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+    def set_in_use(self, in_use):
+        """Presence changed: keep the model warm only while someone is there"""
+        with self.lock:
+            changed = in_use != self.in_use
+            self.in_use = in_use
+        if changed and in_use:
+            self.wake.set()  # reload now if it went cold meanwhile
+
+    def touch(self):
+        """A query just reached the model (it is loaded, and its timer restarted)"""
+        with self.lock:
+            self.last_contact = time.monotonic()
+            self.state = 'ready'
+        MODEL_READY.set(1)
+
+    def _warm_loop(self):
+        retry = 1.0
+        while not self.stopping.is_set():
+            with self.lock:
+                in_use = self.in_use
+                since_contact = None if self.last_contact is None else time.monotonic() - self.last_contact
+            wait = self.ping_interval
+            if in_use:
+                if since_contact is None or since_contact >= self.ping_interval or not self.ready:
+                    if self._load('preload' if since_contact is None else 'keepalive'):
+                        retry = 1.0
+                    else:
+                        wait = retry
+                        retry = min(retry * 2, self.retry_max)
+                else:
+                    wait = self.ping_interval - since_contact
+            elif not self.ready:
+                MODEL_READY.set(0)
+            self.wake.wait(wait)
+            self.wake.clear()
+
+    def _load(self, kind):
+        """Send an empty generate request: loads the model and restarts its keep_alive timer"""
+        import requests
+
+        with self.lock:
+            if self.state != 'ready':
+                self.state = 'loading'
+        start = time.perf_counter()
+        try:
+            response = requests.post(
+                self.url,
+                json={"model": self.model, "keep_alive": self.keep_alive, "stream": False},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            with self.lock:
+                self.state = 'error'
+            MODEL_READY.set(0)
+            WARM_PINGS.labels(kind, 'error').inc()
+            print(f"⚠️ Ollama warm-up failed: {e}")
+            return False
+
+        load_seconds = data.get('load_duration', 0) / 1e9
+        MODEL_LOADS.observe(load_seconds)
+        WARM_PINGS.labels(kind, 'ok').inc()
+        with self.lock:
+            was_ready = self.state == 'ready'
+        self.touch()
+        if not was_ready:
+            print(f"✅ Ollama model '{self.model}' loaded in {time.perf_counter() - start:.1f}s")
+        return True
@@ -0,0 +1,98 @@
+import threading
+import time
+from modules import metrics
+
+PRESENCE_STATE = metrics.gauge('mirror_presence_state', 'Current presence state (1 = active)', ['state'])
+STATE_CPU_SECONDS = metrics.counter('mirror_presence_cpu_seconds_total', 'Process CPU time spent per presence state', ['state'])
+STATE_WALL_SECONDS = metrics.counter('mirror_presence_wall_seconds_total', 'Wall time spent per presence state', ['state'])
+
+STATES = ('active', 'idle', 'away')
+
+
+class PresenceMonitor:
+    """Tracks whether someone is in front of the mirror.
+
+    Fed by the gesture pipeline (hands, camera motion) and the voice
+    pipeline (speech). With no activity for idle_after_s the mirror dims;
+    after away_after_s it enters low-power mode. Any activity wakes it
+    straight back to 'active'. Thread-safe; on_change is called from
+    whichever thread caused the transition.
+    """
+
+    def __init__(self, config, on_change=None):
+        presence_config = config.get('presence', {})
+        self.enabled = presence_config.get('enabled', True)
+        self.idle_after = presence_config.get('idle_after_s', 60)
+        self.away_after = presence_config.get('away_after_s', 300)
+        self.on_change = on_change
+
+        self.lock = threading.Lock()
+        self.state = 'active'
+        self.last_activity = time.monotonic()
+
+        # CPU accounting per state / Har state ka CPU
+        self.state_since_wall = time.monotonic()
+        self.state_since_cpu = time.process_time()
+        self.cpu_seconds = {state: 0.0 for state in STATES}
+        self.wall_seconds = {state: 0.0 for state in STATES}
+        for state in STATES:
+            PRESENCE_STATE.labels(state).set(1 if state == self.state else 0)
+
+    def report_activity(self, source):
+        """Someone is here (source: 'hand', 'motion', 'speech')"""
+        self.last_activity = time.monotonic()
+        if self.state != 'active':
+            print(f"👋 Presence detected ({source}), waking up")
+            self._set_state('active')
+
+    def tick(self):
+        """Advance idle/away timers; cheap enough to call every frame"""
+        if not self.enabled:
+            return
+        quiet_for = time.monotonic() - self.last_activity
+        if quiet_for >= self.away_after:
+            target = 'away'
+        elif quiet_for >= self.idle_after:
+            target = 'idle'
+        else:
+            return
+        if target != self.state:
+            self._set_state(target)
+
+    def _set_state(self, new_state):
+        with self.lock:
+            old_state = self.state
+            if new_state == old_state:
+                return
+            self._account(old_state)
+            self.state = new_state
+            PRESENCE_STATE.labels(old_state).set(0)
+            PRESENCE_STATE.labels(new_state).set(1)
+        print(f"💤 Power state: {old_state} -> {new_state}")
+        if self.on_change:
+            self.on_change(new_state)
+
+    def _account(self, state):
+        now_wall = time.monotonic()
+        now_cpu = time.process_time()
+        cpu = now_cpu - self.state_since_cpu
+        wall = now_wall - self.state_since_wall
+        self.cpu_seconds[state] += cpu
+        self.wall_seconds[state] += wall
+        STATE_CPU_SECONDS.labels(state).inc(cpu)
+        STATE_WALL_SECONDS.labels(state).inc(wall)
+        self.state_since_wall = now_wall
+        self.state_since_cpu = now_cpu
+
+    def cpu_report(self):
+        """Average CPU usage (% of one core) per state so far"""
+        with self.lock:
+            self._account(self.state)
+            return {
+                state: 100.0 * self.cpu_seconds[state] / self.wall_seconds[state]
+                for state in STATES if self.wall_seconds[state] > 0
+            }
+
+    def print_report(self):
+        for state, percent in self.cpu_report().items():
+            print(f"   {state:<7} {percent:5.1f}% CPU over {self.wall_seconds[state]:.0f} s")
@@ -1,7 +1,10 @@
 from PyQt6.QtWidgets import QMainWindow, QWidget
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QObject
 from PyQt6.QtGui import QColor
 from ui.virtual_cursor import VirtualCursor
+from ui.background_widget import BackgroundWidget
+from ui.scene_canvas import SceneCanvas
+from ui.theme import install_theme
 from ui.components.clock_widget_qt import ClockWidget
 from ui.components.weather_widget_qt import WeatherWidget
 from ui.components.calendar_widget_qt import CalendarWidget
@@ -9,12 +12,26 @@ from ui.components.news_widget_qt import NewsWidget
 from ui.components.notes_widget_qt import NotesWidget
 from ui.components.motivational_widget import MotivationalWidget
 from ui.components.response_widget import ResponseWidget
-import json
-import os
+from ui.components.perf_hud_widget import PerfHudWidget
+from ui.components.calibration_overlay import CalibrationOverlay
+from modules.layout_store import LayoutStore
+from ui.widget_index import WidgetHitIndex
+from ui.refresh_scheduler import RefreshScheduler
+
+BACKGROUND_IMAGE = "assets/background.png"
+
+# Cursor colours by hand slot
+HAND_COLORS = [QColor(0, 255, 255, 200), QColor(255, 0, 255, 200)]
+
+# Pages switched by swiping over empty space: widget names shown on each
+PAGES = [
+    ('clock', 'weather', 'calendar', 'news', 'notes', 'motivational'),
+    ('clock',),
+]
 
 class UIManager(QMainWindow):
     def __init__(self, screen_width, screen_height, weather_service, news_service, 
-                 calendar_service, ai_assistant, gesture_controller=None):
+                 calendar_service, ai_assistant, gesture_controller=None, config=None):
         super().__init__()
         
         self.screen_width = screen_width
@@ -24,42 +41,74 @@ class UIManager(QMainWindow):
         self.calendar_service = calendar_service
         self.ai_assistant = ai_assistant
         self.gesture_controller = gesture_controller
+        self.voice_controller = None
         
-        # Widget positions file
+        # Widget layout (positions/sizes), saved debounced off the UI thread
         self.positions_file = "widget_positions.json"
+        self.layout_store = LayoutStore(self.positions_file)
         
-        # Setup UI
+        # Setup UI: one application stylesheet, shared fonts and palette
+        install_theme()
         self.setWindowTitle("Smart Mirror")
-        # Set background image (dark camo)
-        # We use border-image to stretch/cover the background
-        self.setStyleSheet("""
-            QMainWindow {
-                border-image: url(assets/background.png) 0 0 0 0 stretch stretch;
-            }
-        """)
-        
-        # Central widget (widget area)
-        self.central_widget = QWidget()
-        self.central_widget.setStyleSheet("background-color: transparent;")
+        
+        # Central widget (widget area) paints the background image (dark camo)
+        # from a pixmap scaled once per screen size. In "scene" render mode it
+        # is a single graphics scene holding every widget as a cached item.
+        self.render_mode = (config or {}).get('ui', {}).get('render_mode', 'widgets')
+        if self.render_mode == 'scene':
+            self.central_widget = SceneCanvas(BACKGROUND_IMAGE)
+        else:
+            if self.render_mode != 'widgets':
+                print(f"⚠️ Unknown ui.render_mode {self.render_mode!r}, using widgets")
+                self.render_mode = 'widgets'
+            self.central_widget = BackgroundWidget(BACKGROUND_IMAGE)
         self.setCentralWidget(self.central_widget)
         
-        # Virtual cursor
+        # Virtual cursors, one per tracked hand (hand 0 is created up front)
         self.cursor = VirtualCursor(self.central_widget)
         self.cursor.setGeometry(0, 0, screen_width, screen_height)
         self.cursor.show()
+        self.cursors = {0: self.cursor}
         
         # Widgets
         self.widgets = {}
-        self.dragged_widget = None
+        self.dragged_widgets = {}  # hand -> widget
+        self.hovered_widgets = {}  # hand -> widget
+        self.resized_widget = None
+        self.resize_hands = []
+        self.page = 0
         
         # Create widgets
         self._create_widgets()
         self._load_widget_positions()
+        if self.render_mode == 'scene':
+            for widget in list(self.widgets.values()) + [self.motivational, self.hud]:
+                self.central_widget.embed(widget)
         
-        # Update timer for data refresh
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.refresh_widgets)
-        self.update_timer.start(300000)  # 5 minutes
+        # Z-ordered hit-test index for gesture clicks, pinches and hover
+        self.hit_index = WidgetHitIndex(self.central_widget)
+        for widget in self.widgets.values():
+            self.hit_index.add(widget)
+        
+        # One scheduler drives every periodic refresh (aligned wakeups,
+        # hidden widgets skipped)
+        self.scheduler = RefreshScheduler()
+        self.scheduler.register(self.refresh_widgets, 300000)  # 5 minutes
+        for widget in list(self.widgets.values()) + [self.motivational]:
+            if hasattr(widget, 'register_refresh'):
+                widget.register_refresh(self.scheduler)
+        
+        # Dimming overlay for idle/away power states
+        self.power_state = 'active'
+        self.dim_overlay = QWidget(self.central_widget)
+        self.dim_overlay.setObjectName("dimOverlay")
+        self.dim_overlay.setGeometry(0, 0, screen_width, screen_height)
+        self.dim_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.dim_overlay.hide()
+        
+        # Gesture calibration targets (F10)
+        self.calibration_overlay = CalibrationOverlay(self.central_widget)
+        self.calibration_overlay.setGeometry(0, 0, screen_width, screen_height)
     
     def _create_widgets(self):
         """Create all widgets"""
@@ -75,35 +124,35 @@ class UIManager(QMainWindow):
         clock = ClockWidget(self.central_widget)
         # Center X, Top of stack
         clock.set_position(center_x - 150, center_y - 400) 
-        clock.position_changed.connect(lambda x, y: self._save_widget_position('clock', x, y))
+        self._track_layout('clock', clock)
         self.widgets['clock'] = clock
         clock.show()
         
         # Weather widget
         weather = WeatherWidget(self.weather_service, self.central_widget)
         weather.set_position(center_x - 150, center_y - 200)
-        weather.position_changed.connect(lambda x, y: self._save_widget_position('weather', x, y))
+        self._track_layout('weather', weather)
         self.widgets['weather'] = weather
         weather.show()
         
         # Calendar widget (Restored as per user request)
         calendar = CalendarWidget(self.calendar_service, self.central_widget)
         calendar.set_position(center_x - 150, center_y)
-        calendar.position_changed.connect(lambda x, y: self._save_widget_position('calendar', x, y))
+        self._track_layout('calendar', calendar)
         self.widgets['calendar'] = calendar
         calendar.show()
         
         # News widget
         news = NewsWidget(self.news_service, self.central_widget)
         news.set_position(20, 20) # Top-Left
-        news.position_changed.connect(lambda x, y: self._save_widget_position('news', x, y))
+        self._track_layout('news', news)
         self.widgets['news'] = news
         news.show()
         
         # Notes widget
         notes = NotesWidget(self.central_widget)
         notes.set_position(center_x - 175, center_y + 220)
-        notes.position_changed.connect(lambda x, y: self._save_widget_position('notes', x, y))
+        self._track_layout('notes', notes)
         self.widgets['notes'] = notes
         notes.show()
         
@@ -111,12 +160,18 @@ class UIManager(QMainWindow):
         motivational = MotivationalWidget(self.central_widget)
         motivational.move(self.screen_width // 2 - 200, 100) # Moved down slightly
         motivational.show()
+        self.motivational = motivational
 
         # Response Widget (New HiMirror feature) / Jawab dikhane wala widget
         self.response_widget = ResponseWidget(self.central_widget)
         # Position at bottom center (Full width)
         self.response_widget.setGeometry(0, self.screen_height - 180, self.screen_width, 150)
         self.widgets['response'] = self.response_widget
+        
+        # Performance HUD (hidden until F12) / Performance HUD
+        self.hud = PerfHudWidget(self.central_widget)
+        self.hud.move(self.screen_width - 260, 20)
+        self.hud.set_sources(self.gesture_controller)
     
     def show_response(self, user_text, mirror_text):
         """Show response text on screen / Jawab screen par dikhayein"""
@@ -134,82 +189,175 @@ class UIManager(QMainWindow):
             return self.widgets['notes'].get_notes()
         return "No notes available."
     
-    def _save_widget_position(self, widget_name, x, y):
-        """Save widget position to file"""
-        if os.path.exists(self.positions_file):
-            try:
-                with open(self.positions_file, 'r') as f:
-                    positions = json.load(f)
-            except:
-                positions = {}
-        else:
-            positions = {}
-        
-        positions[widget_name] = {'x': x, 'y': y}
-        
-        try:
-            with open(self.positions_file, 'w') as f:
-                json.dump(positions, f)
-        except Exception as e:
-            print(f"Error saving widget positions: {e}")
+    def _track_layout(self, widget_name, widget):
+        """Keep a widget's position/size in the layout store"""
+        widget.position_changed.connect(lambda x, y: self.layout_store.set_position(widget_name, x, y))
+        widget.size_changed.connect(lambda w, h: self.layout_store.set_size(widget_name, w, h))
+        # Write as soon as a drag finishes instead of waiting for the debounce
+        widget.drag_ended.connect(self.layout_store.flush)
     
     def _load_widget_positions(self):
-        """Load widget positions from file"""
-        if os.path.exists(self.positions_file):
+        """Apply the saved layout to the widgets"""
+        for widget_name, widget in self.widgets.items():
+            entry = self.layout_store.get(widget_name)
+            if not entry:
+                continue
             try:
-                with open(self.positions_file, 'r') as f:
-                    positions = json.load(f)
-                
-                for widget_name, pos in positions.items():
-                    if widget_name in self.widgets:
-                        self.widgets[widget_name].set_position(pos['x'], pos['y'])
+                if 'width' in entry and 'height' in entry:
+                    widget.set_size(entry['width'], entry['height'])
+                if 'x' in entry and 'y' in entry:
+                    widget.set_position(entry['x'], entry['y'])
             except Exception as e:
                 print(f"Error loading widget positions: {e}")
     
-    def update_cursor_position(self, x, y):
-        """Update virtual cursor position"""
-        self.cursor.set_position(x, y)
-        self.cursor.show_cursor()
+    def _cursor(self, hand):
+        """Virtual cursor for a hand, created on first use"""
+        cursor = self.cursors.get(hand)
+        if cursor is None:
+            cursor = VirtualCursor(self.central_widget, HAND_COLORS[hand % len(HAND_COLORS)])
+            cursor.setGeometry(0, 0, self.screen_width, self.screen_height)
+            cursor.show()
+            self.cursors[hand] = cursor
+        return cursor
+    
+    def update_cursor_position(self, x, y, trace=None, hand=0):
+        """Update a hand's virtual cursor position"""
+        cursor = self._cursor(hand)
+        cursor.set_position(x, y, trace)
+        cursor.show_cursor()
+        
+        # Hover tracking (skipped mid-drag: the dragged widget is under the cursor)
+        if hand not in self.dragged_widgets and not self.resized_widget:
+            self._set_hovered_widget(self.hit_index.hit_test(x, y), hand)
+    
+    def hide_hand_cursor(self, hand):
+        """A hand left the camera view"""
+        if hand in self.cursors:
+            self.cursors[hand].hide_cursor()
+        self._set_hovered_widget(None, hand)
+    
+    def _set_hovered_widget(self, widget, hand=0):
+        """Move a hand's hover highlight to another widget"""
+        previous = self.hovered_widgets.get(hand)
+        if widget is previous:
+            return
+        if widget:
+            self.hovered_widgets[hand] = widget
+            widget.set_hovered(True)
+        else:
+            self.hovered_widgets.pop(hand, None)
+        # Another hand may still be over the old widget
+        if previous and previous not in self.hovered_widgets.values():
+            previous.set_hovered(False)
+    
+    def raise_widget(self, widget):
+        """Bring a widget to the front in either render mode / Widget ko samne layein"""
+        if self.render_mode == 'scene':
+            self.central_widget.raise_widget(widget)
+        else:
+            widget.raise_()
+        self.hit_index.dirty = True
     
     def handle_click(self, x, y):
         """Handle click event"""
         # Check if click is on any widget
-        for widget in self.widgets.values():
-            if widget.contains_point(x, y):
-                # Handle widget-specific click
-                if isinstance(widget, NotesWidget):
-                    widget.notes_text.setFocus()
-                break
+        widget = self.hit_index.hit_test(x, y)
+        # Handle widget-specific click
+        if isinstance(widget, NotesWidget):
+            widget.notes_text.setFocus()
     
-    def handle_pinch_start(self, x, y):
+    def handle_pinch_start(self, x, y, hand=0):
         """Handle pinch start - check if over a widget"""
         # Show pinch visual feedback
-        self.cursor.set_pinching(True)
+        self._cursor(hand).set_pinching(True)
         
-        for widget in self.widgets.values():
-            if widget.contains_point(x, y):
-                self.dragged_widget = widget
-                widget.start_drag(x, y)
-                break
+        widget = self.hit_index.hit_test(x, y)
+        # A widget follows one hand; a second pinch on it becomes a resize
+        if widget and widget not in self.dragged_widgets.values():
+            self.dragged_widgets[hand] = widget
+            widget.start_drag(x, y)
     
-    def handle_drag_start(self, x, y, start_x, start_y):
+    def handle_drag_start(self, x, y, start_x, start_y, hand=0):
         """Handle drag start"""
-        if self.dragged_widget:
-            self.dragged_widget.start_drag(x, y)
+        widget = self.dragged_widgets.get(hand)
+        if widget:
+            widget.start_drag(x, y)
     
-    def handle_drag_move(self, x, y, delta_x, delta_y):
+    def handle_drag_move(self, x, y, delta_x, delta_y, hand=0):
         """Handle drag movement"""
-        if self.dragged_widget:
-            self.dragged_widget.update_drag(x, y)
+        widget = self.dragged_widgets.get(hand)
+        if widget:
+            widget.update_drag(x, y)
     
-    def handle_drag_end(self, x, y):
+    def handle_drag_end(self, x, y, hand=0):
         """Handle drag end"""
         # Hide pinch visual feedback
-        self.cursor.set_pinching(False)
+        self._cursor(hand).set_pinching(False)
         
-        if self.dragged_widget:
-            self.dragged_widget.end_drag()
-            self.dragged_widget = None
+        widget = self.dragged_widgets.pop(hand, None)
+        if widget:
+            widget.end_drag()
+    
+    def handle_resize_start(self, x, y, hands):
+        """Two hands pinched: resize the widget one of them holds, or the one between them"""
+        widget = None
+        for hand in hands:
+            self._cursor(hand).set_pinching(True)
+            held = self.dragged_widgets.pop(hand, None)
+            if held:
+                held.end_drag()
+                widget = widget or held
+        self.resize_hands = hands
+        widget = widget or self.hit_index.hit_test(x, y)
+        if widget:
+            self.resized_widget = widget
+            widget.start_gesture_resize()
+    
+    def handle_resize_move(self, scale):
+        """Scale the widget being resized"""
+        if self.resized_widget:
+            self.resized_widget.update_gesture_resize(scale)
+    
+    def handle_resize_end(self):
+        """Finish a two-hand resize"""
+        for hand in self.resize_hands:
+            self._cursor(hand).set_pinching(False)
+        self.resize_hands = []
+        if self.resized_widget:
+            self.resized_widget.end_gesture_resize()
+            self.resized_widget = None
+    
+    def _widget_under_hand(self, hand):
+        """Topmost widget under a hand's cursor"""
+        cursor = self.cursors.get(hand)
+        if cursor is None:
+            return None
+        return self.hit_index.hit_test(cursor.x, cursor.y)
+    
+    def handle_swipe(self, direction, hand=0):
+        """Swipe: the widget under the cursor handles it, otherwise left/right turns the page"""
+        widget = self._widget_under_hand(hand)
+        if widget and hasattr(widget, 'handle_swipe') and widget.handle_swipe(direction):
+            return
+        if direction == 'left':
+            self.set_page(self.page + 1)
+        elif direction == 'right':
+            self.set_page(self.page - 1)
+    
+    def handle_scroll(self, steps, hand=0):
+        """Two-finger scroll, sent to the widget under the cursor"""
+        widget = self._widget_under_hand(hand)
+        if widget and hasattr(widget, 'handle_scroll'):
+            widget.handle_scroll(steps)
+    
+    def set_page(self, page):
+        """Show the widgets of one page (wraps around)"""
+        self.page = page % len(PAGES)
+        shown = PAGES[self.page]
+        for name in PAGES[0]:
+            widget = self.motivational if name == 'motivational' else self.widgets.get(name)
+            if widget:
+                widget.setVisible(name in shown)
     
     def refresh_widgets(self):
         """Refresh all widget data"""
@@ -223,12 +371,57 @@ class UIManager(QMainWindow):
     def set_gesture_controller(self, gesture_controller):
         """Set gesture controller and update widget bounds"""
         self.gesture_controller = gesture_controller
+        self.hud.set_sources(self.gesture_controller, self.voice_controller)
         if gesture_controller:
             # Set widget bounds to central widget area
             gesture_controller.set_widget_bounds(
                 0, 0, self.screen_width, self.screen_height
             )
     
+    def set_voice_controller(self, voice_controller):
+        """Set voice controller for the performance HUD"""
+        self.voice_controller = voice_controller
+        self.hud.set_sources(self.gesture_controller, self.voice_controller)
+    
+    def set_power_state(self, state):
+        """Dim when idle, blank and stop refreshing when away"""
+        if state == self.power_state:
+            return
+        self.power_state = state
+        if state == 'active':
+            self.dim_overlay.hide()
+            self.scheduler.set_paused(False)
+            return
+        
+        # Shade per state comes from the theme stylesheet (#dimOverlay[level=...])
+        self.dim_overlay.setProperty('level', state)
+        self.dim_overlay.style().unpolish(self.dim_overlay)
+        self.dim_overlay.style().polish(self.dim_overlay)
+        self.dim_overlay.show()
+        self.dim_overlay.raise_()
+        if state == 'away':
+            for cursor in self.cursors.values():
+                cursor.hide_cursor()
+            self.scheduler.set_paused(True)
+    
+    def start_calibration(self):
+        """Start (or restart) gesture calibration"""
+        if self.gesture_controller:
+            self.gesture_controller.start_calibration()
+    
+    def show_calibration_target(self, x, y, index, total):
+        """Show the next calibration target, keeping the cursors above it"""
+        self.calibration_overlay.show_target(x, y, index, total)
+        for cursor in self.cursors.values():
+            cursor.raise_()
+    
+    def hide_calibration(self):
+        self.calibration_overlay.hide()
+    
+    def toggle_hud(self):
+        """Show or hide the performance HUD"""
+        self.hud.toggle()
+    
     def show_fullscreen(self):
         """Show in fullscreen mode"""
         self.showFullScreen()
@@ -242,5 +435,14 @@ class UIManager(QMainWindow):
                 self.showNormal()
             else:
                 self.showFullScreen()
+        elif event.key() == Qt.Key.Key_F12:
+            self.toggle_hud()
+        elif event.key() == Qt.Key.Key_F10:
+            self.start_calibration()
         super().keyPressEvent(event)
+    
+    def closeEvent(self, event):
+        """Flush the widget layout before closing"""
+        self.layout_store.close()
+        super().closeEvent(event)
 
@@ -8,6 +8,8 @@ import zipfile
 import requests
 from pathlib import Path
 import pyaudio
+import numpy as np
+from modules import metrics
 
 try:
     from vosk import Model, KaldiRecognizer
@@ -21,6 +23,13 @@ try:
 except ImportError:
     TTS_AVAILABLE = False
 
+VOICE_CHUNKS = metrics.counter('mirror_voice_audio_chunks_total', 'Audio chunks fed to the recognizer')
+VOICE_COMMANDS = metrics.counter('mirror_voice_commands_total', 'Voice commands passed to the app')
+RECOGNIZER_RTF = metrics.histogram(
+    'mirror_voice_recognizer_rtf', 'Recognizer real-time factor per chunk',
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0)
+)
+
 class VoiceController:
     def __init__(self, callback, config):
         self.callback = callback
@@ -50,12 +59,36 @@ class VoiceController:
                 self.tts_engine.setProperty('rate', 150)
             except Exception as e:
                 print(f"TTS initialization failed: {e}")
+        # One speech thread: pyttsx3 cannot run two runAndWait() loops at once,
+        # so texts are queued and spoken in order / Ek waqt mein ek jumla
+        self.speech_queue = queue.Queue()
+        self.speech_thread = None
         
         # State management / State sambhalna
         self.running = False
         self.thread = None
         self.listening = False
+        
+        # Presence / Mojoodgi
+        self.presence = None
+        self.speech_rms = config.get('presence', {}).get('speech_rms', 500)
+        
+        # Counters for the performance HUD / HUD ke liye ginti
+        self.stats = {
+            'chunks': 0,
+            'queue_depth': 0.0,  # chunks waiting in the input buffer
+            'rtf': 0.0           # recognizer time / audio time
+        }
 
+    def set_presence_monitor(self, presence):
+        """Report speech to a PresenceMonitor; gate the recognizer while away"""
+        self.presence = presence
+    
+    def _is_loud(self, data):
+        """RMS energy gate for int16 audio"""
+        samples = np.frombuffer(data, dtype=np.int16).astype(np.float32)
+        return samples.size > 0 and float(np.sqrt(np.mean(samples * samples))) > self.speech_rms
+    
     def _initialize_vosk(self):
         """Initialize VOSK model, downloading if necessary / VOSK model tayyar karein"""
         model_name = "vosk-model-small-en-us-0.15"
@@ -118,16 +151,21 @@ class VoiceController:
     def speak(self, text):
         """Speak text using TTS / TTS ke zariye text bolein"""
         if self.tts_engine:
+            # Queued for the speech thread, so it never blocks / Qatar mein daalein
+            if self.speech_thread is None:
+                self.speech_thread = threading.Thread(target=self._speak_loop, daemon=True)
+                self.speech_thread.start()
+            self.speech_queue.put(text)
+    
+    def _speak_loop(self):
+        """Speak queued texts one after another / Qatar se ek ek kar ke bolein"""
+        while True:
+            text = self.speech_queue.get()
             try:
-                # Run in separate thread to avoid blocking / Alag thread mein chalayein
-                threading.Thread(target=self._speak_thread, args=(text,), daemon=True).start()
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
             except Exception as e:
                 print(f"TTS error: {e}")
-    
-    def _speak_thread(self, text):
-        """Thread implementation for speaking / Bolne ke liye thread implementation"""
-        self.tts_engine.say(text)
-        self.tts_engine.runAndWait()
 
     def _listen_loop(self):
         """Main listening loop using PyAudio and VOSK / PyAudio aur VOSK ka main loop"""
@@ -150,8 +188,25 @@ class VoiceController:
         while self.running:
             try:
                 data = stream.read(self.chunk_size, exception_on_overflow=False)
+                self.stats['queue_depth'] = stream.get_read_available() / self.chunk_size
+                
+                if self.presence:
+                    loud = self._is_loud(data)
+                    if loud:
+                        self.presence.report_activity('speech')
+                    elif self.presence.state == 'away':
+                        # Silence while nobody is around: skip the recognizer
+                        continue
+                
+                recognize_start = time.perf_counter()
+                accepted = self.recognizer.AcceptWaveform(data)
+                rtf = (time.perf_counter() - recognize_start) * self.sample_rate / self.chunk_size
+                self.stats['chunks'] += 1
+                VOICE_CHUNKS.inc()
+                RECOGNIZER_RTF.observe(rtf)
+                self.stats['rtf'] += (rtf - self.stats['rtf']) * 0.2
                 
-                if self.recognizer.AcceptWaveform(data):
+                if accepted:
                     result = json.loads(self.recognizer.Result())
                     text = result.get('text', '').lower()
                     
@@ -174,6 +229,7 @@ class VoiceController:
         if getattr(self, 'waiting_for_command', False):
             print(f"DEBUG: Context command received: '{text}'")
             self.waiting_for_command = False # Reset state
+            VOICE_COMMANDS.inc()
             self.callback('voice_command', {'text': text})
             return
 
@@ -200,4 +256,5 @@ class VoiceController:
                 return
 
             # Wake word + Command -> Execute immediately
+            VOICE_COMMANDS.inc()
             self.callback('voice_command', {'text': command})
@@ -1,6 +1,7 @@
 import requests
 import time
 from datetime import datetime
+from modules.metrics import SERVICE_CACHE_HITS, SERVICE_FETCHES, SERVICE_HTTP_ERRORS, SERVICE_SECONDS
 
 class WeatherService:
     def __init__(self, config):
@@ -18,6 +19,8 @@ class WeatherService:
         if current_time - self.last_update > self.update_interval or self.cached_data is None:
             self._fetch_weather()
             self.last_update = current_time
+        else:
+            SERVICE_CACHE_HITS.labels('weather').inc()
     
     def _fetch_weather(self):
         """Fetch weather data from API"""
@@ -36,7 +39,10 @@ class WeatherService:
                 'appid': self.api_key,
                 'units': self.units
             }
+            SERVICE_FETCHES.labels('weather').inc()
+            start_time = time.perf_counter()
             response = requests.get(url, params=params, timeout=5)
+            SERVICE_SECONDS.labels('weather').observe(time.perf_counter() - start_time)
             if response.status_code == 200:
                 data = response.json()
                 self.cached_data = {
@@ -45,6 +51,7 @@ class WeatherService:
                     'city': data['name']
                 }
             else:
+                SERVICE_HTTP_ERRORS.labels('weather').inc()
                 self.cached_data = {
                     'temp': '--',
                     'condition': 'Error',
@@ -52,6 +59,7 @@ class WeatherService:
                 }
         except Exception as e:
             print(f"Weather service error: {e}")
+            SERVICE_HTTP_ERRORS.labels('weather').inc()
             self.cached_data = {
                 'temp': '--',
                 'condition': 'Offline',
@@ -0,0 +1,77 @@
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPainter, QPixmap, QColor
+
+
+def scaled_background(source, size, ratio=1.0):
+    """Source pixmap stretched to size (logical pixels) at a device pixel ratio, or None"""
+    if source is None or size.width() <= 0 or size.height() <= 0:
+        return None
+    scaled = source.scaled(
+        int(size.width() * ratio), int(size.height() * ratio),
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+    scaled.setDevicePixelRatio(ratio)
+    return scaled
+
+
+def load_background(image_path):
+    """QPixmap for an image file, or None (with a warning) if it cannot be read"""
+    if not image_path:
+        return None
+    pixmap = QPixmap(image_path)
+    if pixmap.isNull():
+        print(f"⚠️ Could not load background {image_path}")
+        return None
+    return pixmap
+
+
+def draw_background(painter, rect, cached, fill_color):
+    """Paint rect (logical pixels) from a pixmap scaled to the whole area"""
+    if cached is None:
+        painter.fillRect(rect, fill_color)
+        return
+    # Same size as the area, so this is a 1:1 copy of the dirty rectangle
+    ratio = cached.devicePixelRatio()
+    rect = QRectF(rect)
+    source = QRectF(rect.x() * ratio, rect.y() * ratio, rect.width() * ratio, rect.height() * ratio)
+    painter.drawPixmap(rect, cached, source)
+
+
+class BackgroundWidget(QWidget):
+    """Mirror background, scaled once per size into a cached pixmap.
+
+    A border-image stylesheet rescales the image on every repaint behind
+    every widget and the cursor overlays; here a repaint only copies the
+    dirty rectangle out of the cached pixmap.
+    """
+
+    def __init__(self, image_path=None, parent=None):
+        super().__init__(parent)
+        # Every pixel is painted, so Qt can skip whatever is behind
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.fill_color = QColor(0, 0, 0)
+        self.source = None
+        self.cached = None
+        self.set_image(image_path)
+
+    def set_image(self, image_path):
+        """Load a new background image (None: plain fill)"""
+        self.source = load_background(image_path)
+        self._rescale()
+        self.update()
+
+    def _rescale(self):
+        """Scale the source to the current size (device pixels)"""
+        self.cached = scaled_background(self.source, self.size(), self.devicePixelRatioF())
+
+    def resizeEvent(self, event):
+        """Only a size change regenerates the cached pixmap"""
+        self._rescale()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        draw_background(painter, event.rect(), self.cached, self.fill_color)
+        painter.end()
@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from ui import theme
 from ui.draggable_widget import DraggableWidget
 
 class CalendarWidget(DraggableWidget):
@@ -16,9 +16,8 @@ class CalendarWidget(DraggableWidget):
         # Title
         title = QLabel("Upcoming Events")
         title.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        font = QFont("Montserrat", 16, QFont.Weight.Bold)
-        title.setFont(font)
-        title.setStyleSheet("color: white; background: transparent;")
+        title.setObjectName("calendarTitle")
+        title.setFont(theme.font('title'))
         layout.addWidget(title)
         
         # Events container
@@ -45,11 +44,11 @@ class CalendarWidget(DraggableWidget):
                 child.widget().deleteLater()
         
         # Add events
-        font = QFont("Montserrat", 12)
+        font = theme.font('calendar_event')
         for event in events:
             event_label = QLabel(f"• {event['time']} - {event['title']}")
             event_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
+            event_label.setObjectName("calendarEvent")
             event_label.setFont(font)
-            event_label.setStyleSheet("color: rgba(255, 255, 255, 200); background: transparent;")
             layout.addWidget(event_label)
 
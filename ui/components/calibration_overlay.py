@@ -0,0 +1,49 @@
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QPainter, QColor, QPen
+from ui import theme
+
+class CalibrationOverlay(QWidget):
+    """Full-screen overlay showing the current gesture calibration target (F10)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+
+        self.target_x = 0
+        self.target_y = 0
+        self.index = 0
+        self.total = 0
+        self.hide()
+
+    def show_target(self, x, y, index, total):
+        """Show target number index (0-based) of total at (x, y)"""
+        self.target_x = x
+        self.target_y = y
+        self.index = index
+        self.total = total
+        self.show()
+        self.raise_()
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), QColor(0, 0, 0, 170))
+
+        # Target rings
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        for radius, alpha in ((36, 120), (20, 255)):
+            painter.setPen(QPen(QColor(255, 215, 0, alpha), 4))
+            painter.drawEllipse(self.target_x - radius, self.target_y - radius, radius * 2, radius * 2)
+        painter.setBrush(QColor(255, 215, 0))
+        painter.drawEllipse(self.target_x - 4, self.target_y - 4, 8, 8)
+
+        painter.setPen(QColor(255, 255, 255))
+        painter.setFont(theme.font('calibration'))
+        painter.drawText(
+            QRect(0, self.height() // 2 - 40, self.width(), 80),
+            Qt.AlignmentFlag.AlignCenter,
+            f"Point at the target and pinch ({self.index + 1}/{self.total})\nF10 to restart"
+        )
+        painter.end()
@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+from ui import theme
 import random
 
 class MotivationalWidget(QLabel):
@@ -28,32 +28,20 @@ class MotivationalWidget(QLabel):
             "You're incredible! 🌟"
         ]
         
-        # Style - Red text, no background block
+        # Style - white text, no background block (ui/theme.py)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet("""
-            QLabel {
-                background-color: transparent;
-                color: white;
-                padding: 10px 20px;
-                font-size: 28px;
-                font-weight: bold;
-                border: none;
-            }
-        """)
-        
-        font = QFont("Arial", 28, QFont.Weight.Bold)
-        self.setFont(font)
+        self.setFont(theme.font('motivational'))
         
         # Set initial message
         self.update_message()
-        
-        # Change message every 10 seconds
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_message)
-        self.timer.start(10000)  # 10 seconds
+    
+    def register_refresh(self, scheduler):
+        """Change message every 10 seconds"""
+        scheduler.register(self.update_message, 10000, widget=self)
     
     def update_message(self):
         """Update to a random motivational message"""
         message = random.choice(self.messages)
-        self.setText(message)
-        self.adjustSize()
+        if self.text() != message:
+            self.setText(message)
+            self.adjustSize()
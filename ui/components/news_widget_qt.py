@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QLabel, QVBoxLayout
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+from ui import theme
 from ui.draggable_widget import DraggableWidget
 
 class NewsWidget(DraggableWidget):
@@ -19,33 +19,28 @@ class NewsWidget(DraggableWidget):
         # Header
         header = QLabel("TODAY'S BIG NEWS")
         header.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        header.setStyleSheet("color: #FFD700; font-size: 11pt; font-weight: bold; letter-spacing: 2px;")
+        header.setObjectName("sectionHeader")
+        header.setFont(theme.font('news_header'))
         layout.addWidget(header)
 
         # News label
         self.news_label = QLabel("Loading News...")
         self.news_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        font = QFont("Helvetica", 13)
-        self.news_label.setFont(font)
-        self.news_label.setStyleSheet("color: white; background: transparent; padding-top: 5px;")
+        self.news_label.setObjectName("newsHeadline")
+        self.news_label.setFont(theme.font('news_headline'))
         self.news_label.setWordWrap(True)
         self.news_label.setMaximumHeight(70)  # Limit height to prevent overflow
         layout.addWidget(self.news_label)
         
         self.setLayout(layout)
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.fetch_news)
-        self.update_timer.start(1800000)  # 30 minutes
-        
-        # Scroll timer
-        self.scroll_timer = QTimer()
-        self.scroll_timer.timeout.connect(self.scroll_news)
-        self.scroll_timer.start(10000)  # 10 seconds
-        
         self.fetch_news()
     
+    def register_refresh(self, scheduler):
+        """Fetch every 30 minutes, rotate headlines every 10 seconds"""
+        scheduler.register(self.fetch_news, 1800000, widget=self)
+        scheduler.register(self.scroll_news, 10000, widget=self)
+    
     def fetch_news(self):
         """Fetch news headlines"""
         self.headlines = self.news_service.get_headlines()
@@ -57,6 +52,27 @@ class NewsWidget(DraggableWidget):
     def scroll_news(self):
         """Scroll to next headline"""
         if self.headlines:
-            self.news_label.setText(self.headlines[self.current_index])
+            headline = self.headlines[self.current_index]
+            if self.news_label.text() != headline:
+                self.news_label.setText(headline)
             self.current_index = (self.current_index + 1) % len(self.headlines)
+    
+    def step_headline(self, step):
+        """Show the next (step > 0) or previous headline right away"""
+        if self.headlines:
+            shown = (self.current_index - 1) % len(self.headlines)
+            self.current_index = (shown + step) % len(self.headlines)
+            self.scroll_news()
+    
+    def handle_swipe(self, direction):
+        """Gesture swipe: left for the next headline, right for the previous"""
+        if direction in ('left', 'right'):
+            self.step_headline(1 if direction == 'left' else -1)
+            return True
+        return False
+    
+    def handle_scroll(self, steps):
+        """Gesture scroll: one headline per step"""
+        self.step_headline(steps)
+        return True
 
@@ -1,15 +1,16 @@
 from PyQt6.QtWidgets import QLabel, QVBoxLayout, QTextEdit, QPushButton
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QTextCursor
+from ui import theme
 from ui.draggable_widget import DraggableWidget
-import json
-import os
+from modules.notes_store import NotesStore
 
 class NotesWidget(DraggableWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(350, 300)
-        self.notes_file = "notes.json"
+        self.notes_file = "notes.jsonl"
+        self.store = NotesStore(self.notes_file, legacy_path="notes.json")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
@@ -18,42 +19,21 @@ class NotesWidget(DraggableWidget):
         # Title
         title = QLabel("Notes")
         title.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        font = QFont("Montserrat", 16, QFont.Weight.Bold)
-        title.setFont(font)
-        title.setStyleSheet("color: white; background: transparent;")
+        title.setObjectName("notesTitle")
+        title.setFont(theme.font('title'))
         layout.addWidget(title)
         
         # Notes text area
         self.notes_text = QTextEdit()
-        self.notes_text.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(20, 20, 20, 200);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 50);
-                border-radius: 5px;
-                padding: 10px;
-                font-family: 'Montserrat';
-                font-size: 14px;
-            }
-        """)
+        self.notes_text.setObjectName("notesText")
+        self.notes_text.setFont(theme.font('notes_text'))
         self.notes_text.setPlaceholderText("Tap to add notes...")
         layout.addWidget(self.notes_text)
         
         # Save button (minimalist)
         self.save_btn = QPushButton("Save")
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 255, 255, 30);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 50);
-                border-radius: 5px;
-                padding: 5px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 50);
-            }
-        """)
+        self.save_btn.setObjectName("notesSave")
+        self.save_btn.setFont(theme.font('notes_button'))
         self.save_btn.clicked.connect(self.save_notes)
         layout.addWidget(self.save_btn)
         
@@ -61,42 +41,47 @@ class NotesWidget(DraggableWidget):
         
         # Load notes
         self.load_notes()
-        
-        # Auto-save timer
-        self.auto_save_timer = QTimer()
-        self.auto_save_timer.timeout.connect(self.save_notes)
-        self.auto_save_timer.start(30000)  # Auto-save every 30 seconds
+    
+    def register_refresh(self, scheduler):
+        """Auto-save every 30 seconds (a no-op unless the notes changed)"""
+        scheduler.register(self.save_notes, 30000)
     
     def load_notes(self):
-        """Load notes from file"""
-        if os.path.exists(self.notes_file):
-            try:
-                with open(self.notes_file, 'r') as f:
-                    data = json.load(f)
-                    self.notes_text.setPlainText(data.get('notes', ''))
-            except Exception as e:
-                print(f"Error loading notes: {e}")
+        """Load notes from the journal"""
+        self.notes_text.setPlainText(self.store.text())
+        self.notes_text.document().setModified(False)
     
     def save_notes(self):
-        """Save notes to file"""
-        try:
-            data = {'notes': self.notes_text.toPlainText()}
-            with open(self.notes_file, 'w') as f:
-                json.dump(data, f)
-        except Exception as e:
-            print(f"Error saving notes: {e}")
+        """Save notes to the journal, only if the editor changed"""
+        document = self.notes_text.document()
+        if not document.isModified():
+            return
+        text = self.notes_text.toPlainText()
+        self.store.replace_lines(text.split('\n') if text else [])
+        document.setModified(False)
 
     def add_note(self, text):
         """Add a new note programmatically / Naya note shamil karein"""
-        current_text = self.notes_text.toPlainText()
-        if current_text:
-            new_text = f"{current_text}\n- {text}"
-        else:
-            new_text = f"- {text}"
-        self.notes_text.setPlainText(new_text)
+        # Save any pending manual edits first so the journal stays in order
         self.save_notes()
+        
+        line = f"- {text}"
+        cursor = QTextCursor(self.notes_text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.notes_text.document().isEmpty():
+            line = "\n" + line
+        cursor.insertText(line)
+        
+        self.store.add(f"- {text}")
+        self.notes_text.document().setModified(False)
         print(f"DEBUG: Note added: {text}")
 
     def get_notes(self):
         """Get all notes / Tamam notes wapis layein"""
         return self.notes_text.toPlainText()
+    
+    def handle_scroll(self, steps):
+        """Gesture scroll: three lines per step"""
+        bar = self.notes_text.verticalScrollBar()
+        bar.setValue(bar.value() + steps * 3 * bar.singleStep())
+        return True
@@ -0,0 +1,76 @@
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt, QTimer
+from ui import theme
+import time
+
+class PerfHudWidget(QLabel):
+    """Small performance overlay for field debugging (toggled with F12)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.gesture_controller = None
+        self.voice_controller = None
+
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.setFont(theme.font('hud'))
+
+        # Refresh once per second, and only while visible
+        self.interval_ms = 1000
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.refresh)
+
+        self.last_tick = None
+        self.last_gesture_stats = {}
+        self.hide()
+
+    def set_sources(self, gesture_controller=None, voice_controller=None):
+        """Set the controllers whose stats are displayed"""
+        self.gesture_controller = gesture_controller
+        self.voice_controller = voice_controller
+
+    def toggle(self):
+        """Show or hide the HUD"""
+        if self.isVisible():
+            self.timer.stop()
+            self.hide()
+        else:
+            self.last_tick = None
+            self.refresh()
+            self.show()
+            self.raise_()
+            self.timer.start(self.interval_ms)
+
+    def refresh(self):
+        """Sample controller counters and redraw"""
+        now = time.monotonic()
+        elapsed = (now - self.last_tick) if self.last_tick else None
+        self.last_tick = now
+
+        lines = []
+
+        # Event-loop lag: how late this timer fired
+        if elapsed is not None:
+            lag_ms = max(0.0, elapsed * 1000 - self.interval_ms)
+            lines.append(f"Qt loop lag   {lag_ms:6.1f} ms")
+
+        if self.gesture_controller:
+            stats = dict(self.gesture_controller.stats)
+            previous = self.last_gesture_stats
+            if elapsed and previous:
+                fps = (stats['frames'] - previous['frames']) / elapsed
+                cursor_rate = (stats['cursor_events'] - previous['cursor_events']) / elapsed
+                lines.append(f"Camera FPS    {fps:6.1f}")
+                lines.append(f"Cursor events {cursor_rate:6.1f} /s")
+            lines.append(f"Inference     {stats['inference_ms']:6.1f} ms")
+            lines.append(f"Skipped       {stats['skipped_frames']:6d}")
+            self.last_gesture_stats = stats
+
+        if self.voice_controller:
+            stats = self.voice_controller.stats
+            lines.append(f"Audio queue   {stats['queue_depth']:6.2f} chunks")
+            lines.append(f"Recognizer    {stats['rtf']:6.2f} RTF")
+
+        self.setText("\n".join(lines) if lines else "No stats")
+        self.adjustSize()
@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont, QColor, QPalette
 from ui.draggable_widget import DraggableWidget
+from ui import theme
 
 class ResponseWidget(DraggableWidget):
     def __init__(self, parent=None):
@@ -18,27 +19,14 @@ class ResponseWidget(DraggableWidget):
         # User Text Label (What user said) / User ki baat
         self.user_label = QLabel("")
         self.user_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.user_label.setStyleSheet("""
-            QLabel {
-                color: #AAAAAA;
-                font-family: 'Arial';
-                font-size: 24px;
-                font-style: italic;
-            }
-        """)
+        self.user_label.setObjectName("responseUser")
+        self.user_label.setFont(theme.font('response_user'))
         
         # Mirror Response Label (What mirror replies) / Mirror ka jawab
         self.mirror_label = QLabel("")
         self.mirror_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.mirror_label.setStyleSheet("""
-            QLabel {
-                color: #FFFFFF;
-                font-family: 'Arial';
-                font-size: 32px;
-                font-weight: bold;
-                text-shadow: 0px 0px 10px rgba(0, 255, 255, 0.5);
-            }
-        """)
+        self.mirror_label.setObjectName("responseMirror")
+        self.mirror_label.setFont(theme.font('response_mirror'))
         
         layout.addWidget(self.user_label)
         layout.addWidget(self.mirror_label)
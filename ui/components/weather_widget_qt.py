@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QLabel, QVBoxLayout
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from ui import theme
 from ui.draggable_widget import DraggableWidget
 
 class WeatherWidget(DraggableWidget):
@@ -16,23 +16,22 @@ class WeatherWidget(DraggableWidget):
         # Header
         header = QLabel("WEATHER")
         header.setAlignment(Qt.AlignmentFlag.AlignRight)
-        header.setStyleSheet("color: #FFD700; font-size: 10pt; font-weight: bold; letter-spacing: 2px;")
+        header.setObjectName("sectionHeader")
+        header.setFont(theme.font('weather_header'))
         layout.addWidget(header)
 
         # Temperature label
         self.temp_label = QLabel("--°C")
         self.temp_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
-        font = QFont("Montserrat", 48, QFont.Weight.Bold) # Bigger font
-        self.temp_label.setFont(font)
-        self.temp_label.setStyleSheet("color: white; background: transparent;")
+        self.temp_label.setObjectName("weatherTemp")
+        self.temp_label.setFont(theme.font('weather_temp'))  # Bigger font
         layout.addWidget(self.temp_label)
         
         # Description label
         self.desc_label = QLabel("Loading...")
         self.desc_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop)
-        font = QFont("Montserrat", 16)
-        self.desc_label.setFont(font)
-        self.desc_label.setStyleSheet("color: #E0E0E0; background: transparent;")
+        self.desc_label.setObjectName("weatherDesc")
+        self.desc_label.setFont(theme.font('weather_desc'))
         layout.addWidget(self.desc_label)
         
         self.setLayout(layout)
@@ -43,6 +42,10 @@ class WeatherWidget(DraggableWidget):
         """Update weather display"""
         data = self.weather_service.get_current_weather()
         if data:
-            self.temp_label.setText(f"{data['temp']}°C")
-            self.desc_label.setText(f"{data['city']} - {data['condition']}")
+            temp_text = f"{data['temp']}°C"
+            desc_text = f"{data['city']} - {data['condition']}"
+            if self.temp_label.text() != temp_text:
+                self.temp_label.setText(temp_text)
+            if self.desc_label.text() != desc_text:
+                self.desc_label.setText(desc_text)
 
@@ -7,6 +7,7 @@ class DraggableWidget(QWidget):
     
     
     position_changed = pyqtSignal(int, int)  
+    size_changed = pyqtSignal(int, int)
     drag_started = pyqtSignal()
     drag_ended = pyqtSignal()
     
@@ -17,6 +18,7 @@ class DraggableWidget(QWidget):
         
         
         self.is_dragging = False
+        self.is_hovered = False  # virtual cursor hover
         self.drag_offset = QPoint(0, 0)
         self.original_position = QPoint(0, 0)
         
@@ -27,18 +29,9 @@ class DraggableWidget(QWidget):
         self.min_width = 200
         self.min_height = 100
         self.drag_start_pos = QPoint()
+        self.gesture_resize_geometry = None  # geometry when a two-hand resize started
         
-        
-        self.setStyleSheet("""
-            QWidget {
-                background-color: rgba(0, 0, 0, 180);
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 30);
-            }
-            QWidget:hover {
-                border: 1px solid rgba(255, 255, 255, 100);
-            }
-        """)
+        # Look comes from the application stylesheet (ui/theme.py)
 
     def mousePressEvent(self, event):
         """Handle mouse press for resizing"""
@@ -90,6 +83,8 @@ class DraggableWidget(QWidget):
         if self.is_resizing:
             self.is_resizing = False
             self.setCursor(Qt.CursorShape.ArrowCursor)
+            if self.size() != self.original_size:
+                self.size_changed.emit(self.width(), self.height())
             event.accept()
         else:
             super().mouseReleaseEvent(event)
@@ -123,6 +118,27 @@ class DraggableWidget(QWidget):
         """Get widget position"""
         return self.pos()
     
+    def set_size(self, width, height):
+        """Set widget size (restored layout)"""
+        self._apply_size(max(self.min_width, width), max(self.min_height, height))
+    
+    def _apply_size(self, width, height):
+        """Resize, keeping widgets that use setFixedSize fixed at the new size"""
+        if self.minimumSize() == self.maximumSize():
+            self.setFixedSize(width, height)
+        else:
+            self.resize(width, height)
+    
+    def _container_size(self):
+        """Size of the area the widget lives in: its parent, or the scene it is embedded in"""
+        parent = self.parent()
+        if parent:
+            return parent.size()
+        proxy = self.graphicsProxyWidget()
+        if proxy and proxy.scene():
+            return proxy.scene().sceneRect().size().toSize()
+        return None
+    
     def start_drag(self, cursor_x, cursor_y):
         """Start dragging the widget"""
         if not self.is_dragging:
@@ -138,10 +154,10 @@ class DraggableWidget(QWidget):
             new_y = cursor_y - self.drag_offset.y()
             
             # Keep within parent bounds
-            parent = self.parent()
-            if parent:
-                max_x = parent.width() - self.width()
-                max_y = parent.height() - self.height()
+            area = self._container_size()
+            if area:
+                max_x = area.width() - self.width()
+                max_y = area.height() - self.height()
                 new_x = max(0, min(new_x, max_x))
                 new_y = max(0, min(new_y, max_y))
             
@@ -154,6 +170,47 @@ class DraggableWidget(QWidget):
             self.is_dragging = False
             self.drag_ended.emit()
     
+    def start_gesture_resize(self):
+        """Begin a two-hand pinch resize"""
+        self.gesture_resize_geometry = self.geometry()
+    
+    def update_gesture_resize(self, scale):
+        """Scale the size the resize started from, keeping the centre in place"""
+        if self.gesture_resize_geometry is None:
+            return
+        start = self.gesture_resize_geometry
+        width = max(self.min_width, int(start.width() * scale))
+        height = max(self.min_height, int(start.height() * scale))
+        area = self._container_size()
+        if area:
+            width = min(width, area.width())
+            height = min(height, area.height())
+        x = start.center().x() - width // 2
+        y = start.center().y() - height // 2
+        if area:
+            x = max(0, min(x, area.width() - width))
+            y = max(0, min(y, area.height() - height))
+        self._apply_size(width, height)
+        self.move(x, y)
+    
+    def end_gesture_resize(self):
+        """Finish a two-hand resize and report the new layout"""
+        if self.gesture_resize_geometry is None:
+            return
+        start = self.gesture_resize_geometry
+        self.gesture_resize_geometry = None
+        if self.size() != start.size():
+            self.size_changed.emit(self.width(), self.height())
+        if self.pos() != start.topLeft():
+            self.position_changed.emit(self.x(), self.y())
+        self.drag_ended.emit()
+    
+    def set_hovered(self, hovered):
+        """Highlight while the virtual cursor is over the widget"""
+        if hovered != self.is_hovered:
+            self.is_hovered = hovered
+            self.update()
+    
     def contains_point(self, x, y):
         """Check if point is within widget bounds"""
         widget_pos = self.pos()
@@ -180,4 +237,8 @@ class DraggableWidget(QWidget):
             pen = QPen(QColor(255, 255, 255, 100), 2)
             painter.setPen(pen)
             painter.drawRoundedRect(1, 1, self.width() - 2, self.height() - 2, 10, 10)
+        elif self.is_hovered:
+            pen = QPen(QColor(255, 255, 255, 60), 1)
+            painter.setPen(pen)
+            painter.drawRoundedRect(1, 1, self.width() - 2, self.height() - 2, 10, 10)
 
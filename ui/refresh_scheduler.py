@@ -0,0 +1,101 @@
+from PyQt6.QtCore import Qt, QObject, QTimer, QEvent
+import math
+import time
+
+
+class _Job:
+    __slots__ = ('callback', 'interval', 'widget', 'next_due', 'pending')
+
+    def __init__(self, callback, interval, widget):
+        self.callback = callback
+        self.interval = interval
+        self.widget = widget
+        self.next_due = 0.0
+        self.pending = False  # skipped while hidden, run when shown again
+
+
+class RefreshScheduler(QObject):
+    """One timer for all periodic widget refreshes.
+
+    Due times are snapped to a wall-clock grid (multiples of each job's
+    interval), so e.g. a 10 s and a 60 s job fire in the same wakeup and a
+    60 s clock job lands on the minute boundary. Jobs tied to a widget are
+    skipped while it is hidden or fully off-screen and run as soon as it is
+    shown again.
+    """
+
+    def __init__(self, slack_ms=250):
+        super().__init__()
+        self.jobs = []
+        self.paused = False
+        self.slack = slack_ms / 1000.0
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        # Wakeups are already coalesced here; precise keeps the clock on the minute
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._run_due)
+
+    def register(self, callback, interval_ms, widget=None):
+        """Call callback every interval_ms, aligned to wall-clock multiples of the interval"""
+        job = _Job(callback, interval_ms / 1000.0, widget)
+        job.next_due = self._next_boundary(job.interval, time.time())
+        self.jobs.append(job)
+        if widget is not None:
+            widget.installEventFilter(self)
+        self._reschedule()
+        return job
+
+    def unregister(self, job):
+        if job in self.jobs:
+            self.jobs.remove(job)
+            self._reschedule()
+
+    def set_paused(self, paused):
+        """Stop all wakeups (e.g. low-power mode); resuming runs overdue jobs"""
+        self.paused = paused
+        if paused:
+            self.timer.stop()
+        else:
+            self._run_due()
+
+    @staticmethod
+    def _next_boundary(interval, now):
+        return (int(now // interval) + 1) * interval
+
+    def _is_showing(self, widget):
+        return widget.isVisible() and not widget.visibleRegion().isEmpty()
+
+    def _run_due(self):
+        if self.paused:
+            return
+        now = time.time()
+        for job in list(self.jobs):
+            if job.next_due - self.slack > now:
+                continue
+            # Advance past the boundary just served even if the timer fired
+            # a little early, so the job runs once per interval
+            job.next_due = self._next_boundary(job.interval, max(now, job.next_due))
+            if job.widget is not None and not self._is_showing(job.widget):
+                job.pending = True
+                continue
+            job.pending = False
+            job.callback()
+        self._reschedule()
+
+    def _reschedule(self):
+        if self.paused or not self.jobs:
+            self.timer.stop()
+            return
+        earliest = min(job.next_due for job in self.jobs)
+        # Round up: waking before the boundary would need a second wakeup
+        self.timer.start(max(0, math.ceil((earliest - time.time()) * 1000)))
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Show and not self.paused:
+            for job in self.jobs:
+                if job.widget is obj and job.pending:
+                    job.pending = False
+                    # Run after the show completes so the widget is laid out
+                    QTimer.singleShot(0, job.callback)
+        return False
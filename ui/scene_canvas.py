@@ -0,0 +1,74 @@
+from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsProxyWidget, QFrame
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QColor
+from ui.background_widget import scaled_background, load_background, draw_background
+
+class SceneCanvas(QGraphicsView):
+    """Single-canvas render mode (ui.render_mode "scene").
+
+    Widgets are embedded in one QGraphicsScene as proxy items with
+    DeviceCoordinateCache: each widget is rendered into its own pixmap once
+    and only re-rendered when its content changes. Dragging a widget moves
+    its item, so a drag frame is a few pixmap blits instead of re-styling
+    and re-compositing the widget and everything behind it. Everything is
+    rasterized in software; no OpenGL viewport is needed.
+
+    Overlays that cover the whole screen (cursors, dimming, calibration)
+    stay ordinary child widgets on top of the view.
+    """
+
+    def __init__(self, image_path=None, parent=None):
+        super().__init__(parent)
+        self.scene = QGraphicsScene(self)
+        self.setScene(self.scene)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+
+        self.fill_color = QColor(0, 0, 0)
+        self.source = load_background(image_path)
+        self.cached = None
+        self.proxies = {}  # widget -> proxy item
+
+    def embed(self, widget):
+        """Move a widget (a child of this view) into the scene as a cached item"""
+        visible = not widget.isHidden()
+        geometry = widget.geometry()
+        widget.setParent(None)
+        # As a top-level widget it would fill its background; as a child it did not
+        widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        proxy = self.scene.addWidget(widget)
+        proxy.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        proxy.setPos(geometry.x(), geometry.y())
+        widget.setVisible(visible)
+        self.proxies[widget] = proxy
+        return proxy
+
+    def raise_widget(self, widget):
+        """Bring an embedded widget to the front (raise_() has no effect on a proxy)"""
+        proxy = self.proxies.get(widget)
+        if proxy is None:
+            return
+        others = [item.zValue() for item in self.proxies.values() if item is not proxy]
+        if others and proxy.zValue() <= max(others):
+            proxy.setZValue(max(others) + 1)
+
+    def stacking_order(self):
+        """Embedded widgets from bottom to top (used by WidgetHitIndex)"""
+        return [item.widget() for item in self.scene.items(Qt.SortOrder.AscendingOrder)
+                if isinstance(item, QGraphicsProxyWidget)]
+
+    def resizeEvent(self, event):
+        """Scene matches the view; the background is rescaled only here"""
+        super().resizeEvent(event)
+        size = self.viewport().size()
+        self.scene.setSceneRect(QRectF(0, 0, size.width(), size.height()))
+        self.cached = scaled_background(self.source, size, self.devicePixelRatioF())
+
+    def drawBackground(self, painter, rect):
+        # View and scene coordinates are the same (no scroll, no transform)
+        draw_background(painter, rect, self.cached, self.fill_color)
@@ -0,0 +1,148 @@
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QFont, QPalette, QColor
+
+# One application-level stylesheet, parsed once at startup. Widgets do not
+# call setStyleSheet: they are matched by class or by objectName, so Qt
+# keeps a single set of compiled rules instead of one per widget, and no
+# widget carries :hover rules (the gesture hover outline is painted by
+# DraggableWidget.paintEvent).
+STYLESHEET = """
+/* Draggable widget chrome (DraggableWidget does not paint a styled
+   background itself, so the rule shows on its children) */
+DraggableWidget QWidget {
+    background-color: rgba(0, 0, 0, 180);
+    border-radius: 10px;
+    border: 1px solid rgba(255, 255, 255, 30);
+}
+ClockWidget QWidget {
+    background-color: rgba(0, 0, 0, 100);
+    border-radius: 15px;
+    border: none;
+}
+
+/* Plain text labels: palette colour, no box */
+#clockTime, #weatherTemp, #calendarTitle, #notesTitle {
+    background: transparent;
+}
+#clockDate {
+    color: rgba(255, 255, 255, 180);
+    background: transparent;
+}
+#weatherDesc {
+    color: #E0E0E0;
+    background: transparent;
+}
+#calendarEvent {
+    color: rgba(255, 255, 255, 200);
+    background: transparent;
+}
+#newsHeadline {
+    background: transparent;
+    padding-top: 5px;
+}
+#sectionHeader {
+    color: #FFD700;
+}
+
+QTextEdit#notesText {
+    background-color: rgba(20, 20, 20, 200);
+    border: 1px solid rgba(255, 255, 255, 50);
+    border-radius: 5px;
+    padding: 10px;
+}
+QPushButton#notesSave {
+    background-color: rgba(255, 255, 255, 30);
+    border: 1px solid rgba(255, 255, 255, 50);
+    border-radius: 5px;
+    padding: 5px;
+}
+QPushButton#notesSave:hover {
+    background-color: rgba(255, 255, 255, 50);
+}
+
+#responseUser {
+    color: #AAAAAA;
+}
+
+#dimOverlay[level="idle"] {
+    background-color: rgba(0, 0, 0, 150);
+}
+#dimOverlay[level="away"] {
+    background-color: rgba(0, 0, 0, 255);
+}
+
+MotivationalWidget {
+    background-color: transparent;
+    padding: 10px 20px;
+    border: none;
+}
+PerfHudWidget {
+    background-color: rgba(0, 0, 0, 160);
+    color: #00FF88;
+    padding: 8px;
+    border: 1px solid rgba(0, 255, 136, 80);
+    border-radius: 5px;
+}
+"""
+
+# name: (family or None for the application font, size, unit, weight, italic, letter spacing px)
+FONT_SPECS = {
+    'clock_time': ("Montserrat", 60, 'pt', QFont.Weight.Light, False, 0),
+    'clock_date': ("Montserrat", 20, 'pt', QFont.Weight.Normal, False, 0),
+    'weather_header': (None, 10, 'pt', QFont.Weight.Bold, False, 2),
+    'weather_temp': ("Montserrat", 48, 'pt', QFont.Weight.Bold, False, 0),
+    'weather_desc': ("Montserrat", 16, 'pt', QFont.Weight.Normal, False, 0),
+    'news_header': (None, 11, 'pt', QFont.Weight.Bold, False, 2),
+    'news_headline': ("Helvetica", 13, 'pt', QFont.Weight.Normal, False, 0),
+    'title': ("Montserrat", 16, 'pt', QFont.Weight.Bold, False, 0),
+    'calendar_event': ("Montserrat", 12, 'pt', QFont.Weight.Normal, False, 0),
+    'notes_text': ("Montserrat", 14, 'px', QFont.Weight.Normal, False, 0),
+    'notes_button': (None, 12, 'px', QFont.Weight.Normal, False, 0),
+    'response_user': ("Arial", 24, 'px', QFont.Weight.Normal, True, 0),
+    'response_mirror': ("Arial", 32, 'px', QFont.Weight.Bold, False, 0),
+    'motivational': ("Arial", 28, 'px', QFont.Weight.Bold, False, 0),
+    'hud': ("Monospace", 10, 'pt', QFont.Weight.Normal, False, 0),
+    'calibration': ("Helvetica", 18, 'pt', QFont.Weight.Normal, False, 0),
+}
+
+_fonts = {}
+_palette = None
+
+
+def font(name):
+    """Shared QFont for a FONT_SPECS entry (built on first use)"""
+    shared = _fonts.get(name)
+    if shared is None:
+        family, size, unit, weight, italic, spacing = FONT_SPECS[name]
+        shared = QFont(family) if family else QFont()
+        if unit == 'px':
+            shared.setPixelSize(size)
+        else:
+            shared.setPointSize(size)
+        shared.setWeight(weight)
+        shared.setItalic(italic)
+        if spacing:
+            shared.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, spacing)
+        _fonts[name] = shared
+    return shared
+
+
+def palette(base=None):
+    """Shared palette: white text on the dark mirror"""
+    global _palette
+    if _palette is None:
+        _palette = QPalette(base) if base is not None else QPalette()
+        white = QColor(255, 255, 255)
+        for role in (QPalette.ColorRole.WindowText, QPalette.ColorRole.Text, QPalette.ColorRole.ButtonText):
+            _palette.setColor(role, white)
+    return _palette
+
+
+def install_theme(app=None):
+    """Apply the stylesheet and palette to the application (once)"""
+    app = app or QApplication.instance()
+    if app is None or app.property('mirror_theme'):
+        return
+    app.setPalette(palette(app.palette()))
+    app.setStyleSheet(STYLESHEET)
+    app.setProperty('mirror_theme', True)
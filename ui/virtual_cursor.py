@@ -1,11 +1,11 @@
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtCore import Qt, QPoint, QRect
 from PyQt6.QtGui import QPainter, QColor, QPen, QBrush
 
 class VirtualCursor(QWidget):
     """Virtual cursor overlay that displays within the widget window"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, color=None):
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
@@ -15,34 +15,52 @@ class VirtualCursor(QWidget):
         self.y = 0
         self.visible = True
         self.cursor_size = 40 
-        self.cursor_color = QColor(0, 255, 255, 200)  # Cyan
+        self.cursor_color = color or QColor(0, 255, 255, 200)  # Cyan
         self.cursor_outline = QColor(255, 255, 255, 255)  # White
         self.is_pinching = False
+        self.pending_traces = []  # latency traces waiting for the next paint
         
-    def set_position(self, x, y):
+    def set_position(self, x, y, trace=None):
         """Update cursor position"""
+        if trace:
+            self.pending_traces.append(trace)
+        # Repaint only where the cursor was and is: the overlay is full-screen
+        # and a full update would recompose the background and every widget
+        self._repaint_cursor()
         self.x = x
         self.y = y
-        self.update()
+        self._repaint_cursor()
     
     def set_pinching(self, pinching):
         """Set pinch state for visual feedback"""
-        self.is_pinching = pinching
-        self.update()
+        if pinching != self.is_pinching:
+            self.is_pinching = pinching
+            self._repaint_cursor()
     
     def show_cursor(self):
         """Show the cursor"""
-        self.visible = True
-        self.update()
+        if not self.visible:
+            self.visible = True
+            self._repaint_cursor()
     
     def hide_cursor(self):
         """Hide the cursor"""
-        self.visible = False
-        self.update()
+        if self.visible:
+            self._repaint_cursor()
+            self.visible = False
+    
+    def cursor_rect(self):
+        """Area the cursor covers at its current position (pinch size plus pen)"""
+        half = int(self.cursor_size * 1.5) // 2 + 4
+        return QRect(int(self.x) - half, int(self.y) - half, 2 * half + 1, 2 * half + 1)
+    
+    def _repaint_cursor(self):
+        self.update(self.cursor_rect())
     
     def paintEvent(self, event):
         """Draw the cursor"""
         if not self.visible:
+            self._finish_traces()
             return
         
         painter = QPainter(self)
@@ -106,4 +124,15 @@ class VirtualCursor(QWidget):
                 int(self.x), int(self.y - line_length),
                 int(self.x), int(self.y + line_length)
             )
+        
+        painter.end()
+        self._finish_traces()
+    
+    def _finish_traces(self):
+        """Close latency traces for the positions this paint displayed"""
+        if self.pending_traces:
+            for trace in self.pending_traces:
+                trace.mark('paint')
+                trace.finish()
+            self.pending_traces = []
 
@@ -0,0 +1,98 @@
+from PyQt6.QtCore import QObject, QEvent
+import bisect
+
+# Events that change where a widget is, whether it is visible, or its stacking
+_GEOMETRY_EVENTS = {
+    QEvent.Type.Move,
+    QEvent.Type.Resize,
+    QEvent.Type.Show,
+    QEvent.Type.Hide,
+    QEvent.Type.ZOrderChange,
+}
+
+
+class WidgetHitIndex(QObject):
+    """Z-ordered spatial index over sibling widgets for cursor hit tests.
+
+    The parent area is cut into a grid along every widget edge and each
+    cell stores the topmost visible widget covering it, so a hit test is
+    two bisects. The grid is rebuilt lazily after a tracked widget moves,
+    resizes, is shown/hidden or is raised/lowered.
+    """
+
+    def __init__(self, parent_widget):
+        super().__init__()
+        self.parent_widget = parent_widget
+        self.widgets = set()
+        self.dirty = True
+        self.xs = []
+        self.ys = []
+        self.cells = []
+
+    def add(self, widget):
+        """Start tracking a widget"""
+        if widget not in self.widgets:
+            self.widgets.add(widget)
+            widget.installEventFilter(self)
+            self.dirty = True
+
+    def remove(self, widget):
+        """Stop tracking a widget"""
+        if widget in self.widgets:
+            self.widgets.discard(widget)
+            widget.removeEventFilter(self)
+            self.dirty = True
+
+    def eventFilter(self, obj, event):
+        if event.type() in _GEOMETRY_EVENTS:
+            self.dirty = True
+        return False
+
+    def _stacking_order(self):
+        """Tracked visible widgets from bottom to top"""
+        if hasattr(self.parent_widget, 'stacking_order'):
+            # Widgets embedded in a SceneCanvas are items, not children
+            children = self.parent_widget.stacking_order()
+        else:
+            children = self.parent_widget.children()
+        return [child for child in children
+                if child in self.widgets and not child.isHidden()]
+
+    def _rebuild(self):
+        rects = []
+        xs = set()
+        ys = set()
+        for widget in self._stacking_order():
+            geometry = widget.geometry()
+            # Edges are inclusive, matching DraggableWidget.contains_point
+            x0, y0 = geometry.x(), geometry.y()
+            x1, y1 = x0 + geometry.width() + 1, y0 + geometry.height() + 1
+            rects.append((widget, x0, y0, x1, y1))
+            xs.update((x0, x1))
+            ys.update((y0, y1))
+
+        self.xs = sorted(xs)
+        self.ys = sorted(ys)
+        self.cells = [[None] * max(0, len(self.ys) - 1) for _ in range(max(0, len(self.xs) - 1))]
+
+        # Paint bottom to top so higher widgets overwrite lower ones
+        for widget, x0, y0, x1, y1 in rects:
+            i0 = bisect.bisect_left(self.xs, x0)
+            i1 = bisect.bisect_left(self.xs, x1)
+            j0 = bisect.bisect_left(self.ys, y0)
+            j1 = bisect.bisect_left(self.ys, y1)
+            for i in range(i0, i1):
+                column = self.cells[i]
+                for j in range(j0, j1):
+                    column[j] = widget
+        self.dirty = False
+
+    def hit_test(self, x, y):
+        """Topmost visible tracked widget at (x, y), or None"""
+        if self.dirty:
+            self._rebuild()
+        i = bisect.bisect_right(self.xs, x) - 1
+        j = bisect.bisect_right(self.ys, y) - 1
+        if i < 0 or j < 0 or i >= len(self.cells) or j >= len(self.cells[i]):
+            return None
+        return self.cells[i][j]